@@ -2,23 +2,112 @@ from __future__ import annotations
 from poke_team import *
 from typing import Tuple
 from battle_mode import BattleMode
+from damage_matrix import DamageMatrix
 import random
+import hashlib
+
+
+def derive_seed(seed: int, battle_index: int) -> int:
+    '''
+    Derives the seed of battle number battle_index from a base seed. The derivation only
+    depends on its arguments, so a battle gets the same random stream whether it runs
+    serially, in a thread or in any worker of a process pool.
+
+    Time complexity:
+    best case: O(1)
+    worst case: O(1)
+
+    Returns:
+    a 64 bit seed.
+    '''
+    digest = hashlib.sha256(f"{seed}:{battle_index}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+class BattleResult:
+    """
+    Structured outcome of a single battle, returned by Battle.run().
+
+    Attributes:
+        winner (Trainer | None): the winning trainer, or None for a draw.
+        rounds (int): number of exchanges fought.
+        survivors (Tuple[int, int]): pokemon left in trainer 1's and trainer 2's team.
+        damage_dealt (Tuple[float, float]): health removed from the opposing team by
+            trainer 1's and trainer 2's pokemon during attacks.
+    """
+    def __init__(self, winner: Trainer | None, rounds: int, survivors: Tuple[int, int], damage_dealt: Tuple[float, float]) -> None:
+        self.winner = winner
+        self.rounds = rounds
+        self.survivors = survivors
+        self.damage_dealt = damage_dealt
+
+    def __str__(self) -> str:
+        winner = "draw" if self.winner is None else self.winner.get_name()
+        return f"Winner: {winner} after {self.rounds} rounds, survivors {self.survivors}, damage dealt {self.damage_dealt}"
+
+
+class BattleObserver:
+    """
+    Receives events from a running battle. Every hook is a no-op, so subclasses
+    only override the events they care about. A battle without an observer
+    produces no output at all.
+    """
+    def on_battle_start(self, battle: Battle) -> None:
+        """ Called once, before the first exchange. """
+        pass
+
+    def on_round(self, battle: Battle, pokemon1: Pokemon, pokemon2: Pokemon) -> None:
+        """ Called after every exchange, once fainted pokemon have been moved out of the teams. """
+        pass
+
+    def on_battle_end(self, battle: Battle, result: BattleResult) -> None:
+        """ Called once the winner is known. """
+        pass
+
+
+class PrintObserver(BattleObserver):
+    """ Observer printing the progress of a battle, handy when debugging a single battle. """
+    def on_battle_start(self, battle: Battle) -> None:
+        print(battle.trainer_1.get_team())
+        print(battle.trainer_2.get_team())
+
+    def on_round(self, battle: Battle, pokemon1: Pokemon, pokemon2: Pokemon) -> None:
+        print(f"Round {battle.rounds}: {pokemon1} vs {pokemon2}")
+
+    def on_battle_end(self, battle: Battle, result: BattleResult) -> None:
+        print(result)
 
 
 class Battle:
-    def __init__(self, trainer_1: Trainer, trainer_2: Trainer, battle_mode: BattleMode, criterion = "health") -> None:
+    def __init__(self, trainer_1: Trainer, trainer_2: Trainer, battle_mode: BattleMode, criterion = "health", observer: BattleObserver = None, seed: int = 20, rng: random.Random = None) -> None:
         '''
         Intialization of the battle class.
+        Each battle draws from its own random number generator, never from the global random module.
+
+        Arguments:
+        observer: optional BattleObserver notified of battle events. Without one the battle is silent.
+        seed: seed of the battle's random number generator, ignored when rng is given.
+        rng: random number generator used for random team selection.
         '''
         self.trainer_1 = trainer_1
         self.trainer_2 = trainer_2
         self.battle_mode = battle_mode
         self.criterion = criterion
-        random.seed(20)
+        self.observer = observer
+        self.rounds = 0
+        self.damage_dealt = [0, 0]
+        self.last_damage_dealt = (0, 0)
+        self.result = None
+        # damage multipliers from the pokedex completions, see _update_multipliers
+        self.multiplier_1 = None
+        self.multiplier_2 = None
+        self.multiplier_source = None   # the trainers and pokedex versions the multipliers were computed from
+        self.rng = rng if rng is not None else random.Random(seed)
 
     def commence_battle(self) -> Trainer | None:
         '''
         This function will be called to start the battle and will return the outcome of the battle.
+        The full outcome is kept in self.result.
 
 
         Time complexity:
@@ -30,37 +119,163 @@ class Battle:
         None
         
         '''
+        return self.run().winner
+
+    def run(self) -> BattleResult:
+        '''
+        Fights the battle in the selected battle mode and returns its structured outcome.
+
+        Time complexity:
+        best case: O(n*comp==)
+        worst case: O(n*comp==)
+
+        Returns:
+        BattleResult with the winner, number of rounds, survivors and damage totals.
+        '''
+        self.rounds = 0
+        self.damage_dealt = [0, 0]
+        self.multiplier_1 = self.multiplier_2 = self.multiplier_source = None
+        if self.observer is not None:
+            self.observer.on_battle_start(self)
+
         if self.battle_mode == BattleMode.SET:
-            result = self.set_battle()          
-            if result == self.trainer_1.team.team:
-                return self.trainer_1
-            elif result == self.trainer_2.team.team:
-                return self.trainer_2
-            else:
-                return None
+            result = self.set_battle()
         elif self.battle_mode == BattleMode.ROTATE:
             result = self.rotate_battle()
-            if result == self.trainer_1.team.team:
-                return self.trainer_1
-            elif result == self.trainer_2.team.team:
-                return self.trainer_2
-            else:
-                return None
         elif self.battle_mode == BattleMode.OPTIMISE:
             result = self.optimise_battle()
-            if result == self.trainer_1.team.team:
-                return self.trainer_1
-            elif result == self.trainer_2.team.team:
-                return self.trainer_2
-            else:
-                return None
+        else:
+            result = None
+
+        if result == self.trainer_1.team.team:
+            winner = self.trainer_1
+        elif result == self.trainer_2.team.team:
+            winner = self.trainer_2
+        else:
+            winner = None
+
+        self.result = BattleResult(winner, self.rounds,
+                                   (len(self.trainer_1.team.team), len(self.trainer_2.team.team)),
+                                   (self.damage_dealt[0], self.damage_dealt[1]))
+        if self.observer is not None:
+            self.observer.on_battle_end(self, self.result)
+        return self.result
+
+    def _end_round(self, pokemon1: Pokemon, pokemon2: Pokemon) -> None:
+        '''
+        Counts a finished exchange and notifies the observer, if any.
+
+        Time complexity:
+        best case: O(1)
+        worst case: O(1)
+        '''
+        self.rounds += 1
+        if self.observer is not None:
+            self.observer.on_round(self, pokemon1, pokemon2)
+
+    def _fast_forward_duel(self, pokemon1: Pokemon, pokemon2: Pokemon, health1: float, health2: float) -> None:
+        '''
+        Resolves a stalled duel in a single step. Called after an exchange in which both pokemon
+        survived the attacks and the 1 health penalty, when the same two pokemon are about to face
+        each other again. Nothing that the exchange depends on (stats, types, pokedex completion)
+        changes while neither pokemon faints, so every following exchange costs each pokemon the
+        same health as this one. The function applies all the following exchanges that both
+        pokemon are guaranteed to survive and leaves the deciding exchange to the battle loop,
+        so the outcome is the same as fighting the rounds one by one.
+
+        Arguments:
+        pokemon1: pokemon from trainer 1 team battling.
+        pokemon2: pokemon from trainer 2 team battling.
+        health1: health of pokemon1 before the exchange.
+        health2: health of pokemon2 before the exchange.
+
+        Time complexity:
+        best case: O(1)
+        worst case: O(1)
+
+        Returns:
+        the number of exchanges skipped.
+        '''
+        loss1 = health1 - pokemon1.get_health()
+        loss2 = health2 - pokemon2.get_health()
+        # exchange k is survived by both as long as health - k * loss stays positive
+        rounds = min(ceil(pokemon1.get_health() / loss1), ceil(pokemon2.get_health() / loss2)) - 1
+        while rounds > 0 and (pokemon1.get_health() - rounds * loss1 <= 0 or pokemon2.get_health() - rounds * loss2 <= 0):
+            rounds -= 1
+        if rounds <= 0:
+            return 0
+        # healths are multiples of small powers of two, so the products below are exact
+        pokemon1.health = pokemon1.get_health() - rounds * loss1
+        pokemon2.health = pokemon2.get_health() - rounds * loss2
+        self.rounds += rounds
+        self.damage_dealt[0] += rounds * self.last_damage_dealt[0]
+        self.damage_dealt[1] += rounds * self.last_damage_dealt[1]
+        return rounds
+
+    def _skip_rotations(self, queue: CircularQueue, pokemon: Pokemon, rounds: int) -> None:
+        '''
+        Leaves an empty team queue as if pokemon had been appended and served again rounds times,
+        including the array slots the pokemon would have been written to on the way.
+
+        Time complexity:
+        best case: O(1)
+        worst case: O(min(rounds, capacity))
+        '''
+        capacity = len(queue.array)
+        written = min(rounds, capacity)
+        # the last written slots run from first up to the new rear, wrapping at most once
+        first = (queue.rear + rounds - written) % capacity
+        run = min(written, capacity - first)
+        queue.array.fill(pokemon, first, first + run)
+        queue.array.fill(pokemon, 0, written - run)
+        queue.rear = (queue.rear + rounds) % capacity
+        queue.front = queue.rear
+
+    def _register_pokemon(self, pokemon1: Pokemon, pokemon2: Pokemon) -> None:
+        '''
+        Registers each fighting pokemon in the opposing trainer's pokedex.
+        perform_battle notices a changed pokedex and updates the damage multipliers.
+
+        Time complexity:
+        best case: O(1)
+        worst case: O(1)
+        '''
+        self.trainer_1.register_pokemon(pokemon2)
+        self.trainer_2.register_pokemon(pokemon1)
+
+    def _pokedex_state(self) -> tuple:
+        '''
+        Returns the trainers with their pokedex versions. The multipliers are stale whenever this
+        differs from multiplier_source: a pokedex gained a type, or the battle got other trainers.
+
+        Time complexity:
+        best case: O(1)
+        worst case: O(1)
+        '''
+        return (self.trainer_1, self.trainer_1.pokedex_version, self.trainer_2, self.trainer_2.pokedex_version)
+
+    def _update_multipliers(self) -> None:
+        '''
+        Computes the damage multipliers of both trainers from their pokedex completions, and records
+        which trainers and pokedex versions they were computed from.
+        Trainer 1's attacks are scaled by multiplier_1, trainer 2's by multiplier_2.
+
+        Time complexity:
+        best case: O(1)
+        worst case: O(1)
+        '''
+        self.multiplier_source = self._pokedex_state()
+        completion_1 = self.trainer_1.get_pokedex_completion()
+        completion_2 = self.trainer_2.get_pokedex_completion()
+        self.multiplier_1 = completion_1/completion_2
+        self.multiplier_2 = completion_2/completion_1
 
     def perform_battle(self, pokemon1: Pokemon, pokemon2: Pokemon) -> None:
         '''
         This function contains the battle logic for the three different battle modes. 
 
         Time complexity:
-        best case: O(comp==)
+        best case: O(1)
         worst case: O(1)
 
         Arguments:
@@ -70,61 +285,84 @@ class Battle:
         Returns:
         None
         '''
+        if self._pokedex_state() != self.multiplier_source:
+            self._update_multipliers()
+        health1 = pokemon1.get_health()
+        health2 = pokemon2.get_health()
+        # attack damage of both pokemon, read from the precomputed damage matrix when it describes both
+        form1 = DamageMatrix.form_of(pokemon1)
+        form2 = DamageMatrix.form_of(pokemon2)
+        if form1 >= 0 and form2 >= 0:
+            attack_on_p2 = DamageMatrix.TABLE[form1 * DamageMatrix.FORM_COUNT + form2]
+            attack_on_p1 = DamageMatrix.TABLE[form2 * DamageMatrix.FORM_COUNT + form1]
+        else:
+            attack_on_p2 = pokemon1.attack(pokemon2)
+            attack_on_p1 = pokemon2.attack(pokemon1)
     # If P1 speed is greater than P2
         if pokemon1.get_speed() > pokemon2.get_speed():
-            damage = ceil(pokemon1.attack(pokemon2) * (self.trainer_1.get_pokedex_completion()/self.trainer_2.get_pokedex_completion()))
+            damage = ceil(attack_on_p2 * self.multiplier_1)
             pokemon2.defend(damage)
             if pokemon2.is_alive():
-                counter_damage_to_p1 = ceil(pokemon2.attack(pokemon1) * (self.trainer_2.get_pokedex_completion()/self.trainer_1.get_pokedex_completion()))  # If still alive, P2 attacks P1
+                counter_damage_to_p1 = ceil(attack_on_p1 * self.multiplier_2)  # If still alive, P2 attacks P1
                 pokemon1.defend(counter_damage_to_p1)
         # If P2 speed is greater than P1
         elif pokemon1.get_speed() < pokemon2.get_speed():
-            damage = ceil(pokemon2.attack(pokemon1) * (self.trainer_2.get_pokedex_completion()/self.trainer_1.get_pokedex_completion()))
+            damage = ceil(attack_on_p1 * self.multiplier_2)
             pokemon1.defend(damage)
             if pokemon1.is_alive():
-                counter_damage_to_p2 = ceil(pokemon1.attack(pokemon2) * (self.trainer_1.get_pokedex_completion()/self.trainer_2.get_pokedex_completion()))  # If still alive, P1 attacks P2
+                counter_damage_to_p2 = ceil(attack_on_p2 * self.multiplier_1)  # If still alive, P1 attacks P2
                 pokemon2.defend(counter_damage_to_p2)
         elif pokemon1.get_speed() == pokemon2.get_speed():
             # Perform simultaneous attacks if speed is the same
-            damage_to_p2 = ceil(pokemon1.attack(pokemon2) * (self.trainer_1.get_pokedex_completion()/self.trainer_2.get_pokedex_completion()))
-            damage_to_p1 = ceil(pokemon2.attack(pokemon1) * (self.trainer_2.get_pokedex_completion()/self.trainer_1.get_pokedex_completion()))
+            damage_to_p2 = ceil(attack_on_p2 * self.multiplier_1)
+            damage_to_p1 = ceil(attack_on_p1 * self.multiplier_2)
             pokemon1.defend(damage_to_p1)
             pokemon2.defend(damage_to_p2)
-            
+        self.last_damage_dealt = (health2 - pokemon2.get_health(), health1 - pokemon1.get_health())
+        self.damage_dealt[0] += self.last_damage_dealt[0]
+        self.damage_dealt[1] += self.last_damage_dealt[1]
 
 
-    def _create_teams(self) -> None:
+    def create_team(self, trainer: Trainer, spec: tuple[str, ...] | None = None) -> None:
         '''
-        This function will create a random or manual team based on the battle condition.
+        Picks a trainer's team and assembles it for the battle mode, in optimise mode ordered by the
+        battle's criterion. Every team of a battle is created here, so simulated battles match real ones.
+
+        Arguments:
+        trainer: the trainer whose team is picked.
+        spec: tuple of pokemon class names, or None for a random team drawn from the battle's generator.
 
         Time complexity:
         best case:  O(comp== * n)
-        worst case: O(comp== * n^2 log n)
+        worst case: O(comp== * n + n log n) when optimised mode is run
         n = pokemon in team
 
         Returns:
         None
         '''
+        if spec is None:
+            trainer.pick_team("Random", rng=self.rng)
+        else:
+            trainer.pick_team("Spec", spec)
+        trainer.team.assemble_team(self.battle_mode)
+        if self.battle_mode == BattleMode.OPTIMISE:
+            trainer.team.assign_team(self.criterion)
 
-        if self.battle_mode == BattleMode.SET:
-            self.trainer_1.pick_team("Random")
-            self.trainer_2.pick_team("Random")
-            self.trainer_1.team.assemble_team(BattleMode.SET)   # O(comp== * n)
-            self.trainer_2.team.assemble_team(BattleMode.SET)
+    def _create_teams(self) -> None:
+        '''
+        This function will create a random or manual team based on the battle condition.
 
-        elif self.battle_mode == BattleMode.ROTATE:
-            self.trainer_1.pick_team("Random")
-            self.trainer_2.pick_team("Random")
-            self.trainer_1.team.assemble_team(BattleMode.ROTATE)
-            self.trainer_2.team.assemble_team(BattleMode.ROTATE)
+        Time complexity:
+        best case:  O(comp== * n)
+        worst case: O(comp== * n + n log n) when optimised mode is run, see create_team
+        n = pokemon in team
 
-        elif self.battle_mode == BattleMode.OPTIMISE:
-            self.trainer_1.pick_team("Random")
-            self.trainer_2.pick_team("Random")
-            self.trainer_1.team.assemble_team(BattleMode.OPTIMISE) #O(comp== * n^2 log n)
-            self.trainer_2.team.assemble_team(BattleMode.OPTIMISE)
-            self.trainer_1.team.assemble_team(self.criterion)   
-            self.trainer_2.team.assemble_team(self.criterion)
+        Returns:
+        None
+        '''
+
+        self.create_team(self.trainer_1)
+        self.create_team(self.trainer_2)
 
 
         '''
@@ -244,60 +482,36 @@ class Battle:
         '''
         
 
-        print(self.trainer_1.get_team())
-        print(self.trainer_2.get_team())
-        self.dead_pokemon_1 = ArrayStack(6)  #Empty stack for dead pokemon
-        self.dead_pokemon_2 = ArrayStack(6)  #Empty Stack for dead pokemon
+        self.dead_pokemon_1 = GrowableArrayStack(PokeTeam.TEAM_LIMIT)  #Empty stack for dead pokemon, grows with larger teams
+        self.dead_pokemon_2 = GrowableArrayStack(PokeTeam.TEAM_LIMIT)  #Empty Stack for dead pokemon, grows with larger teams
 
         while True:
             pokemon1 = self.trainer_1.team.team.pop() #Pokemon fighting in trainer_1's team
-            print(pokemon1)
             pokemon2 = self.trainer_2.team.team.pop() #Pokemon fighting in trainer 2's team
 
-            print(pokemon2)
-            print(self.trainer_1.pokedox)
-            
-
-            self.trainer_1.register_pokemon(pokemon2)
-            print(self.trainer_1.pokedox)
-            self.trainer_2.register_pokemon(pokemon1)
+            self._register_pokemon(pokemon1, pokemon2)
 
             #Battle logic
+            health1 = pokemon1.get_health()
+            health2 = pokemon2.get_health()
             self.perform_battle(pokemon1,pokemon2)
-            print(pokemon1)
-            print(pokemon2)
-
-            
 
             #If the attacker (pokemon 1) is still alive and the defender (pokemon 2) is dead, then attacker (pokemon 1) lvls up and remains battling.
             if pokemon1.is_alive() and not pokemon2.is_alive():
-                #print("pokemon1 alive, pokemon2 dead")
                 pokemon1.level_up()
                 self.dead_pokemon_2.push(pokemon2)     #pokemon 2 added to dead stack
-                print(self.dead_pokemon_2)
                 self.trainer_1.team.team.push(pokemon1)
 
-                
-
             #If the attacker (pokemon 2) is still alive and the defender (pokemon 1) is dead, then attacker (pokemon 2) lvls up and remains battling.
             elif pokemon2.is_alive() and not pokemon1.is_alive():
-                print("pokemon1 dead, pokemon2 alive")
                 pokemon2.level_up()
                 self.dead_pokemon_1.push(pokemon1)     #Pokemon 1 added to dead stack
-                print(self.dead_pokemon_1)
                 self.trainer_2.team.team.push(pokemon2)
 
             elif not(pokemon1.is_alive() and pokemon2.is_alive()):
                 #Both pokemon have fainted added to dead stack.
                 self.dead_pokemon_1.push(pokemon1)
                 self.dead_pokemon_2.push(pokemon2)
-                if self.trainer_1.team.team.is_empty() and self.trainer_2.team.team.is_empty():
-                    break
-                else:
-                    continue
-
-                
-
 
             #If both pokemon1 and pokemon2 are alive after the battle phase, then both take 1 damage.
             elif pokemon1.is_alive() and pokemon2.is_alive():
@@ -306,15 +520,17 @@ class Battle:
 
                 #Covers the cases after they both take 1 damage.
                 if pokemon1.is_alive() and pokemon2.is_alive():     #Continue fighting
+                    #The same two pokemon are popped again, so skip ahead to the deciding exchange.
+                    self._fast_forward_duel(pokemon1, pokemon2, health1, health2)
                     self.trainer_1.team.team.push(pokemon1)
                     self.trainer_2.team.team.push(pokemon2)
+                    self._end_round(pokemon1, pokemon2)
                     continue
 
                 elif pokemon1.is_alive() and not pokemon2.is_alive():
                     pokemon1.level_up()
                     self.dead_pokemon_2.push(pokemon2)     #pokemon 2 added to dead stack
                     self.trainer_1.team.team.push(pokemon1)
-                    
 
                 elif pokemon2.is_alive() and not pokemon1.is_alive():
                     pokemon2.level_up()
@@ -325,28 +541,18 @@ class Battle:
                     #Both pokemon have fainted added to dead stack.
                     self.dead_pokemon_1.push(pokemon1)
                     self.dead_pokemon_2.push(pokemon2)
-                    if self.trainer_1.team.team.is_empty() and self.trainer_2.team.team.is_empty():
-                        break
-                    else:
-                        continue
-
 
-            print(self.trainer_1.get_team())
-            print(self.trainer_2.get_team())
+            #The battle is over as soon as either team has no pokemon left.
+            self._end_round(pokemon1, pokemon2)
             if self.trainer_1.team.team.is_empty():
-                print(f"team 1 is empty if true: {self.trainer_1.team.team.is_empty()}")
                 break
             elif self.trainer_2.team.team.is_empty():
-                print(f"team 2 is empty if true: {self.trainer_2.team.team.is_empty()}")
                 break
 
-        print("out of loop")
             # Determine the winner
         if self.trainer_1.team.team.is_empty():
-            print("winner team 2")
             return self.trainer_2.team.team
         elif self.trainer_2.team.team.is_empty():
-            print("winner team 1")
             return self.trainer_1.team.team
         else:
             return None
@@ -369,26 +575,20 @@ class Battle:
         None if ends in draw.
         """
 
-        print("team 1 before battle")
-        self.trainer_1.get_team().team.print_items()
-        print("team 2 before battle")
-        self.trainer_2.get_team().team.print_items()
-
-        self.dead_pokemon_1 = CircularQueue(6) #Empty queue to store dead pokemon from team 1 to add back later
-        self.dead_pokemon_2 = CircularQueue(6) #Empty queue to store dead pokemon from team 2 to add back later
+        self.dead_pokemon_1 = GrowableCircularQueue(PokeTeam.TEAM_LIMIT) #Empty queue to store dead pokemon from team 1 to add back later
+        self.dead_pokemon_2 = GrowableCircularQueue(PokeTeam.TEAM_LIMIT) #Empty queue to store dead pokemon from team 2 to add back later
 
         while not self.trainer_1.team.team.is_empty() and not self.trainer_2.team.team.is_empty():
             # serve the first Pokémon of each team for the battle
             pokemon1 = self.trainer_1.team.team.serve()
-            print("\n")
-            self.trainer_1.get_team().team.print_items()
             pokemon2 = self.trainer_2.team.team.serve()
 
             # Register the Pokémons
-            self.trainer_1.register_pokemon(pokemon2)
-            self.trainer_2.register_pokemon(pokemon1)
+            self._register_pokemon(pokemon1, pokemon2)
 
             # Battle Logic
+            health1 = pokemon1.get_health()
+            health2 = pokemon2.get_health()
             self.perform_battle(pokemon1, pokemon2)
 
             # Check for fainting
@@ -396,13 +596,10 @@ class Battle:
             if pokemon1.is_alive() and not pokemon2.is_alive():
                 pokemon1.level_up()
                 self.trainer_1.team.team.append(pokemon1)
-                print("\n")
-                self.trainer_1.get_team().team.print_items()
                 self.dead_pokemon_2.append(pokemon2)
             # If the attacker (pokemon 2) is still alive and the defender (pokemon 1) is dead
             elif pokemon2.is_alive() and not pokemon1.is_alive():
                 pokemon2.level_up()
-                print("\n")
                 self.trainer_2.team.team.append(pokemon2)
                 self.dead_pokemon_1.append(pokemon1)
             # If both pokemon1 and pokemon2 are alive after the battle phase, then both take 1 damage.
@@ -411,14 +608,15 @@ class Battle:
                 pokemon2.health -= 1
                 # Add pokemons back to respective teams or dead queues accordingly
                 if pokemon1.is_alive() and pokemon2.is_alive():
+                    # When both are the last of their team they are served again, so skip ahead to the deciding exchange.
+                    if self.trainer_1.team.team.is_empty() and self.trainer_2.team.team.is_empty():
+                        skipped = self._fast_forward_duel(pokemon1, pokemon2, health1, health2)
+                        self._skip_rotations(self.trainer_1.team.team, pokemon1, skipped)
+                        self._skip_rotations(self.trainer_2.team.team, pokemon2, skipped)
                     self.trainer_1.team.team.append(pokemon1)
-                    print("\n")
-                    self.trainer_1.get_team().team.print_items()
                     self.trainer_2.team.team.append(pokemon2)
                 elif pokemon1.is_alive() and not pokemon2.is_alive():
                     self.trainer_1.team.team.append(pokemon1)
-                    print("\n")
-                    self.trainer_1.get_team().team.print_items()
                     self.dead_pokemon_2.append(pokemon2)
                 elif pokemon2.is_alive() and not pokemon1.is_alive():
                     self.trainer_2.team.team.append(pokemon2)
@@ -426,11 +624,7 @@ class Battle:
                 else:
                     self.dead_pokemon_1.append(pokemon1)
                     self.dead_pokemon_2.append(pokemon2)
-
-        print("team 1 after battle")
-        self.trainer_1.get_team().team.print_items()
-        print("team 2 after battle")
-        self.trainer_2.get_team().team.print_items()
+            self._end_round(pokemon1, pokemon2)
 
         # Determine the winner after the battle loop
         if self.trainer_1.team.team.is_empty():
@@ -458,47 +652,21 @@ class Battle:
         None if ends in draw.
         """
 
-        #print("team 1 before battle")
-        #self.trainer_1.get_team().team.print_items()
-        #print("\n")
-        #print("team 2 before battle")
-        #self.trainer_2.get_team().team.print_items()
-
         self.dead_pokemon_1 = ArraySortedList(6) #Empty list to store dead pokemon from team 1 to add back later for regeneration
         self.dead_pokemon_2 = ArraySortedList(6) #Empty list to store dead pokemon from team 2 to add back later for regeneration
 
         while not self.trainer_1.team.team.is_empty() and not self.trainer_2.team.team.is_empty():
-            #before we delete at index
-
-            
-
-
-            pokemon1 = self.trainer_1.team.team.delete_at_index(0)   #removes the first element of the team
-            pokemon2 = self.trainer_2.team.team.delete_at_index(0)   #removes the first element of the team
-
-            #after we delete at index. problem occurs here.
-            
-
-            pokemon1_ListItem = pokemon1
-            pokemon2_ListItem = pokemon2
+            pokemon1_ListItem = self.trainer_1.team.team.delete_at_index(0)   #removes the first element of the team
+            pokemon2_ListItem = self.trainer_2.team.team.delete_at_index(0)   #removes the first element of the team
             pokemon1 = pokemon1_ListItem.value
             pokemon2 = pokemon2_ListItem.value
-            
-            
 
-            self.trainer_1.register_pokemon(pokemon2)
-            self.trainer_2.register_pokemon(pokemon1)
+            self._register_pokemon(pokemon1, pokemon2)
             #Battle Logic
+            health1 = pokemon1.get_health()
+            health2 = pokemon2.get_health()
             self.perform_battle(pokemon1, pokemon2)
 
-            #Check for Fainting
-            #If the attacker (pokemon 1) is still alive and the defender (pokemon 2) is dead, then attacker (pokemon 1) lvls up and returns to back of queue.
-            if pokemon1.is_alive() and not pokemon2.is_alive():
-                pokemon1.level_up()
-                self.trainer_1.team.team.add(pokemon1_ListItem)
-                self.dead_pokemon_2.add(pokemon2_ListItem)     #pokemon 2 added to dead queue
-            #If the attacker (pokemon 2) is still alive and the defender (pokemon 1) is dead, then attacker (pokemon 2) lvls up and returns to back of queue.
-
             #Check for Fainting
 
             #If the attacker (pokemon 1) is still alive and the defender (pokemon 2) is dead, then attacker (pokemon 1) lvls up and returns to back of queue.
@@ -518,6 +686,9 @@ class Battle:
 
                 #Covers the cases after they both take 1 damage.
                 if pokemon1.is_alive() and pokemon2.is_alive():
+                    # Keys do not change, so if both go straight back to the front they meet again: skip ahead to the deciding exchange.
+                    if self.trainer_1.team.team._index_to_add(pokemon1_ListItem) == 0 and self.trainer_2.team.team._index_to_add(pokemon2_ListItem) == 0:
+                        self._fast_forward_duel(pokemon1, pokemon2, health1, health2)
                     self.trainer_1.team.team.add(pokemon1_ListItem)  #adds the pokemon back in to sorted team
                     self.trainer_2.team.team.add(pokemon2_ListItem)  #adds the pokemon back in to sorted team
                 elif pokemon1.is_alive() and not pokemon2.is_alive():
@@ -529,29 +700,21 @@ class Battle:
                 else:
                     self.dead_pokemon_1.add(pokemon1_ListItem)  # adds the pokemon back into dead list
                     self.dead_pokemon_2.add(pokemon2_ListItem)   # adds the pokemon back into dead list
-
-        print("team 1 after battle")
-        print(self.trainer_1.get_team().__str__)
-        print("team 2 after battle")
-        print(self.trainer_2.get_team().__str__)
-
-
+            self._end_round(pokemon1, pokemon2)
 
             # Determine the winner
         if self.trainer_1.team.team.is_empty():
             return self.trainer_2.team.team # returns the winning team, team 2
         elif self.trainer_2.team.team.is_empty():
-            return self.trainer_1   # returns the winning team, team 1
+            return self.trainer_1.team.team   # returns the winning team, team 1
         else:
             return None # returns None if draw.
 
 
-
-
 if __name__ == '__main__':
     t1 = Trainer('Ash')
     t2 = Trainer('Gary')
-    b = Battle(t1, t2, BattleMode.OPTIMISE)
+    b = Battle(t1, t2, BattleMode.OPTIMISE, observer=PrintObserver())
     b._create_teams()
     winner = b.commence_battle()
 
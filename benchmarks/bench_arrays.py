@@ -0,0 +1,54 @@
+"""
+ArrayR allocation benchmark, for sizes from a team (6) up to 1M references.
+
+The first two columns allocate empty arrays: the previous constructor, which
+built a new ctypes type and a list comprehension of None on every call, against
+ArrayR(n). The last three fill an array with n integers: an empty ArrayR set
+one position at a time, against ArrayR.from_iterable and ArrayR.filled. Storing
+anything but None in a ctypes array costs far more than storing None, so these
+are slower.
+
+Run from the repository root:
+    python -m benchmarks.bench_arrays
+"""
+import time
+from ctypes import py_object
+from data_structures.referential_array import ArrayR
+
+SIZES = (6, 100, 10000, 1000000)
+TOTAL = 2000000  # references allocated per size and method, spread over n // TOTAL repeats
+
+
+def previous(n: int) -> None:
+    """ The previous ArrayR constructor. """
+    array = (n * py_object)()
+    array[:] = [None for _ in range(n)]
+
+
+def item_by_item(items: list) -> ArrayR:
+    """ Fills an empty array one position at a time, as from_items and SpeciesRegistry.freeze did. """
+    array = ArrayR(len(items))
+    for i in range(len(items)):
+        array[i] = items[i]
+    return array
+
+
+def per_call(allocate, n: int) -> float:
+    """ Returns the seconds per call of allocate(n). """
+    repeats = max(3, TOTAL // n)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        allocate(n)
+    return (time.perf_counter() - start) / repeats
+
+
+if __name__ == '__main__':
+    items = {n: list(range(n)) for n in SIZES}
+    methods = (("previous", previous),
+               ("ArrayR(n)", ArrayR),
+               ("item by item", lambda n: item_by_item(items[n])),
+               ("from_iterable", lambda n: ArrayR.from_iterable(items[n])),
+               ("filled", lambda n: ArrayR.filled(n, 0)))
+    print(f"{'n':>8}" + "".join(f"{name + ' (us)':>20}" for name, _ in methods))
+    for n in SIZES:
+        print(f"{n:>8}" + "".join(f"{per_call(allocate, n) * 1e6:>20.2f}" for _, allocate in methods))
@@ -0,0 +1,109 @@
+"""
+Priority queue benchmark: ArrayHeap against ArraySortedList.
+
+OPTIMISE workload: a queue of n pokemon keyed by a stat, where each round takes the
+first one out and puts it back with a new key, as a battle round does, and where a
+random member's key changes (the sorted list finds, deletes and adds the item, the
+heap updates it through its handle).
+
+Leaderboard workload: a stream of scores of which only the best k are kept. The sorted
+list adds every score and deletes its lowest once it holds more than k, the heap has a
+limit of k.
+
+Run from the repository root:
+    python -m benchmarks.bench_heap
+"""
+import random
+import time
+from data_structures.array_heap import ArrayHeap
+from data_structures.array_sorted_list import ArraySortedList
+from data_structures.sorted_list_adt import ListItem
+
+SIZES = (100, 1000, 10000, 100000)
+ROUNDS = 2000
+LARGE = 10000  # above this size the sorted list runs ROUNDS // 20 rounds, each one is O(n)
+STREAM = 20000
+TOP_K = (10, 100, 1000)
+
+
+def rounds(queue, take, put, rng: random.Random, count: int = ROUNDS) -> float:
+    """ Returns the seconds per round of take followed by put with a new key. """
+    start = time.perf_counter()
+    for _ in range(count):
+        item = take(queue)
+        item.key = rng.random()
+        put(queue, item)
+    return (time.perf_counter() - start) / count
+
+
+def rekey_list(sorted_list: ArraySortedList, items: list, rng: random.Random, count: int = ROUNDS) -> float:
+    """ Returns the seconds per key change of a random item of a sorted list. """
+    start = time.perf_counter()
+    for _ in range(count):
+        item = items[rng.randrange(len(items))]
+        sorted_list.delete_at_index(sorted_list.index(item))
+        item.key = rng.random()
+        sorted_list.add(item)
+    return (time.perf_counter() - start) / count
+
+
+def rekey_heap(heap: ArrayHeap, handles: list, rng: random.Random) -> float:
+    """ Returns the seconds per key change of a random item of a heap. """
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        heap.update(handles[rng.randrange(len(handles))], rng.random())
+    return (time.perf_counter() - start) / ROUNDS
+
+
+def leaderboard_list(scores: list, k: int) -> float:
+    """ Returns the seconds taken to keep the best k scores in a sorted list. """
+    start = time.perf_counter()
+    board = ArraySortedList(k + 1)
+    for score in scores:
+        board.add(ListItem(score, score))
+        if len(board) > k:
+            board.delete_at_index(0)
+    return time.perf_counter() - start
+
+
+def leaderboard_heap(scores: list, k: int) -> float:
+    """ Returns the seconds taken to keep the best k scores in a heap with a limit. """
+    start = time.perf_counter()
+    board = ArrayHeap(k, limit=k)
+    for score in scores:
+        board.push(ListItem(score, score))
+    return time.perf_counter() - start
+
+
+def optimise_workload(rng: random.Random) -> None:
+    """ Prints the OPTIMISE workload table. """
+    print(f"{'n':>8} {'list round (us)':>16} {'heap round (us)':>16} {'list rekey (us)':>16} {'heap rekey (us)':>16}")
+    for n in SIZES:
+        values = [rng.random() for _ in range(n)]
+        sorted_list = ArraySortedList.from_items(values, key=lambda value: value)
+        heap, _ = ArrayHeap.from_items(values, key=lambda value: value)
+        list_count = ROUNDS if n <= LARGE else ROUNDS // 20
+        list_round = rounds(sorted_list, lambda queue: queue.delete_at_index(0), ArraySortedList.add, rng, list_count)
+        heap_round = rounds(heap, ArrayHeap.pop, ArrayHeap.push, rng)
+
+        list_items = [sorted_list[i] for i in range(len(sorted_list))]
+        list_rekey = rekey_list(sorted_list, list_items, rng, list_count)
+        heap, handles = ArrayHeap.from_items(values, key=lambda value: value)
+        heap_rekey = rekey_heap(heap, handles, rng)
+        print(f"{n:>8} {list_round * 1e6:>16.1f} {heap_round * 1e6:>16.1f} {list_rekey * 1e6:>16.1f} {heap_rekey * 1e6:>16.1f}")
+
+
+def leaderboard_workload(rng: random.Random) -> None:
+    """ Prints the leaderboard workload table. """
+    scores = [rng.random() for _ in range(STREAM)]
+    print(f"{STREAM} scores")
+    print(f"{'k':>8} {'list (s)':>10} {'heap (s)':>10}")
+    for k in TOP_K:
+        print(f"{k:>8} {leaderboard_list(scores, k):>10.4f} {leaderboard_heap(scores, k):>10.4f}")
+
+
+if __name__ == '__main__':
+    rng = random.Random(25)
+    optimise_workload(rng)
+    print()
+    leaderboard_workload(rng)
@@ -0,0 +1,54 @@
+"""
+Matchup grid benchmark: every form against every form.
+
+Compares building the grid with one Battle.perform_battle call per pair of pokemon objects
+against one evaluate_matchups call. Requires NumPy.
+
+Run from the repository root:
+    python -m benchmarks.bench_matchups
+"""
+import time
+from battle import Battle
+from battle_mode import BattleMode
+from matchups import evaluate_matchups, roster_forms
+from poke_team import Trainer
+from pokemon import SPECIES_BY_ID, Charmander
+
+
+def create(species_id: int, level: int):
+    """ Returns a pokemon of the species levelled up to level. """
+    pokemon = SPECIES_BY_ID[species_id]()
+    for _ in range(level - 1):
+        pokemon.level_up()
+    return pokemon
+
+
+def per_object(species_ids, levels) -> float:
+    """ Returns the seconds taken to fight one exchange per pair with pokemon objects. """
+    trainer_1, trainer_2 = Trainer("Gary"), Trainer("Ash")
+    trainer_1.register_pokemon(Charmander())
+    trainer_2.register_pokemon(Charmander())
+    battle = Battle(trainer_1, trainer_2, BattleMode.SET)
+    start = time.perf_counter()
+    for i in range(len(species_ids)):
+        for j in range(len(species_ids)):
+            battle.perform_battle(create(int(species_ids[i]), int(levels[i])), create(int(species_ids[j]), int(levels[j])))
+    return time.perf_counter() - start
+
+
+def vectorized(species_ids, levels) -> float:
+    """ Returns the seconds taken by one evaluate_matchups call over every pair. """
+    start = time.perf_counter()
+    evaluate_matchups(species_ids, levels, species_ids, levels)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    species_ids, levels = roster_forms()
+    pairs = len(species_ids) ** 2
+    slow = per_object(species_ids, levels)
+    fast = min(vectorized(species_ids, levels) for _ in range(5))
+    print(f"{len(species_ids)} forms, {pairs} pairs")
+    print(f"per object:         {slow * 1000:9.1f} ms")
+    print(f"evaluate_matchups:  {fast * 1000:9.1f} ms")
+    print(f"speedup: {slow / fast:.0f}x")
@@ -0,0 +1,50 @@
+"""
+Memory benchmark: bytes per live Pokemon instance.
+
+Compares the slotted Pokemon classes against a replica of the previous layout, where every
+instance carried a __dict__ and its own copy of the evolution line list.
+
+Run from the repository root:
+    python -m benchmarks.bench_pokemon_memory
+"""
+import tracemalloc
+from pokemon_base import PokeType
+from pokemon import Bulbasaur
+
+INSTANCES = 100000
+
+
+class DictBulbasaur:
+    """ Bulbasaur with the previous instance layout: a __dict__ and a fresh evolution line list. """
+    def __init__(self):
+        self.health = 45
+        self.level = 1
+        self.poketype = PokeType.GRASS
+        self.battle_power = 14
+        self.evolution_line = ["Bulbasaur", "Ivysaur", "Venusaur"]
+        self.name = "Bulbasaur"
+        self.experience = 0
+        self.defence = 20
+        self.speed = 4.5
+
+
+def bytes_per_instance(factory) -> float:
+    """ Returns the memory allocated per instance while INSTANCES instances are alive. """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [factory() for _ in range(INSTANCES)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # the list holding the instances costs one pointer per instance
+    per_instance = (after - before) / INSTANCES - 8
+    del instances
+    return per_instance
+
+
+if __name__ == '__main__':
+    before = bytes_per_instance(DictBulbasaur)
+    after = bytes_per_instance(Bulbasaur)
+    print(f"{INSTANCES} instances")
+    print(f"before (__dict__ + evolution line list): {before:8.1f} bytes per instance")
+    print(f"after  (__slots__, shared evolution line): {after:8.1f} bytes per instance")
+    print(f"saving: {100 * (before - after) / before:.0f}%")
@@ -0,0 +1,69 @@
+"""
+Set benchmark: the hash-based ArraySet against the previous linear-scan ArraySet.
+
+For each size n the set is filled with n integers, then queried with hits and misses.
+Filling the linear-scan set one add at a time is O(n^2), so at 1M items its array is
+filled directly and only the lookups are timed.
+
+Run from the repository root:
+    python -m benchmarks.bench_sets
+"""
+import time
+from data_structures.referential_array import ArrayR
+from poke_team import ArraySet
+
+SIZES = (10, 1000, 1000000)
+LOOKUPS = 200
+
+
+class LinearArraySet:
+    """ The previous ArraySet: an unsorted array scanned on every lookup. """
+    def __init__(self, capacity: int) -> None:
+        self.array = ArrayR(capacity)
+        self.size = 0
+
+    def __contains__(self, item) -> bool:
+        for i in range(self.size):
+            if item == self.array[i]:
+                return True
+        return False
+
+    def add(self, item) -> None:
+        if item not in self:
+            self.array[self.size] = item
+            self.size += 1
+
+
+def fill(items, n: int, direct: bool = False) -> float:
+    """ Returns the seconds taken to add 0 .. n - 1 to items. """
+    start = time.perf_counter()
+    if direct:
+        for i in range(n):
+            items.array[i] = i
+        items.size = n
+    else:
+        for i in range(n):
+            items.add(i)
+    return time.perf_counter() - start
+
+
+def lookups(items, n: int) -> float:
+    """ Returns the seconds per lookup, half of them hits and half misses. """
+    queries = [n * i // LOOKUPS for i in range(LOOKUPS // 2)] + [n + i for i in range(LOOKUPS // 2)]
+    start = time.perf_counter()
+    for query in queries:
+        query in items
+    return (time.perf_counter() - start) / len(queries)
+
+
+if __name__ == '__main__':
+    print(f"{'n':>8} {'set':>8} {'fill (s)':>10} {'lookup (us)':>12}")
+    for n in SIZES:
+        hashed = ArraySet()
+        linear = LinearArraySet(n)
+        direct = n > 10000
+        results = (("hash", fill(hashed, n), lookups(hashed, n)),
+                   ("linear", fill(linear, n, direct), lookups(linear, n)))
+        for name, fill_time, lookup_time in results:
+            fill_str = "-" if name == "linear" and direct else f"{fill_time:.4f}"
+            print(f"{n:>8} {name:>8} {fill_str:>10} {lookup_time * 1e6:>12.2f}")
@@ -0,0 +1,64 @@
+"""
+Sorted list benchmark: building an ArraySortedList one add at a time against from_items,
+merging two lists, and optimise battle rounds: removing the first item and adding it back
+with a new key.
+
+Adding n items shuffles O(n^2) elements in total, so the add column stops at 1k items.
+
+Run from the repository root:
+    python -m benchmarks.bench_sorted_list
+"""
+import random
+import time
+from data_structures.array_sorted_list import ArraySortedList
+from data_structures.sorted_list_adt import ListItem
+
+SIZES = (100, 1000, 10000, 100000)
+ADD_LIMIT = 1000
+ROUNDS = 1000
+
+
+def by_add(items) -> float:
+    """ Returns the seconds taken to add every item to an empty list. """
+    start = time.perf_counter()
+    sorted_list = ArraySortedList(len(items))
+    for item in items:
+        sorted_list.add(item)
+    return time.perf_counter() - start
+
+
+def by_from_items(items) -> float:
+    """ Returns the seconds taken by from_items. """
+    start = time.perf_counter()
+    ArraySortedList.from_items(items)
+    return time.perf_counter() - start
+
+
+def by_merge(items) -> float:
+    """ Returns the seconds taken to merge two sorted halves of items. """
+    half = len(items) // 2
+    first = ArraySortedList.from_items(items[:half])
+    second = ArraySortedList.from_items(items[half:])
+    start = time.perf_counter()
+    first.merge(second)
+    return time.perf_counter() - start
+
+
+def by_rounds(items, rng: random.Random) -> float:
+    """ Returns the seconds per round of delete_at_index(0) followed by add. """
+    sorted_list = ArraySortedList.from_items(items)
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        item = sorted_list.delete_at_index(0)
+        item.key = rng.random()
+        sorted_list.add(item)
+    return (time.perf_counter() - start) / ROUNDS
+
+
+if __name__ == '__main__':
+    rng = random.Random(20)
+    print(f"{'n':>8} {'add (s)':>10} {'from_items (s)':>15} {'merge (s)':>10} {'round (us)':>11}")
+    for n in SIZES:
+        items = [ListItem(i, rng.random()) for i in range(n)]
+        add_str = f"{by_add(items):.4f}" if n <= ADD_LIMIT else "-"
+        print(f"{n:>8} {add_str:>10} {by_from_items(items):>15.4f} {by_merge(items):>10.4f} {by_rounds(items, rng) * 1e6:>11.1f}")
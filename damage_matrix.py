@@ -0,0 +1,90 @@
+"""
+This module contains DamageMatrix, a precomputed table of the damage every pokemon form deals to every other form.
+
+A form is a species at one stage of its evolution line, example Charmander, Charmeleon and Charizard
+are the three forms of the Charmander class. Attack damage only depends on the attacker's battle power
+and type and on the defender's defence and type, and those only change when a pokemon evolves, so one
+flat table indexed by (attacker form, defender form) replaces the formula in Pokemon.attack.
+The table only describes the registered species as they are created and evolved. A pokemon of
+another class, or whose stats were changed, has no form and its damage comes from Pokemon.attack.
+"""
+from array import array
+from pokemon_base import Pokemon
+from species_table import SPECIES_TABLE
+
+
+class DamageMatrix:
+    """
+    Flat, row-major table of Pokemon.attack results for every pair of forms.
+    The table is built on first use and shared by every battle.
+    FORMS maps (species class, name) to the form index, FORM_STATS holds the stats attack() reads,
+    (battle power, defence, poketype), for every form.
+    """
+    TABLE = None
+    FORM_COUNT = 0
+    FORMS = None
+    FORM_STATS = None
+
+    @classmethod
+    def build(cls) -> None:
+        """
+        Builds the table by running Pokemon.attack once per pair of forms, so table entries are
+        exactly the values attack() would return.
+
+        Time complexity:
+        best case: O(f^2) f = number of forms
+        worst case: O(f^2)
+        """
+        forms = []
+        for species_id in range(len(SPECIES_TABLE)):
+            for stage in range(SPECIES_TABLE.stage[species_id], SPECIES_TABLE.stages[species_id]):
+                form = SPECIES_TABLE.species[species_id]()
+                for _ in range(stage - SPECIES_TABLE.stage[species_id]):
+                    form._evolve()
+                forms.append(form)
+
+        form_count = len(forms)
+        table = array('d', bytes(8 * form_count * form_count))
+        for attacker in range(form_count):
+            row = attacker * form_count
+            for defender in range(form_count):
+                table[row + defender] = forms[attacker].attack(forms[defender])
+
+        cls.FORM_COUNT = form_count
+        cls.FORMS = {(type(form), form.name): i for i, form in enumerate(forms)}
+        cls.FORM_STATS = [(form.battle_power, form.defence, form.poketype) for form in forms]
+        cls.TABLE = table
+
+    @classmethod
+    def form_of(cls, pokemon: Pokemon) -> int:
+        """
+        Returns the form index of a pokemon: its species and current evolution stage.
+        Returns -1 if the table does not describe the pokemon: its class is not a registered
+        species, example a subclass defined later, or its name or attack stats are not the form's.
+
+        Time complexity:
+        best case: O(1)
+        worst case: O(1)
+        """
+        if cls.TABLE is None:
+            cls.build()
+        form = cls.FORMS.get((type(pokemon), pokemon.name), -1)
+        if form >= 0 and (pokemon.battle_power, pokemon.defence, pokemon.poketype) != cls.FORM_STATS[form]:
+            return -1
+        return form
+
+    @classmethod
+    def damage(cls, attacker: Pokemon, defender: Pokemon) -> float:
+        """
+        Returns the damage attacker inflicts on defender, the same value as attacker.attack(defender),
+        read from the table when it describes both pokemon.
+
+        Time complexity:
+        best case: O(1)
+        worst case: O(1)
+        """
+        attacker_form = cls.form_of(attacker)
+        defender_form = cls.form_of(defender)
+        if attacker_form < 0 or defender_form < 0:
+            return attacker.attack(defender)
+        return cls.TABLE[attacker_form * cls.FORM_COUNT + defender_form]
@@ -0,0 +1,325 @@
+""" Array heap: a binary heap priority queue of ListItems ordered by key.
+The root, at position 0, is the item with the smallest key, or the largest when
+descending. The children of position i are at 2i + 1 and 2i + 2, so push and pop
+move an item along one branch in O(log n). Each pushed item gets a HeapHandle that
+follows it through the array, so its key can later be changed in O(log n).
+With a limit the heap keeps only the limit items that would be popped last, the
+top-k of a leaderboard. Also defines UnitTests for the class.
+"""
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+import unittest
+from typing import Callable, Generic, Iterable
+from data_structures.referential_array import ArrayR
+from data_structures.sorted_list_adt import ListItem, T, K
+
+
+class HeapHandle(Generic[T, K]):
+    """ Position of a pushed item in its heap, used to change its key.
+
+    Attributes:
+         item (ListItem): the pushed item
+         index (int): the position of the item in the heap's array, -1 once it has left the heap
+    """
+    __slots__ = ('item', 'index')
+
+    def __init__(self, item: ListItem, index: int) -> None:
+        self.item = item
+        self.index = index
+
+    def in_heap(self) -> bool:
+        """ True while the item is in the heap. """
+        return self.index >= 0
+
+
+class ArrayHeap(Generic[T]):
+    """ Binary heap of ListItems stored in positions 0 to length - 1 of an array of handles.
+
+    Attributes:
+         length (int): number of items in the heap
+         array (ArrayR[HeapHandle]): the heap, doubled when full
+         descending (bool): True for a max-heap, pop returns the item with the largest key
+         limit (int): maximum number of items, None for no limit
+    """
+    MIN_CAPACITY = 1
+
+    def __init__(self, max_capacity: int = MIN_CAPACITY, descending: bool = False, limit: int = None) -> None:
+        """ Creates an empty heap with room for max_capacity items before the first resize.
+        :complexity: O(max_capacity)
+        :raises ValueError: if limit is not positive
+        """
+        if limit is not None and limit <= 0:
+            raise ValueError('The limit should be positive')
+        self.length = 0
+        self.descending = descending
+        self.limit = limit
+        if limit is not None:
+            max_capacity = min(max_capacity, limit)
+        self.array = ArrayR(max(self.MIN_CAPACITY, max_capacity))
+
+    @classmethod
+    def from_items(cls, items: Iterable, key: Callable = None, descending: bool = False,
+                   limit: int = None) -> tuple[ArrayHeap, list[HeapHandle]]:
+        """
+        Builds a heap from many items at once, sifting down every parent from the last one up.
+        With a limit, the items that would be popped first are then popped until limit items
+        remain, so the heap keeps the limit items that would be popped last, as push does.
+
+        Args:
+            items: the ListItems to store, or the values to store if key is given.
+            key: function computing the key of a value, the values are wrapped in ListItems.
+            descending: True for a max-heap.
+            limit: maximum number of items, None for no limit.
+
+        Returns:
+            The heap and the handles of the items, in the order they were given. The handles
+            of the items dropped by the limit are not in the heap.
+
+        Time complexity:
+        Best case: O(n)
+        Worst case: O(n), O(n log(n)) when the limit drops items
+
+        Raises:
+            ValueError: if limit is not positive.
+        """
+        if key is not None:
+            items = [ListItem(value, key(value)) for value in items]
+        handles = [HeapHandle(item, i) for i, item in enumerate(items)]
+        res = cls(cls.MIN_CAPACITY, descending, limit)
+        if len(handles) > 0:
+            res.array = ArrayR.from_iterable(handles)
+        res.length = len(handles)
+        for i in range(res.length // 2 - 1, -1, -1):
+            res._sift_down(i)
+        if limit is not None and res.length > limit:
+            while res.length > limit:
+                res.pop()
+            kept = ArrayR(limit)
+            kept.copy_from(res.array, 0, 0, limit)
+            res.array = kept
+        return res, handles
+
+    def __len__(self) -> int:
+        """ Returns the number of items in the heap. """
+        return self.length
+
+    def is_empty(self) -> bool:
+        """ True if the heap is empty. """
+        return self.length == 0
+
+    def is_full(self) -> bool:
+        """ True if the heap holds limit items. A heap without a limit is never full. """
+        return self.limit is not None and self.length == self.limit
+
+    def _before(self, first: HeapHandle, second: HeapHandle) -> bool:
+        """ True if first should be popped strictly before second. """
+        if self.descending:
+            return first.item.key > second.item.key
+        return first.item.key < second.item.key
+
+    def _place(self, handle: HeapHandle, index: int) -> None:
+        """ Stores a handle at a position of the array and records the position in it. """
+        self.array[index] = handle
+        handle.index = index
+
+    def _sift_up(self, index: int) -> None:
+        """
+        Moves the item at index towards the root until its parent comes before it.
+
+        Time complexity:
+        Best case: O(1) when the item is already in place
+        Worst case: O(log(n))
+        """
+        handle = self.array[index]
+        while index > 0:
+            parent = (index - 1) // 2
+            if not self._before(handle, self.array[parent]):
+                break
+            self._place(self.array[parent], index)
+            index = parent
+        self._place(handle, index)
+
+    def _sift_down(self, index: int) -> None:
+        """
+        Moves the item at index towards the leaves until it comes before both children.
+
+        Time complexity:
+        Best case: O(1) when the item is already in place
+        Worst case: O(log(n))
+        """
+        handle = self.array[index]
+        while 2 * index + 1 < self.length:
+            child = 2 * index + 1
+            if child + 1 < self.length and self._before(self.array[child + 1], self.array[child]):
+                child += 1
+            if not self._before(self.array[child], handle):
+                break
+            self._place(self.array[child], index)
+            index = child
+        self._place(handle, index)
+
+    def _resize(self) -> None:
+        """ Doubles the array, or grows it up to the limit. """
+        capacity = 2 * len(self.array)
+        if self.limit is not None:
+            capacity = min(capacity, self.limit)
+        new_array = ArrayR(capacity)
+        new_array.copy_from(self.array, 0, 0, self.length)
+        self.array = new_array
+
+    def push(self, item: ListItem) -> HeapHandle:
+        """
+        Adds an item to the heap and returns its handle.
+        If the heap is full, the item replaces the root only if the root would be popped before it,
+        otherwise it is dropped and its handle is not in the heap.
+
+        Time complexity:
+        Best case: O(1) when the item stays a leaf, or is dropped by a full heap
+        Worst case: O(log(n)), O(n) when the array has to grow
+        """
+        handle = HeapHandle(item, -1)
+        if self.is_full():
+            if self._before(self.array[0], handle):
+                self.array[0].index = -1
+                self._place(handle, 0)
+                self._sift_down(0)
+            return handle
+        if self.length == len(self.array):
+            self._resize()
+        self._place(handle, self.length)
+        self.length += 1
+        self._sift_up(self.length - 1)
+        return handle
+
+    def peek(self) -> ListItem:
+        """
+        Returns the item at the root without removing it.
+        :raises IndexError: if the heap is empty
+        """
+        if self.is_empty():
+            raise IndexError('Heap is empty')
+        return self.array[0].item
+
+    def pop(self) -> ListItem:
+        """
+        Removes and returns the item at the root.
+
+        Time complexity:
+        Best case: O(1) when the heap holds one item
+        Worst case: O(log(n))
+
+        Raises:
+            IndexError: if the heap is empty.
+        """
+        if self.is_empty():
+            raise IndexError('Heap is empty')
+        root = self.array[0]
+        self.length -= 1
+        if self.length > 0:
+            self._place(self.array[self.length], 0)
+            self._sift_down(0)
+        self.array[self.length] = None
+        root.index = -1
+        return root.item
+
+    def update(self, handle: HeapHandle, key) -> None:
+        """
+        Changes the key of an item in the heap and moves it to its new place.
+
+        Time complexity:
+        Best case: O(1) when the item stays in place
+        Worst case: O(log(n))
+
+        Raises:
+            ValueError: if the item is not in the heap.
+        """
+        if not handle.in_heap() or handle.index >= self.length or self.array[handle.index] is not handle:
+            raise ValueError('Item is not in the heap')
+        handle.item.key = key
+        self._sift_up(handle.index)
+        self._sift_down(handle.index)
+
+    def clear(self) -> None:
+        """ Removes every item, their handles are no longer in the heap. """
+        for i in range(self.length):
+            self.array[i].index = -1
+            self.array[i] = None
+        self.length = 0
+
+    def __str__(self) -> str:
+        """ Returns the items in array order, the root first. """
+        return "[" + ", ".join(str(self.array[i].item.value) for i in range(self.length)) + "]"
+
+
+class TestArrayHeap(unittest.TestCase):
+    """ Tests for the above class."""
+
+    def drain(self, heap):
+        return [heap.pop().key for _ in range(len(heap))]
+
+    def test_push_and_pop(self):
+        heap = ArrayHeap()
+        for key in [5, 3, 9, 1, 3, 7, 0]:
+            heap.push(ListItem(key, key))
+        self.assertEqual(heap.peek().key, 0)
+        self.assertEqual(self.drain(heap), [0, 1, 3, 3, 5, 7, 9])
+        self.assertRaises(IndexError, heap.pop)
+        largest, _ = ArrayHeap.from_items([5, 3, 9, 1, 7], key=lambda value: value, descending=True)
+        self.assertEqual(self.drain(largest), [9, 7, 5, 3, 1])
+
+    def test_from_items(self):
+        values = [(i * 37) % 101 for i in range(101)]
+        heap, handles = ArrayHeap.from_items(values, key=lambda value: value)
+        self.assertEqual([handle.item.value for handle in handles], values, "handles should follow the items' order")
+        heap.update(handles[0], 200)
+        heap.update(handles[1], -1)
+        self.assertEqual(heap.pop().value, values[1])
+        self.assertEqual(self.drain(heap)[-1], 200)
+        self.assertTrue(ArrayHeap.from_items([])[0].is_empty())
+
+    def test_from_items_limit(self):
+        scores = [(i * 37) % 101 for i in range(101)]
+        for descending in (False, True):
+            leaderboard, handles = ArrayHeap.from_items(scores, key=lambda score: score, descending=descending, limit=10)
+            self.assertTrue(leaderboard.is_full())
+            self.assertLessEqual(len(leaderboard.array), 10)
+            kept = sorted(scores, reverse=descending)[-10:]
+            self.assertEqual(sorted(handle.item.key for handle in handles if handle.in_heap()), sorted(kept))
+            leaderboard.push(ListItem(-1, 1000 if not descending else -1000))
+            self.assertEqual(len(leaderboard), 10, "the limit should still hold after the build")
+            self.assertEqual(self.drain(leaderboard)[:-1], kept[1:])
+        small, handles = ArrayHeap.from_items([3, 1, 2], key=lambda score: score, limit=5)
+        self.assertEqual(len(small), 3)
+        self.assertTrue(all(handle.in_heap() for handle in handles))
+        self.assertRaises(ValueError, ArrayHeap.from_items, [1], None, False, 0)
+
+    def test_update(self):
+        heap = ArrayHeap()
+        handles = [heap.push(ListItem(name, key)) for name, key in [("a", 4), ("b", 2), ("c", 6), ("d", 8)]]
+        heap.update(handles[3], 1)
+        self.assertEqual(heap.peek().value, "d")
+        heap.update(handles[3], 10)
+        heap.update(handles[1], 5)
+        self.assertEqual([heap.pop().value for _ in range(4)], ["a", "b", "c", "d"])
+        self.assertFalse(handles[0].in_heap())
+        self.assertRaises(ValueError, heap.update, handles[0], 0)
+
+    def test_limit(self):
+        leaderboard = ArrayHeap(limit=3)
+        dropped = None
+        for score in [40, 10, 70, 20, 90, 60]:
+            handle = leaderboard.push(ListItem(score, score))
+            if score == 20:
+                dropped = handle
+        self.assertTrue(leaderboard.is_full())
+        self.assertFalse(dropped.in_heap(), "a score below the top 3 should be dropped")
+        self.assertEqual(self.drain(leaderboard), [60, 70, 90])
+        self.assertRaises(ValueError, ArrayHeap, 1, False, 0)
+
+
+if __name__ == '__main__':
+    testtorun = TestArrayHeap()
+    suite = unittest.TestLoader().loadTestsFromModule(testtorun)
+    unittest.TextTestRunner().run(suite)
@@ -0,0 +1,184 @@
+""" Array-based implementation of the List ADT that grows and shrinks as needed.
+The array doubles when an item is added to a full list and halves when the list
+drops to a quarter of it, so append and removing the last item are O(1) amortised.
+Also defines UnitTests for the class.
+"""
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+import unittest
+from data_structures.referential_array import ArrayR
+from data_structures.abstract_list import List, T
+
+
+class ArrayList(List[T]):
+    """ Growable list of items stored in positions 0 to length - 1 of an array.
+
+    Attributes:
+         length (int): number of items in the list (inherited)
+         array (ArrayR[T]): array storing the items, its length is the capacity
+         initial_capacity (int): the array never shrinks below this capacity
+    """
+    MIN_CAPACITY = 1
+
+    def __init__(self, max_capacity: int = MIN_CAPACITY) -> None:
+        """ Creates an empty list with room for max_capacity items before the first resize.
+        :complexity: O(max_capacity)
+        """
+        List.__init__(self)
+        self.initial_capacity = max(self.MIN_CAPACITY, max_capacity)
+        self.array = ArrayR(self.initial_capacity)
+
+    def _check_index(self, index: int) -> int:
+        """ Returns index, counted from the end if negative.
+        :raises IndexError: if there is no item at index
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('No such index in the list')
+        return index
+
+    def __getitem__(self, index: int) -> T:
+        """ Returns the item at a given position, negative positions count from the end.
+        :complexity: O(1)
+        :raises IndexError: if there is no item at index
+        """
+        return self.array[self._check_index(index)]
+
+    def __setitem__(self, index: int, item: T) -> None:
+        """ Replaces the item at a given position, negative positions count from the end.
+        :complexity: O(1)
+        :raises IndexError: if there is no item at index
+        """
+        self.array[self._check_index(index)] = item
+
+    def _resize(self, capacity: int) -> None:
+        """ Moves the items to an array of the given capacity.
+        :complexity: O(capacity)
+        :pre: capacity >= length
+        """
+        new_array = ArrayR(capacity)
+        new_array.copy_from(self.array, 0, 0, self.length)
+        self.array = new_array
+
+    def insert(self, index: int, item: T) -> None:
+        """ Inserts an item before a given position, moving the later items one position right.
+        :complexity: O(1) amortised at the end of the list, O(n - index) otherwise
+        :raises IndexError: if index is not between 0 and length
+        """
+        if not 0 <= index <= len(self):
+            raise IndexError('No such index in the list')
+        if len(self) == len(self.array):
+            self._resize(2 * len(self.array))
+        self.array.shift(index, self.length, 1)
+        self.array[index] = item
+        self.length += 1
+
+    def append(self, item: T) -> None:
+        """ Adds an item to the end of the list.
+        :complexity: O(1) amortised
+        """
+        if len(self) == len(self.array):
+            self._resize(2 * len(self.array))
+        self.array[self.length] = item
+        self.length += 1
+
+    def delete_at_index(self, index: int) -> T:
+        """ Removes and returns the item at a given position, moving the later items one position left.
+        :complexity: O(1) amortised at the end of the list, O(n - index) otherwise
+        :raises IndexError: if there is no item at index
+        """
+        index = self._check_index(index)
+        item = self.array[index]
+        self.array.shift(index + 1, self.length, -1)
+        self.length -= 1
+        self.array[self.length] = None
+        if self.length <= len(self.array) // 4 and len(self.array) // 2 >= self.initial_capacity:
+            self._resize(len(self.array) // 2)
+        return item
+
+    def pop(self) -> T:
+        """ Removes and returns the last item.
+        :complexity: O(1) amortised
+        :raises IndexError: if the list is empty
+        """
+        return self.delete_at_index(len(self) - 1)
+
+    def index(self, item: T) -> int:
+        """ Returns the position of the first occurrence of item.
+        :complexity: O(n)
+        :raises ValueError: if item is not in the list
+        """
+        for i in range(len(self)):
+            if self.array[i] == item:
+                return i
+        raise ValueError('item not in list')
+
+    def __contains__(self, item: T) -> bool:
+        """ True if item is in the list.
+        :complexity: O(n)
+        """
+        try:
+            self.index(item)
+        except ValueError:
+            return False
+        return True
+
+    def clear(self) -> None:
+        """ Makes the list empty, back at its initial capacity.
+        :complexity: O(initial capacity)
+        """
+        List.clear(self)
+        self.array = ArrayR(self.initial_capacity)
+
+
+class TestArrayList(unittest.TestCase):
+    """ Tests for the above class."""
+
+    def setUp(self):
+        self.items = ArrayList()
+        for i in range(10):
+            self.items.append(i)
+
+    def test_append_grows(self):
+        self.assertEqual(len(self.items), 10)
+        self.assertEqual(len(self.items.array), 16)
+        self.assertEqual([self.items[i] for i in range(10)], list(range(10)))
+        self.assertEqual(self.items[-1], 9)
+        self.assertRaises(IndexError, self.items.__getitem__, 10)
+
+    def test_insert_and_delete(self):
+        self.items.insert(0, -1)
+        self.items.insert(5, "x")
+        self.items.insert(len(self.items), 10)
+        self.assertEqual(str(self.items), "[-1, 0, 1, 2, 3, 'x', 4, 5, 6, 7, 8, 9, 10]")
+        self.assertEqual(self.items.delete_at_index(5), "x")
+        self.items.remove(-1)
+        self.assertEqual(self.items.index(4), 4)
+        self.assertNotIn(-1, self.items)
+        self.assertRaises(IndexError, self.items.insert, 20, 0)
+
+    def test_shrink(self):
+        for _ in range(8):
+            self.items.pop()
+        self.assertEqual(len(self.items.array), 4, "the array should halve at a quarter full")
+        self.assertEqual([self.items[i] for i in range(2)], [0, 1])
+        self.items.pop()
+        self.items.pop()
+        self.assertTrue(self.items.is_empty())
+        self.assertGreaterEqual(len(self.items.array), self.items.initial_capacity)
+        self.assertRaises(IndexError, self.items.pop)
+
+    def test_clear(self):
+        self.items.clear()
+        self.assertTrue(self.items.is_empty())
+        self.items.append("a")
+        self.assertEqual(self.items[0], "a")
+
+
+if __name__ == '__main__':
+    testtorun = TestArrayList()
+    suite = unittest.TestLoader().loadTestsFromModule(testtorun)
+    unittest.TextTestRunner().run(suite)
@@ -3,6 +3,10 @@
     Items to store should be of time ListItem.
 """
 
+from __future__ import annotations
+import random
+import unittest
+from typing import Callable, Iterable
 from data_structures.referential_array import ArrayR
 from data_structures.sorted_list_adt import *
 
@@ -10,7 +14,12 @@ __author__ = 'Maria Garcia de la Banda and Brendon Taylor. Modified by Alexey Ig
 __docformat__ = 'reStructuredText'
 
 class ArraySortedList(SortedList[T]):
-    """ SortedList ADT implemented with arrays. """
+    """ SortedList ADT implemented with arrays.
+
+    The array is used as a circular buffer: the items are stored in array slots
+    front, front + 1, ... wrapping around the end of the array. Inserting or deleting
+    an item shifts whichever side of it is shorter, so removing either end is O(1).
+    """
     MIN_CAPACITY = 1
 
     def __init__(self, max_capacity: int, descending=False) -> None:
@@ -23,7 +32,172 @@ class ArraySortedList(SortedList[T]):
         size = max(self.MIN_CAPACITY, max_capacity)
         self.array = ArrayR(size)
         self.descending = descending
+        self.front = 0
+        # when flipped, position i of the list is stored in slot length - 1 - i,
+        # so reversing the order only toggles this flag, see reverse()
+        self.flipped = False
     
+    @classmethod
+    def from_items(cls, items: Iterable, key: Callable = None, descending: bool = False,
+                   as_added: bool = False) -> ArraySortedList:
+        """
+        Builds a sorted list from many items at once: one sort instead of one add per item.
+        Items with equal keys keep the order they were given in, unless as_added is set.
+
+        Args:
+            items: the ListItems to store, or the values to store if key is given.
+            key: function computing the key of a value, the values are wrapped in ListItems.
+            descending: the order of the new list.
+            as_added: put items with equal keys exactly where adding the items one at a time
+                would, see _order_as_added. Teams are built this way so their order does not
+                depend on how they were built.
+
+        Time complexity:
+        Best case: O(n) when the items are already sorted
+        Worst case: O(n log(n))
+        """
+        if key is not None:
+            items = [ListItem(value, key(value)) for value in items]
+        if as_added:
+            items = cls._order_as_added(items, descending)
+        else:
+            items = sorted(items, key=lambda item: item.key, reverse=descending)
+        res = cls(cls.MIN_CAPACITY, descending)
+        if len(items) > 0:
+            # the sorted items become the array in one slice assignment
+            res.array = ArrayR.from_iterable(items)
+        res.length = len(items)
+        return res
+
+    @staticmethod
+    def _order_as_added(items: Iterable, descending: bool) -> list:
+        """
+        Returns the items in the order add would leave them in if they were added one at a time.
+        The binary search of _index_to_add stops where it first meets an equal key, not after the
+        ties, and only needs to know how many placed items come before the ties and how many ties
+        are placed. Both are counted, so the position of each add is found without a list, and
+        the positions are then resolved into the final order from the last add back.
+
+        Time complexity:
+        Best case: O(n log(n))
+        Worst case: O(n log(n))
+        """
+        items = list(items)
+        n = len(items)
+        # rank of each key in the list order, equal keys share a rank
+        by_key = sorted(range(n), key=lambda i: items[i].key, reverse=descending)
+        rank = [0] * n
+        for j in range(1, n):
+            previous, current = items[by_key[j - 1]].key, items[by_key[j]].key
+            rank[by_key[j]] = rank[by_key[j - 1]] + (previous < current or previous > current)
+
+        # placed counts the added items by rank, as a Fenwick tree: placed[1..r] sums the ranks below r
+        placed = [0] * (n + 1)
+        ties = [0] * n
+        positions = [0] * n
+        for i in range(n):
+            before = 0
+            j = rank[i]
+            while j > 0:
+                before += placed[j]
+                j -= j & -j
+            low = 0
+            high = i - 1
+            while low <= high:
+                mid = (low + high) // 2
+                if mid < before:
+                    low = mid + 1
+                elif mid >= before + ties[rank[i]]:
+                    high = mid - 1
+                else:
+                    low = mid
+                    break
+            positions[i] = low
+            ties[rank[i]] += 1
+            j = rank[i] + 1
+            while j <= n:
+                placed[j] += 1
+                j += j & -j
+
+        # an item added at position p ends up in the (p + 1)th slot left free by the items added after it
+        free = [0] * (n + 1)
+        for j in range(1, n + 1):
+            free[j] += 1
+            if j + (j & -j) <= n:
+                free[j + (j & -j)] += free[j]
+        top = 1 << (n.bit_length() - 1) if n > 0 else 0
+        res = [None] * n
+        for i in range(n - 1, -1, -1):
+            slot = 0
+            remaining = positions[i] + 1
+            step = top
+            while step > 0:
+                if slot + step <= n and free[slot + step] < remaining:
+                    slot += step
+                    remaining -= free[slot]
+                step >>= 1
+            res[slot] = items[i]
+            j = slot + 1
+            while j <= n:
+                free[j] -= 1
+                j += j & -j
+        return res
+
+    def merge(self, other: ArraySortedList) -> ArraySortedList:
+        """
+        Returns a new sorted list with the items of both lists, neither list is changed.
+        Between equal keys, the items of self come first.
+
+        Time complexity:
+        Best case: O(n + m)
+        Worst case: O(n + m)
+
+        Raises:
+            ValueError: if the lists are not sorted in the same order.
+        """
+        if self.descending != other.descending:
+            raise ValueError('Lists should be sorted in the same order')
+        res = ArraySortedList(len(self) + len(other), self.descending)
+        # lists stored from the start of their array in list order are read straight from it
+        left = self.array if self.front == 0 and not self.flipped else self
+        right = other.array if other.front == 0 and not other.flipped else other
+        out = res.array
+        left_length, right_length = len(self), len(other)
+        i = j = 0
+        while i < left_length and j < right_length:
+            # take from other only if its item strictly belongs before self's
+            if (not self.descending and right[j].key < left[i].key) or \
+                    (self.descending and right[j].key > left[i].key):
+                out[i + j] = right[j]
+                j += 1
+            else:
+                out[i + j] = left[i]
+                i += 1
+        while i < left_length:
+            out[i + j] = left[i]
+            i += 1
+        while j < right_length:
+            out[i + j] = right[j]
+            j += 1
+        res.length = i + j
+        return res
+
+    def copy(self) -> ArraySortedList:
+        """
+        Returns a copy of the list with new ListItems holding the same values and keys,
+        so changing the keys of one list's items leaves the other list sorted.
+
+        Time complexity:
+        Best case: O(n)
+        Worst case: O(n)
+        """
+        res = ArraySortedList(len(self.array), self.descending)
+        for i in range(len(self)):
+            item = self[i]
+            res.array[i] = ListItem(item.value, item.key)
+        res.length = len(self)
+        return res
+
     def remove(self, item: T) -> None:
         """ Remove an item from the list. """
         index = self.index(item)
@@ -32,10 +206,31 @@ class ArraySortedList(SortedList[T]):
     def reset(self):
         """ Reset the list. """
         SortedList.__init__(self)
+        self.front = 0
+        self.flipped = False
+
+    def _slot(self, index: int) -> int:
+        """ Array position of the item at a given position of the list. """
+        if self.flipped:
+            index = self.length - 1 - index
+        return (self.front + index) % len(self.array)
 
     def __getitem__(self, index: int) -> T:
         """ Magic method. Return the element at a given position. """
-        return self.array[index]
+        return self.array[self._slot(index)]
+
+    def reverse(self) -> None:
+        """
+        Reverses the order of the list, ascending to descending or descending to ascending.
+        The items stay where they are, only the orientation of the list changes, so items
+        with equal keys end up in the reverse of their previous order.
+
+        Time complexity:
+        Best case: O(1)
+        Worst case: O(1)
+        """
+        self.flipped = not self.flipped
+        self.descending = not self.descending
     
 
     #changed to add descenging
@@ -68,10 +263,8 @@ class ArraySortedList(SortedList[T]):
                 if self.is_full():
                     self._resize()
 
-                # Shift elements to the right to make room for the new item.
-                self._shuffle_right(index)
-                # Insert the new item at the specified index.
-                self.array[index] = item
+                # Shift elements to make room for the new item and insert it at the specified index.
+                self._insert_at(index, item)
             else:
                 # If the insertion would violate the sorted order, raise an error.
                 raise IndexError('Element should be inserted in sorted order')
@@ -88,10 +281,8 @@ class ArraySortedList(SortedList[T]):
                 if self.is_full():
                     self._resize()
 
-                # Shift elements to the right to make room for the new item.
-                self._shuffle_right(index)
-                # Insert the new item at the specified index.
-                self.array[index] = item
+                # Shift elements to make room for the new item and insert it at the specified index.
+                self._insert_at(index, item)
             else:
                 # If the insertion would violate the sorted order, raise an error.
                 raise IndexError('Element should be inserted in sorted order')
@@ -100,40 +291,116 @@ class ArraySortedList(SortedList[T]):
     def __contains__(self, item: ListItem):
         """ Checks if value is in the list. """
         for i in range(len(self)):
-            if self.array[i] == item:
+            if self[i] == item:
                 return True
         return False
 
-    def _shuffle_right(self, index: int) -> None:
-        """ Shuffle items to the right up to a given position. """
-        for i in range(len(self), index, -1):
-            self.array[i] = self.array[i - 1]
+    def resort(self) -> None:
+        """
+        Restores the sorted order in place after the keys of stored items were changed.
+        Items with equal keys end up where adding the items one at a time, in their
+        current order, would put them, see _order_as_added.
+
+        Time complexity:
+        Best case: O(n log(n))
+        Worst case: O(n log(n))
+        """
+        items = self._order_as_added([self[i] for i in range(len(self))], self.descending)
+        for i in range(len(items)):
+            self.array[self._slot(i)] = items[i]
 
-    def _shuffle_left(self, index: int) -> None:
-        """ Shuffle items starting at a given position to the left. """
-        for i in range(index, len(self)):
-            self.array[i] = self.array[i + 1]
+    def _insert_at(self, index: int, item: ListItem) -> None:
+        """
+        Stores item at a given position of the list, moving the items before or after it,
+        whichever are fewer, one slot over.
+        :pre: the list is not full
+
+        Time complexity:
+        Best case: O(1) at either end of the list
+        Worst case: O(min(index, n - index))
+        """
+        # work in slot order, which is the reverse of the list order while flipped
+        position = len(self) - index if self.flipped else index
+        if position < len(self) - position:
+            # move the slots before the new item one slot back
+            self.front = (self.front - 1) % len(self.array)
+            self._move_slots(1, position, -1)
+        else:
+            # move the slots after the new item one slot forward
+            self._move_slots(position, len(self) - position, 1)
+        self.array[(self.front + position) % len(self.array)] = item
+
+    def _delete_at(self, index: int) -> ListItem:
+        """
+        Removes and returns the item at a given position of the list, closing the gap from
+        the shorter side. Decreases the length.
+
+        Time complexity:
+        Best case: O(1) at either end of the list
+        Worst case: O(min(index, n - index))
+        """
+        capacity = len(self.array)
+        position = len(self) - 1 - index if self.flipped else index
+        item = self.array[(self.front + position) % capacity]
+        if position < len(self) - 1 - position:
+            # move the slots before the gap one slot forward
+            self._move_slots(0, position, 1)
+            self.array[self.front] = None
+            self.front = (self.front + 1) % capacity
+        else:
+            # move the slots after the gap one slot back
+            self._move_slots(position + 1, len(self) - 1 - position, -1)
+            self.array[(self.front + len(self) - 1) % capacity] = None
+        self.length -= 1
+        return item
+
+    def _move_slots(self, first: int, count: int, delta: int) -> None:
+        """
+        Moves the count slots starting first slots after front by delta slots.
+        The ring is cut into runs that wrap neither in the source nor in the destination,
+        and each run is moved with one ArrayR.shift, in the order that never overwrites
+        a slot before it has been moved.
+
+        Time complexity:
+        Best case: O(1) when count is 0
+        Worst case: O(count)
+        """
+        capacity = len(self.array)
+        done = 0
+        while done < count:
+            if delta > 0:
+                # from the last slot backwards: runs end where the source or destination wraps
+                src_end = (self.front + first + count - done - 1) % capacity + 1
+                dst_end = (self.front + first + count - done - 1 + delta) % capacity + 1
+                run = min(count - done, src_end, dst_end)
+                self.array.shift(src_end - run, src_end, dst_end - src_end)
+            else:
+                # from the first slot forwards: runs end where the source or destination wraps
+                src_start = (self.front + first + done) % capacity
+                dst_start = (self.front + first + done + delta) % capacity
+                run = min(count - done, capacity - src_start, capacity - dst_start)
+                self.array.shift(src_start, src_start + run, dst_start - src_start)
+            done += run
 
     def _resize(self) -> None:
         """ Resize the list. """
         # doubling the size of our list
         new_array = ArrayR(2 * len(self.array))
 
-        # copying the contents
-        for i in range(self.length):
-            new_array[i] = self.array[i]
+        # copying the contents, unwrapped so the first slot is at the start of the new array
+        first_run = min(self.length, len(self.array) - self.front)
+        new_array.copy_from(self.array, self.front, 0, first_run)
+        new_array.copy_from(self.array, 0, first_run, self.length - first_run)
 
         # referring to the new array
         self.array = new_array
+        self.front = 0
 
     def delete_at_index(self, index: int) -> ListItem:
         """ Delete item at a given position. """
         if index >= len(self):
             raise IndexError('No such index in the list')
-        item = self.array[index]
-        self.length -= 1
-        self._shuffle_left(index)
-        return item
+        return self._delete_at(index)
 
     def index(self, item: ListItem) -> int:
         """ Find the position of a given item in the list. """
@@ -204,3 +471,99 @@ class ArraySortedList(SortedList[T]):
 
         # If the loop exits without finding an exact match, 'low' will be the correct insertion index.
         return low
+
+
+class TestArraySortedList(unittest.TestCase):
+    """ Tests for the above class."""
+
+    def keys(self, sorted_list):
+        return [sorted_list[i].key for i in range(len(sorted_list))]
+
+    def test_from_items(self):
+        values = [5, 3, 9, 1, 3, 7]
+        ascending = ArraySortedList.from_items(values, key=lambda value: value)
+        self.assertEqual(self.keys(ascending), [1, 3, 3, 5, 7, 9])
+        descending = ArraySortedList.from_items([ListItem(v, v) for v in values], descending=True)
+        self.assertEqual(self.keys(descending), [9, 7, 5, 3, 3, 1])
+        # the bulk built list behaves like any other
+        descending.add(ListItem(4, 4))
+        self.assertEqual(self.keys(descending), [9, 7, 5, 4, 3, 3, 1])
+
+    def test_from_items_as_added(self):
+        rng = random.Random(17)
+        for _ in range(200):
+            size = rng.randint(0, 12) if rng.random() < 0.9 else rng.randint(100, 500)
+            items = [ListItem(i, rng.randint(0, 4)) for i in range(size)]
+            descending = rng.random() < 0.5
+            added = ArraySortedList(1, descending)
+            for item in items:
+                added.add(item)
+            built = ArraySortedList.from_items(items, descending=descending, as_added=True)
+            self.assertEqual([built[i] for i in range(len(built))], [added[i] for i in range(len(added))])
+
+    def test_resort(self):
+        rng = random.Random(10)
+        for _ in range(100):
+            sorted_list = ArraySortedList(1, rng.random() < 0.5)
+            for i in range(rng.randint(0, 12)):
+                sorted_list.add(ListItem(i, rng.randint(0, 4)))
+            if rng.random() < 0.5:
+                sorted_list.reverse()
+            items = [sorted_list[i] for i in range(len(sorted_list))]
+            for item in items:
+                item.key = rng.randint(0, 4)
+            added = ArraySortedList(1, sorted_list.descending)
+            for item in items:
+                added.add(item)
+            sorted_list.resort()
+            self.assertEqual([sorted_list[i] for i in range(len(sorted_list))], [added[i] for i in range(len(added))])
+
+    def test_merge(self):
+        evens = ArraySortedList.from_items(range(0, 10, 2), key=lambda value: value)
+        odds = ArraySortedList.from_items(range(1, 10, 2), key=lambda value: value)
+        merged = evens.merge(odds)
+        self.assertEqual(self.keys(merged), list(range(10)))
+        self.assertEqual(len(evens), 5, "merge should not change the lists")
+        ties = ArraySortedList.from_items(["a"], key=lambda value: 2).merge(ArraySortedList.from_items(["b"], key=lambda value: 2))
+        self.assertEqual([ties[i].value for i in range(2)], ["a", "b"])
+        self.assertRaises(ValueError, evens.merge, ArraySortedList(1, descending=True))
+
+    def test_reverse(self):
+        sorted_list = ArraySortedList.from_items([4, 1, 3], key=lambda value: value)
+        sorted_list.reverse()
+        self.assertTrue(sorted_list.descending)
+        self.assertEqual(self.keys(sorted_list), [4, 3, 1])
+        sorted_list.add(ListItem(2, 2))
+        sorted_list.add(ListItem(5, 5))
+        sorted_list.add(ListItem(0, 0))
+        self.assertEqual(self.keys(sorted_list), [5, 4, 3, 2, 1, 0])
+        self.assertEqual(sorted_list.delete_at_index(0).key, 5)
+        self.assertEqual(sorted_list.index(sorted_list[1]), 1)
+        merged = sorted_list.merge(ArraySortedList.from_items([6, 2], key=lambda value: value, descending=True))
+        self.assertEqual(self.keys(merged), [6, 4, 3, 2, 2, 1, 0])
+        sorted_list.reverse()
+        self.assertEqual(self.keys(sorted_list), [0, 1, 2, 3, 4])
+
+    def test_wrapped_moves(self):
+        sorted_list = ArraySortedList(8)
+        for key in (10, 20, 30, 40, 50, 60):
+            sorted_list.add(ListItem(key, key))
+        # deleting near the front moves the front, so later moves wrap around the array
+        sorted_list.delete_at_index(0)
+        sorted_list.delete_at_index(0)
+        for key in (55, 65, 70, 35):
+            sorted_list.add(ListItem(key, key))
+        self.assertEqual(self.keys(sorted_list), [30, 35, 40, 50, 55, 60, 65, 70])
+        self.assertEqual(sorted_list.delete_at_index(6).key, 65)
+        self.assertEqual(sorted_list.delete_at_index(1).key, 35)
+        self.assertEqual(self.keys(sorted_list), [30, 40, 50, 55, 60, 70])
+        sorted_list.add(ListItem(80, 80))
+        sorted_list.add(ListItem(90, 90))
+        sorted_list.add(ListItem(5, 5))
+        self.assertEqual(self.keys(sorted_list), [5, 30, 40, 50, 55, 60, 70, 80, 90])
+
+
+if __name__ == '__main__':
+    testtorun = TestArraySortedList()
+    suite = unittest.TestLoader().loadTestsFromModule(testtorun)
+    unittest.TextTestRunner().run(suite)
@@ -3,6 +3,9 @@
 """
 
 from __future__ import annotations
+import unittest
+from typing import Iterable, Iterator
+from data_structures.referential_array import ArrayR
 from data_structures.set_adt import Set
 
 class BSet(Set[int]):
@@ -35,15 +38,8 @@ class BSet(Set[int]):
         return (self.elems >> (item - 1)) & 1
 
     def __len__(self) -> int:
-        """
-        Size computation. The most expensive operation.
-        Use int.bit_length(your_integer) to calculate the bit length.
-        """
-        res = 0
-        for item in range(1, int.bit_length(self.elems) + 1):
-            if item in self:
-                res += 1
-        return res
+        """ Size computation, a popcount of the bit vector. """
+        return self.elems.bit_count()
 
     def add(self, item: int) -> None:
         """ Adds an element to the set.
@@ -69,7 +65,7 @@ class BSet(Set[int]):
         """ Creates a new set equal to the union with another one,
         i.e. the result set should contains the elements of self and other.
         """
-        res = BSet()
+        res = type(self)()
         res.elems = self.elems | other.elems
         return res
 
@@ -78,7 +74,7 @@ class BSet(Set[int]):
         i.e. the result set should contain the elements that are both in
         self *and* other.
         """
-        res = BSet()
+        res = type(self)()
         res.elems = self.elems & other.elems
         return res
 
@@ -87,28 +83,83 @@ class BSet(Set[int]):
         i.e. the result set should contain the elements of self that
         *are not* in other.
         """
-        res = BSet()
+        res = type(self)()
         res.elems = self.elems & ~other.elems
         return res
 
-    def __len__(self) -> int:
+    def __ior__(self, other: BSet[int]) -> BSet[int]:
+        """ In-place union, self |= other. """
+        self.elems |= other.elems
+        return self
+
+    def __iand__(self, other: BSet[int]) -> BSet[int]:
+        """ In-place intersection, self &= other. """
+        self.elems &= other.elems
+        return self
+
+    def __isub__(self, other: BSet[int]) -> BSet[int]:
+        """ In-place difference, self -= other. """
+        self.elems &= ~other.elems
+        return self
+
+    def __iter__(self) -> Iterator[int]:
+        """ Iterates over the elements in increasing order.
+        Each step isolates the lowest set bit, so it costs one step per element,
+        not one per bit.
         """
-        Size computation. The most expensive operation.
-        Use int.bit_length(your_integer) to calculate the bit length.
+        bits = self.elems
+        while bits:
+            lowest = bits & -bits
+            yield lowest.bit_length()
+            bits ^= lowest
+
+    @classmethod
+    def from_iterable(cls, items: Iterable) -> BSet:
+        """ Creates a set holding the given items. """
+        res = cls()
+        for item in items:
+            res.add(item)
+        return res
+
+    def to_array(self) -> ArrayR:
+        """ Returns the elements in increasing order in an ArrayR.
+        :pre: the set is not empty, an ArrayR can't be empty
         """
-        return bin(self.elems).count('1')
+        return ArrayR.from_iterable(self)
 
     def __str__(self):
         """ Construct a nice string representation. """
-        bit_elems = self.elems
-        out_elems = []
-        current = 0
-        while bit_elems:
-            if bit_elems & (1 << current):
-                out_elems.append(str(current+1))
-                bit_elems &= ~(1 << current)
-            current += 1
-        return '{' + ', '.join(out_elems) + '}'
+        return '{' + ', '.join(str(item) for item in self) + '}'
+
+class TestBSet(unittest.TestCase):
+    """ Tests for the above class."""
+
+    def setUp(self):
+        self.odds = BSet.from_iterable(range(1, 100, 2))
+        self.small = BSet.from_iterable(range(1, 11))
+
+    def test_len_and_iter(self):
+        self.assertEqual(len(self.odds), 50)
+        self.assertEqual(list(self.small), list(range(1, 11)))
+        self.assertEqual(list(BSet()), [])
+
+    def test_to_array(self):
+        array = self.small.to_array()
+        self.assertEqual([array[i] for i in range(len(array))], list(range(1, 11)))
+
+    def test_in_place_operators(self):
+        odds = self.odds
+        odds |= self.small
+        self.assertIs(odds, self.odds, "|= should not create a new set")
+        self.assertEqual(len(odds), 55)
+        odds &= self.small
+        self.assertEqual(list(odds), list(range(1, 11)))
+        odds -= BSet.from_iterable((2, 4))
+        self.assertEqual(list(odds), [1, 3, 5, 6, 7, 8, 9, 10])
+
+    def test_str(self):
+        self.assertEqual(str(BSet.from_iterable((4, 1))), '{1, 4}')
+
 
 if __name__ == '__main__':
     s = BSet(3)
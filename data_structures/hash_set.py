@@ -0,0 +1,238 @@
+""" Hash set: an open-addressing implementation of the Set ADT.
+Items are stored in an array of references at the position given by their hash,
+using linear probing to resolve collisions. Removed items leave a tombstone so
+later items of the same probe chain can still be found. The array doubles when
+more than two thirds of it is used, so add, remove and membership are O(1)
+amortised. Also defines UnitTests for the class.
+"""
+from __future__ import annotations
+
+__docformat__ = 'reStructuredText'
+
+import unittest
+from typing import Iterator
+from data_structures.referential_array import ArrayR
+from data_structures.set_adt import Set, T
+
+
+class HashSet(Set[T]):
+    """ Open-addressing hash set.
+
+    Attributes:
+         size (int): number of items in the set
+         used (int): number of slots holding an item or a tombstone
+         array (ArrayR[T]): the hash table, its length is a power of two
+
+    Items should be hashable and not None, None marks an empty slot.
+    """
+    MIN_CAPACITY = 8
+    DELETED = object()  # tombstone left by remove
+
+    def __init__(self, capacity: int = MIN_CAPACITY) -> None:
+        """ Creates an empty set with room for capacity items before the first resize.
+        :complexity: O(capacity)
+        """
+        self.capacity = max(self.MIN_CAPACITY, capacity)
+        Set.__init__(self)
+
+    @staticmethod
+    def _slots_for(capacity: int) -> int:
+        """ Returns the smallest power of two table holding capacity items at most two thirds full. """
+        slots = 1
+        while slots * 2 < capacity * 3:
+            slots *= 2
+        return slots
+
+    def clear(self) -> None:
+        """ Makes the set empty.
+        :complexity: O(capacity)
+        """
+        self.array = ArrayR(self._slots_for(self.capacity))
+        self.size = 0
+        self.used = 0
+
+    def __len__(self) -> int:
+        """ Returns the number of items in the set.
+        :complexity: O(1)
+        """
+        return self.size
+
+    def is_empty(self) -> bool:
+        """ True if the set is empty. """
+        return self.size == 0
+
+    def _find(self, item: T) -> int:
+        """ Returns the slot holding item, or -1 if item is not in the set.
+        :complexity: O(1) on average, O(n) worst case when every item collides
+        """
+        mask = len(self.array) - 1
+        index = hash(item) & mask
+        while True:
+            slot = self.array[index]
+            if slot is None:
+                return -1
+            if slot is not self.DELETED and (slot is item or slot == item):
+                return index
+            index = (index + 1) & mask
+
+    def __contains__(self, item: T) -> bool:
+        """ True if the set contains the item.
+        :complexity: O(1) on average
+        """
+        return self._find(item) >= 0
+
+    def add(self, item: T) -> None:
+        """ Adds an item to the set, nothing happens if it is already there.
+        :complexity: O(1) amortised
+        :raises TypeError: if the item is None or not hashable.
+        """
+        if item is None:
+            raise TypeError('None cannot be stored in a HashSet')
+        mask = len(self.array) - 1
+        index = hash(item) & mask
+        free = -1
+        while True:
+            slot = self.array[index]
+            if slot is None:
+                break
+            if slot is self.DELETED:
+                if free < 0:
+                    free = index
+            elif slot is item or slot == item:
+                return
+            index = (index + 1) & mask
+        if free >= 0:
+            # reuse the first tombstone of the probe chain
+            index = free
+        else:
+            self.used += 1
+        self.array[index] = item
+        self.size += 1
+        if self.used * 3 > len(self.array) * 2:
+            self._rehash(max(self.capacity, 2 * self.size))
+
+    def remove(self, item: T) -> None:
+        """ Removes an item from the set.
+        :complexity: O(1) on average
+        :raises KeyError: if the item is not in the set.
+        """
+        index = self._find(item)
+        if index < 0:
+            raise KeyError(item)
+        self.array[index] = self.DELETED
+        self.size -= 1
+
+    def _rehash(self, capacity: int) -> None:
+        """ Moves the items to a table sized for capacity items, dropping the tombstones.
+        The old table is read in one slice, but each item still goes to the slot of its own hash.
+        :complexity: O(n + capacity)
+        """
+        old_items = self.array.to_list()
+        self.array = ArrayR(self._slots_for(capacity))
+        mask = len(self.array) - 1
+        for item in old_items:
+            if item is not None and item is not self.DELETED:
+                index = hash(item) & mask
+                while self.array[index] is not None:
+                    index = (index + 1) & mask
+                self.array[index] = item
+        self.used = self.size
+
+    def __iter__(self) -> Iterator[T]:
+        """ Iterates over the items the set holds when iteration starts, in no particular order.
+        :complexity: O(capacity), the table is read in one slice
+        """
+        for item in self.array.to_list():
+            if item is not None and item is not self.DELETED:
+                yield item
+
+    def union(self, other: Set[T]) -> HashSet[T]:
+        """ Creates a new set with the items of self and other.
+        :complexity: O(n + m)
+        """
+        res = HashSet(len(self) + len(other))
+        for item in self:
+            res.add(item)
+        for item in other:
+            res.add(item)
+        return res
+
+    def intersection(self, other: Set[T]) -> HashSet[T]:
+        """ Creates a new set with the items both in self and other.
+        :complexity: O(min(n, m)) when other is a HashSet
+        """
+        smaller, larger = (self, other) if len(self) <= len(other) else (other, self)
+        res = HashSet(len(smaller))
+        for item in smaller:
+            if item in larger:
+                res.add(item)
+        return res
+
+    def difference(self, other: Set[T]) -> HashSet[T]:
+        """ Creates a new set with the items of self that are not in other.
+        :complexity: O(n) when other is a HashSet
+        """
+        res = HashSet(len(self))
+        for item in self:
+            if item not in other:
+                res.add(item)
+        return res
+
+    def __str__(self) -> str:
+        return ", ".join(str(item) for item in self)
+
+
+class TestHashSet(unittest.TestCase):
+    """ Tests for the above class."""
+
+    def setUp(self):
+        self.evens = HashSet()
+        self.small = HashSet()
+        for i in range(0, 100, 2):
+            self.evens.add(i)
+        for i in range(10):
+            self.small.add(i)
+
+    def test_add_and_contains(self):
+        self.assertEqual(len(self.evens), 50)
+        self.evens.add(4)
+        self.assertEqual(len(self.evens), 50, "Adding an item twice should not grow the set")
+        self.assertIn(98, self.evens)
+        self.assertNotIn(99, self.evens)
+        self.assertRaises(TypeError, self.evens.add, None)
+
+    def test_remove(self):
+        for i in range(0, 100, 4):
+            self.evens.remove(i)
+        self.assertEqual(len(self.evens), 25)
+        self.assertNotIn(8, self.evens)
+        self.assertIn(10, self.evens)
+        self.assertRaises(KeyError, self.evens.remove, 8)
+        # tombstones are reused and never lose items further down a probe chain
+        for i in range(0, 100, 4):
+            self.evens.add(i)
+        self.assertEqual(sorted(self.evens), list(range(0, 100, 2)))
+
+    def test_resize(self):
+        items = HashSet(1)
+        for i in range(10000):
+            items.add(str(i))
+        self.assertEqual(len(items), 10000)
+        self.assertTrue(all(str(i) in items for i in range(10000)))
+        self.assertLessEqual(items.used * 3, len(items.array) * 2)
+
+    def test_set_algebra(self):
+        self.assertEqual(sorted(self.evens.union(self.small)), sorted(set(range(0, 100, 2)) | set(range(10))))
+        self.assertEqual(sorted(self.evens.intersection(self.small)), [0, 2, 4, 6, 8])
+        self.assertEqual(sorted(self.small.difference(self.evens)), [1, 3, 5, 7, 9])
+
+    def test_clear(self):
+        self.evens.clear()
+        self.assertTrue(self.evens.is_empty())
+        self.assertNotIn(0, self.evens)
+
+
+if __name__ == '__main__':
+    testtorun = TestHashSet()
+    suite = unittest.TestLoader().loadTestsFromModule(testtorun)
+    unittest.TextTestRunner().run(suite)
@@ -8,6 +8,7 @@ __docformat__ = 'reStructuredText'
 
 import unittest
 from abc import ABC, abstractmethod
+from copy import copy as shallow_copy
 from typing import Generic
 from data_structures.referential_array import ArrayR, T
 
@@ -56,6 +57,7 @@ class CircularQueue(Queue[T]):
     ArrayR cannot create empty arrays. So MIN_CAPACITY used to avoid this.
     """
     MIN_CAPACITY = 1
+    SWAP_LIMIT = 8  # shorter ranges are reversed by swapping, the slices cost more than they save
 
     def __init__(self,max_capacity:int) -> None:
         Queue.__init__(self)
@@ -104,6 +106,59 @@ class CircularQueue(Queue[T]):
         self.front = 0
         self.rear = 0
     
+    def _runs(self, start: int, count: int) -> tuple[int, int]:
+        """ Returns (slot, first) for the count elements from position start, counted from the front:
+        the first elements are in slots slot to slot + first - 1, the rest wrap around to slot 0.
+        """
+        slot = (self.front + start) % len(self.array)
+        return slot, min(count, len(self.array) - slot)
+
+    def _copy_out(self, dst: ArrayR[T], start: int, count: int, dst_start: int = 0) -> None:
+        """ Copies the count elements from position start, counted from the front, to dst from dst_start.
+        :complexity: O(count), at most two copy_from calls
+        """
+        slot, first = self._runs(start, count)
+        dst.copy_from(self.array, slot, dst_start, first)
+        dst.copy_from(self.array, 0, dst_start + first, count - first)
+
+    def reverse_range(self, start: int, end: int) -> None:
+        """ Reverses, in place, the elements in positions start to end - 1, counted from the front of the queue.
+        Ranges of SWAP_LIMIT elements or more are moved in slices. When such a range wraps around
+        the end of the array, both runs are read, reversed together and written back, so each element
+        is stored once. Shorter ranges, example half a team, are reversed by swapping.
+        :complexity: O(end - start), at most two slice reads and two slice assignments
+        :raises IndexError: unless 0 <= start <= end <= len(self)
+        """
+        if not 0 <= start <= end <= len(self):
+            raise IndexError(f"Range [{start}, {end}) is outside a queue of length {len(self)}")
+        count = end - start
+        if count < self.SWAP_LIMIT:
+            capacity = len(self.array)
+            low = (self.front + start) % capacity
+            high = (self.front + end - 1) % capacity
+            for _ in range(count // 2):
+                self.array[low], self.array[high] = self.array[high], self.array[low]
+                low = (low + 1) % capacity
+                high = (high - 1) % capacity
+            return
+        slot, first = self._runs(start, count)
+        if first == count:
+            self.array.reverse(slot, slot + count)
+        else:
+            items = self.array.to_list(slot) + self.array.to_list(0, count - first)
+            items.reverse()
+            self.array.write(slot, items[:first])
+            self.array.write(0, items[first:])
+
+    def copy(self) -> 'CircularQueue':
+        """ Creates a copy of the queue, element for element in the same array positions.
+        :complexity: O(capacity), one slice assignment
+        """
+        new_queue = shallow_copy(self)
+        new_queue.array = ArrayR(len(self.array))
+        new_queue.array.copy_from(self.array)
+        return new_queue
+
     def print_items(self) -> None:
         index = self.front
         for _ in range(len(self)):
@@ -122,6 +177,58 @@ class CircularQueue(Queue[T]):
 
         return "[" + ", ".join(map(str, elements)) + "]"
 
+
+class GrowableCircularQueue(CircularQueue[T]):
+    """ Circular queue that is never full.
+
+    The array doubles when an element is appended to a full queue and halves when
+    the queue drops to a quarter of it, but never below the capacity it was created
+    with, so append and serve are O(1) amortised. Resizing unwraps the elements to
+    the start of the new array.
+
+    Attributes:
+         initial_capacity (int): the array never shrinks below this capacity
+    """
+
+    def __init__(self, max_capacity: int) -> None:
+        """ Initialises an empty queue with the given starting capacity. """
+        CircularQueue.__init__(self, max_capacity)
+        self.initial_capacity = len(self.array)
+
+    def is_full(self) -> bool:
+        """ False, the queue grows instead. """
+        return False
+
+    def _resize(self, capacity: int) -> None:
+        """ Moves the elements, front first, to the start of an array of the given capacity.
+        :complexity: O(capacity)
+        """
+        new_array = ArrayR(capacity)
+        self._copy_out(new_array, 0, self.length)
+        self.array = new_array
+        self.front = 0
+        self.rear = self.length % capacity
+
+    def append(self, item: T) -> None:
+        """ Adds an element to the rear of the queue, doubling the array if it is full.
+        :complexity: O(1) amortised
+        """
+        if self.length == len(self.array):
+            self._resize(2 * len(self.array))
+        CircularQueue.append(self, item)
+
+    def serve(self) -> T:
+        """ Deletes and returns the element at the queue's front, halving the array once a quarter of it is used.
+        :complexity: O(1) amortised
+        :raises Exception: if the queue is empty
+        """
+        front = self.front
+        item = CircularQueue.serve(self)
+        self.array[front] = None
+        if self.length <= len(self.array) // 4 and len(self.array) // 2 >= self.initial_capacity:
+            self._resize(len(self.array) // 2)
+        return item
+
 	
 
 
@@ -209,6 +316,58 @@ class TestQueue(unittest.TestCase):
             self.assertEqual(len(queue), 0)
             self.assertTrue(queue.is_empty())
 
+    def test_reverse_range(self):
+        queue = CircularQueue(5)
+        for i in range(5):
+            queue.append(i)
+        for i in range(3):
+            queue.append(queue.serve())
+        # the queue now starts at array position 3 and wraps around the end of the array
+        queue.reverse_range(1, 5)
+        self.assertEqual([queue.serve() for _ in range(5)], [3, 2, 1, 0, 4])
+        self.assertRaises(IndexError, queue.reverse_range, 0, 1)
+        # short ranges are swapped, longer ones moved in slices
+        size = 2 * CircularQueue.SWAP_LIMIT
+        for front in range(0, size, 3):
+            for start in range(size + 1):
+                for end in range(start, size + 1):
+                    queue = CircularQueue(size)
+                    queue.front = queue.rear = front
+                    for i in range(size):
+                        queue.append(i)
+                    queue.reverse_range(start, end)
+                    expected = list(range(size))
+                    expected[start:end] = expected[start:end][::-1]
+                    self.assertEqual([queue.serve() for _ in range(size)], expected)
+
+
+    def test_copy(self):
+        copy = self.roomy_queue.copy()
+        self.roomy_queue.serve()
+        self.roomy_queue.append("x")
+        self.assertEqual([copy.serve() for _ in range(5)], [0, 1, 2, 3, 4])
+        self.assertEqual(len(self.roomy_queue), 5)
+
+
+class TestGrowableQueue(unittest.TestCase):
+    """ Tests for the growable queue."""
+
+    def test_grow_and_shrink(self):
+        queue = GrowableCircularQueue(4)
+        for i in range(3):
+            queue.append(i)
+        queue.serve()
+        # the queue wraps around the end of the array before it grows
+        for i in range(3, 50):
+            queue.append(i)
+        self.assertFalse(queue.is_full())
+        self.assertEqual(str(queue), "[" + ", ".join(map(str, range(1, 50))) + "]")
+        for i in range(1, 50):
+            self.assertEqual(queue.serve(), i)
+        self.assertEqual(len(queue.array), 4, "the array should shrink back to its initial capacity")
+        self.assertRaises(Exception, queue.serve)
+
+
 if __name__ == '__main__':
     testtorun = TestQueue()
     suite = unittest.TestLoader().loadTestsFromModule(testtorun)
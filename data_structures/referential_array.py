@@ -12,15 +12,31 @@ space to hold the references.
 Note that while I do check the precondition in __init__ (noone else
 would), I do not check that of getitem or setitem, since that is already
 checked by self.array[index].
+
+Creating the type (length * ctypes.py_object) is not free, so the types are
+cached per length in _array_type. Arrays are not pooled for reuse: an array can
+only be reused safely once nothing refers to it, which means handing it back
+from __del__, and that costs about as much as the allocation it saves.
 """
+from __future__ import annotations
+
 __author__ = "Julian Garcia for the __init__ code, Maria Garcia de la Banda for the rest"
 __docformat__ = 'reStructuredText'
 
+import unittest
 from ctypes import py_object
-from typing import TypeVar, Generic
+from functools import lru_cache
+from typing import Iterable, TypeVar, Generic
 
 T = TypeVar('T')
 
+
+@lru_cache(maxsize=64)
+def _array_type(length: int) -> type:
+    """ Returns the ctypes type of an array of length references, created once per length. """
+    return length * py_object
+
+
 class ArrayR(Generic[T]):
     def __init__(self, length: int) -> None:
         """ Creates an array of references to objects of the given length
@@ -29,8 +45,37 @@ class ArrayR(Generic[T]):
         """
         if length <= 0:
             raise ValueError("Array length should be larger than 0.")
-        self.array = (length * py_object)() # initialises the space
-        self.array[:] =  [None for _ in range(length)]
+        self.array = _array_type(length)() # initialises the space
+        self.array[:] = [None] * length
+
+    @classmethod
+    def _wrap(cls, items: list) -> ArrayR[T]:
+        """ Creates an array holding the objects of a non empty list, without setting them to None first. """
+        res = cls.__new__(cls)
+        res.array = _array_type(len(items))()
+        res.array[:] = items
+        return res
+
+    @classmethod
+    def from_iterable(cls, items: Iterable[T]) -> ArrayR[T]:
+        """ Creates an array holding the given objects in order.
+        :complexity: O(n), one slice assignment
+        :raises ValueError: if there are no items, an array can't be empty
+        """
+        items = items if isinstance(items, list) else list(items)
+        if len(items) == 0:
+            raise ValueError("Array length should be larger than 0.")
+        return cls._wrap(items)
+
+    @classmethod
+    def filled(cls, length: int, value: T) -> ArrayR[T]:
+        """ Creates an array of the given length with every position set to value.
+        :complexity: O(length), one slice assignment
+        :pre: length > 0
+        """
+        if length <= 0:
+            raise ValueError("Array length should be larger than 0.")
+        return cls._wrap([value] * length)
 
     def __len__(self) -> int:
         """ Returns the length of the array
@@ -52,6 +97,71 @@ class ArrayR(Generic[T]):
         """
         self.array[index] = value
     
+    def _check_range(self, start: int, end: int) -> None:
+        """ Raises IndexError unless 0 <= start <= end <= length. """
+        if not 0 <= start <= end <= len(self.array):
+            raise IndexError(f"Range [{start}, {end}) is outside an array of length {len(self.array)}")
+
+    def copy_from(self, src: ArrayR[T], src_start: int = 0, dst_start: int = 0, count: int = None) -> None:
+        """ Copies count objects from src, starting at src_start, into this array starting at dst_start.
+        count defaults to the rest of src. src may be this array, overlapping ranges are copied correctly.
+        :complexity: O(count), a single slice assignment
+        :raises IndexError: if either range falls outside its array
+        """
+        if count is None:
+            count = len(src) - src_start
+        src._check_range(src_start, src_start + count)
+        self._check_range(dst_start, dst_start + count)
+        self.array[dst_start:dst_start + count] = src.array[src_start:src_start + count]
+
+    def shift(self, start: int, end: int, delta: int) -> None:
+        """ Moves the objects in positions start to end - 1 by delta positions, right if delta is positive.
+        The positions left behind keep their old contents.
+        :complexity: O(end - start), a single slice assignment
+        :raises IndexError: if the range or the moved range falls outside the array
+        """
+        self._check_range(start, end)
+        self._check_range(start + delta, end + delta)
+        self.array[start + delta:end + delta] = self.array[start:end]
+
+    def fill(self, value: T, start: int = 0, end: int = None) -> None:
+        """ Sets positions start to end - 1 to value, end defaults to the length of the array.
+        :complexity: O(end - start), a single slice assignment
+        :raises IndexError: if the range falls outside the array
+        """
+        if end is None:
+            end = len(self.array)
+        self._check_range(start, end)
+        self.array[start:end] = [value] * (end - start)
+
+    def reverse(self, start: int = 0, end: int = None) -> None:
+        """ Reverses the objects in positions start to end - 1, end defaults to the length of the array.
+        :complexity: O(end - start), a single slice assignment
+        :raises IndexError: if the range falls outside the array
+        """
+        if end is None:
+            end = len(self.array)
+        self._check_range(start, end)
+        self.array[start:end] = self.array[start:end][::-1]
+
+    def write(self, start: int, items: list[T]) -> None:
+        """ Stores the objects of a list in positions start to start + len(items) - 1.
+        :complexity: O(len(items)), a single slice assignment
+        :raises IndexError: if the range falls outside the array
+        """
+        self._check_range(start, start + len(items))
+        self.array[start:start + len(items)] = items
+
+    def to_list(self, start: int = 0, end: int = None) -> list[T]:
+        """ Returns a list of the objects in positions start to end - 1, end defaults to the length of the array.
+        :complexity: O(end - start), a single slice
+        :raises IndexError: if the range falls outside the array
+        """
+        if end is None:
+            end = len(self.array)
+        self._check_range(start, end)
+        return self.array[start:end]
+
     def index(self, item: T) -> int:
         for index, arr_item in enumerate(self.array):
             if arr_item == item:
@@ -78,3 +188,41 @@ class ArrayR(Generic[T]):
         
         ret_str = ret_str[:-2] + "]"
         return ret_str
+
+
+class TestArrayR(unittest.TestCase):
+    """ Tests for the above class."""
+
+    def test_constructors(self):
+        self.assertEqual(list(ArrayR(3).array), [None, None, None])
+        self.assertEqual(list(ArrayR.from_iterable(range(4)).array), [0, 1, 2, 3])
+        self.assertEqual(list(ArrayR.filled(2, "x").array), ["x", "x"])
+        self.assertRaises(ValueError, ArrayR, 0)
+        self.assertRaises(ValueError, ArrayR.from_iterable, [])
+        self.assertRaises(ValueError, ArrayR.filled, 0, None)
+
+    def test_block_moves(self):
+        array = ArrayR.from_iterable(range(6))
+        array.shift(0, 3, 2)
+        self.assertEqual(list(array.array), [0, 1, 0, 1, 2, 5])
+        array.shift(2, 6, -2)
+        self.assertEqual(list(array.array), [0, 1, 2, 5, 2, 5])
+        array.copy_from(ArrayR.from_iterable("abc"), 1, 4)
+        self.assertEqual(list(array.array), [0, 1, 2, 5, "b", "c"])
+        array.fill(None, 1, 3)
+        self.assertEqual(list(array.array), [0, None, None, 5, "b", "c"])
+        array.reverse(2, 6)
+        self.assertEqual(array.to_list(), [0, None, "c", "b", 5, None])
+        self.assertEqual(array.to_list(1, 3), [None, "c"])
+        array.write(4, [7, 8])
+        self.assertEqual(array.to_list(), [0, None, "c", "b", 7, 8])
+        self.assertRaises(IndexError, array.shift, 4, 6, 1)
+        self.assertRaises(IndexError, array.copy_from, array, 0, 3, 4)
+        self.assertRaises(IndexError, array.reverse, 5, 7)
+        self.assertRaises(IndexError, array.write, 5, [1, 2])
+
+
+if __name__ == '__main__':
+    testtorun = TestArrayR()
+    suite = unittest.TestLoader().loadTestsFromModule(testtorun)
+    unittest.TextTestRunner().run(suite)
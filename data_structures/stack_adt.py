@@ -8,6 +8,7 @@ __docformat__ = 'reStructuredText'
 
 import unittest
 from abc import ABC, abstractmethod
+from copy import copy as shallow_copy
 from typing import TypeVar, Generic
 from data_structures.referential_array import ArrayR, T
 
@@ -54,8 +55,14 @@ class ArrayStack(Stack[T]):
     Attributes:
          length (int): number of elements in the stack (inherited)
          array (ArrayR[T]): array storing the elements of the queue
+         users (list[int]): one-element list counting the stacks using the array, shared by all of them
 
     ArrayR cannot create empty arrays. So MIN_CAPACITY used to avoid this.
+
+    Copies are copy-on-write: they use the same array until either stack writes to it,
+    then the writer moves its elements to an array of its own. The last stack left on an
+    array writes to it directly. Code outside the class should therefore not write to the
+    array directly.
     """
     MIN_CAPACITY = 1
 
@@ -65,6 +72,29 @@ class ArrayStack(Stack[T]):
         """
         Stack.__init__(self)
         self.array = ArrayR(max(self.MIN_CAPACITY, max_capacity))
+        self.users = [1]
+
+    @property
+    def shared(self) -> bool:
+        """ True while another stack uses the same array. """
+        return self.users[0] > 1
+
+    def _move_to(self, capacity: int) -> None:
+        """ Moves the elements to a new array of the given capacity, leaving the old one to its other users.
+        :complexity: O(capacity)
+        """
+        new_array = ArrayR(capacity)
+        new_array.copy_from(self.array, 0, 0, self.length)
+        self.array = new_array
+        self.users[0] -= 1
+        self.users = [1]
+
+    def _unshare(self) -> None:
+        """ Gives the stack an array of its own before a write, if it shares one with a copy.
+        :complexity: O(1) if the array is not shared, O(capacity) otherwise
+        """
+        if self.shared:
+            self._move_to(len(self.array))
     
     def __getitem__(self, index: int):
         return self.array[index]
@@ -80,6 +110,7 @@ class ArrayStack(Stack[T]):
         """
         if self.is_full():
             raise Exception("Stack is full")
+        self._unshare()
         self.array[len(self)] = item
         self.length += 1
 
@@ -101,6 +132,21 @@ class ArrayStack(Stack[T]):
         if self.is_empty():
             raise Exception("Stack is empty")
         return self.array[self.length-1]
+    def reverse_range(self, start: int, end: int) -> None:
+        """ Reverses, in place, the elements in positions start to end - 1, counted from the bottom of the stack.
+        :complexity: O(end - start), (end - start) // 2 swaps
+        :raises IndexError: unless 0 <= start <= end <= len(self)
+        """
+        if not 0 <= start <= end <= len(self):
+            raise IndexError(f"Range [{start}, {end}) is outside a stack of length {len(self)}")
+        if end - start > 1:
+            self._unshare()
+        end -= 1
+        while start < end:
+            self.array[start], self.array[end] = self.array[end], self.array[start]
+            start += 1
+            end -= 1
+
     def __str__(self) -> str:
         """Returns a string representation of the ArrayStack."""
         return f"<ArrayStack length={len(self)}, elements={self.array}>"
@@ -108,19 +154,66 @@ class ArrayStack(Stack[T]):
     #added
     def copy(self) -> 'ArrayStack':
         """
-        Creates a deep copy of the stack.
-        
+        Creates a copy of the stack. The copy shares the array until either stack
+        writes to it, so copying costs nothing until then, see _unshare.
+
         time complesity:
-        best case: O(1) when length is 1
-        worst case: O(n)
-        n is elements in stack.
+        best case: O(1)
+        worst case: O(1)
         """
-        new_stack = ArrayStack(max_capacity=len(self.array))
-        new_stack.length = self.length
-        for j in range(self.length):
-            new_stack.array[j] = self.array[j]
+        new_stack = shallow_copy(self)
+        self.users[0] += 1
         return new_stack
-        
+
+
+class GrowableArrayStack(ArrayStack[T]):
+    """ Array stack that is never full.
+
+    The array doubles when an element is pushed onto a full stack and halves when
+    the stack drops to a quarter of it, but never below the capacity it was created
+    with, so push and pop are O(1) amortised.
+
+    Attributes:
+         initial_capacity (int): the array never shrinks below this capacity
+    """
+
+    def __init__(self, max_capacity: int) -> None:
+        """ Initialises the length and the array with the given starting capacity. """
+        ArrayStack.__init__(self, max_capacity)
+        self.initial_capacity = len(self.array)
+
+    def is_full(self) -> bool:
+        """ False, the stack grows instead. """
+        return False
+
+    def _resize(self, capacity: int) -> None:
+        """ Moves the elements to an array of the given capacity.
+        :complexity: O(capacity)
+        """
+        self._move_to(capacity)
+
+    def push(self, item: T) -> None:
+        """ Pushes an element to the top of the stack, doubling the array if it is full.
+        :complexity: O(1) amortised
+        """
+        if self.length == len(self.array):
+            self._resize(2 * len(self.array))
+        self._unshare()
+        self.array[self.length] = item
+        self.length += 1
+
+    def pop(self) -> T:
+        """ Pops the element at the top of the stack, halving the array once a quarter of it is used.
+        :complexity: O(1) amortised
+        :raises Exception: if the stack is empty
+        """
+        item = ArrayStack.pop(self)
+        if not self.shared:
+            self.array[self.length] = None
+        if self.length <= len(self.array) // 4 and len(self.array) // 2 >= self.initial_capacity:
+            self._resize(len(self.array) // 2)
+        return item
+
 
 class TestStack(unittest.TestCase):
     """ Tests for the above class."""
@@ -206,6 +299,57 @@ class TestStack(unittest.TestCase):
             self.assertEqual(len(stack), 0)
             self.assertTrue(stack.is_empty())
 
+    def test_reverse_range(self):
+        self.large_stack.reverse_range(0, 5)
+        self.large_stack.reverse_range(7, 10)
+        self.assertEqual([self.large_stack[i] for i in range(10)], [4, 3, 2, 1, 0, 5, 6, 9, 8, 7])
+        self.large_stack.reverse_range(3, 3)
+        self.assertEqual(self.large_stack.pop(), 7)
+        self.assertRaises(IndexError, self.large_stack.reverse_range, 0, 10)
+
+
+    def test_copy_on_write(self):
+        copy = self.large_stack.copy()
+        self.assertIs(copy.array, self.large_stack.array, "a copy should share the array until a write")
+        self.assertEqual(copy.pop(), 9)
+        copy.push("x")
+        self.assertIsNot(copy.array, self.large_stack.array)
+        self.assertEqual(self.large_stack.peek(), 9)
+        array = self.large_stack.array
+        self.large_stack.reverse_range(0, 10)
+        self.assertIs(self.large_stack.array, array, "the last stack on an array should not copy it")
+        self.assertEqual([copy[i] for i in range(10)], [0, 1, 2, 3, 4, 5, 6, 7, 8, "x"])
+        self.assertEqual([self.large_stack[i] for i in range(10)], list(range(9, -1, -1)))
+
+        first, second = self.large_stack.copy(), self.large_stack.copy()
+        first.push("y")
+        self.assertIs(second.array, self.large_stack.array, "two stacks still share the array")
+        second.reverse_range(0, 2)
+        self.assertIsNot(second.array, self.large_stack.array)
+        array = self.large_stack.array
+        self.large_stack.reverse_range(0, 2)
+        self.assertIs(self.large_stack.array, array)
+
+
+class TestGrowableStack(unittest.TestCase):
+    """ Tests for the growable stack."""
+
+    def test_grow_and_shrink(self):
+        stack = GrowableArrayStack(2)
+        for i in range(100):
+            stack.push(i)
+        self.assertFalse(stack.is_full())
+        self.assertEqual(len(stack.array), 128)
+        self.assertEqual(stack.peek(), 99)
+        copy = stack.copy()
+        self.assertIsInstance(copy, GrowableArrayStack)
+        for i in range(99, -1, -1):
+            self.assertEqual(stack.pop(), i)
+        self.assertEqual(len(stack.array), 2, "the array should shrink back to its initial capacity")
+        self.assertRaises(Exception, stack.pop)
+        self.assertEqual(len(copy), 100)
+
+
 if __name__ == '__main__':
     testtorun = TestStack()
     suite = unittest.TestLoader().loadTestsFromModule(testtorun)
@@ -0,0 +1,155 @@
+"""
+This module evaluates one exchange of blows for every pair of pokemon in two rosters at once, with NumPy.
+
+A roster is two parallel arrays: species ids and levels. Every species starts at level 1 and
+Pokemon.level_up evolves it once per level until its last form, so a species id and a level
+pin down the form and its stats. The grid reproduces Pokemon.attack, Pokemon.defend and the
+speed ordering of Battle.perform_battle operation for operation, so every entry equals what a
+battle between the two pokemon at full health would compute.
+
+Requires NumPy, listed in requirements.txt, which the battle engine itself does not.
+"""
+from __future__ import annotations
+import numpy as np
+from pokemon_base import TypeEffectiveness
+from species_table import SPECIES_TABLE
+
+
+class MatchupGrid:
+    """
+    Outcome of one exchange for every pair (i, j), pokemon i of roster 1 against pokemon j of roster 2.
+    Every attribute is an array of shape (len(roster 1), len(roster 2)).
+
+    Attributes:
+        striker (ndarray): 1 or 2 for the roster whose pokemon is faster and attacks first,
+            0 when both have the same speed and attack at the same time.
+        first_strike (ndarray): health the first attack removes. With equal speed, the
+            health pokemon 1's attack removes from pokemon 2.
+        counter (ndarray): health the answering attack removes, 0 when the first attack fainted
+            the defender. With equal speed, the health pokemon 2's attack removes from pokemon 1.
+        health_1, health_2 (ndarray): health of both pokemon after the exchange.
+        winner (ndarray): 1 or 2 for the roster whose pokemon is the only one still alive, 0 otherwise.
+    """
+    def __init__(self, striker, first_strike, counter, health_1, health_2) -> None:
+        self.striker = striker
+        self.first_strike = first_strike
+        self.counter = counter
+        self.health_1 = health_1
+        self.health_2 = health_2
+        alive_1 = health_1 > 0
+        alive_2 = health_2 > 0
+        self.winner = np.where(alive_1 & ~alive_2, 1, np.where(alive_2 & ~alive_1, 2, 0))
+
+
+def form_stats(species_ids, levels) -> dict:
+    """
+    Returns the stats of pokemon of the given species at the given levels, one array per stat.
+
+    Each evolution multiplies health, speed, defence and battle power by 1.5, one evolution at
+    a time like Pokemon._evolve, so the values are bit for bit the ones of a levelled up pokemon.
+
+    Time complexity:
+    best case: O(n * e) n = pokemon, e = longest evolution line
+    worst case: O(n * e)
+    """
+    species_ids = np.asarray(species_ids, dtype=np.intp)
+    levels = np.asarray(levels, dtype=np.intp)
+    stage = np.asarray(SPECIES_TABLE.stage, dtype=np.intp)[species_ids]
+    stages = np.asarray(SPECIES_TABLE.stages, dtype=np.intp)[species_ids]
+    evolutions = np.clip(np.minimum(levels - 1, stages - 1 - stage), 0, None)
+    stats = {
+        "health": np.asarray(SPECIES_TABLE.health, dtype=np.float64)[species_ids],
+        "battle_power": np.asarray(SPECIES_TABLE.battle_power, dtype=np.float64)[species_ids],
+        "defence": np.asarray(SPECIES_TABLE.defence, dtype=np.float64)[species_ids],
+        "speed": np.asarray(SPECIES_TABLE.speed, dtype=np.float64)[species_ids],
+    }
+    for evolution in range(int(evolutions.max(initial=0))):
+        evolved = evolutions > evolution
+        for name in stats:
+            stats[name] = np.where(evolved, stats[name] * 1.5, stats[name])
+    stats["poketype"] = np.asarray(SPECIES_TABLE.poketype, dtype=np.intp)[species_ids]
+    return stats
+
+
+def attack_damage(attacker: dict, defender: dict) -> np.ndarray:
+    """
+    Returns Pokemon.attack for every pair of broadcast attacker and defender stats.
+
+    Time complexity:
+    best case: O(n * m)
+    worst case: O(n * m)
+    """
+    attack = attacker["battle_power"]
+    defence = defender["defence"]
+    damage = np.where(defence < attack / 2, attack - defence,
+                      np.where(defence < attack, np.ceil((attack * 5 / 8) - (defence / 4)), np.ceil(attack / 4)))
+    effectiveness = np.asarray(TypeEffectiveness.TABLE, dtype=np.float64)
+    effectiveness = effectiveness[attacker["poketype"] * TypeEffectiveness.TYPE_COUNT + defender["poketype"]]
+    return effectiveness * damage
+
+
+def _defend(damage: np.ndarray, defence: np.ndarray) -> np.ndarray:
+    """ Returns the health Pokemon.defend removes for the given damage. """
+    return np.where(damage < defence, damage / 2, damage)
+
+
+def evaluate_matchups(species_1, levels_1, species_2, levels_2, completion_1: float = 1.0, completion_2: float = 1.0) -> MatchupGrid:
+    """
+    Evaluates the exchange of Battle.perform_battle for every pair of pokemon of two rosters at full health.
+
+    Arguments:
+    species_1, levels_1: species ids and levels of roster 1.
+    species_2, levels_2: species ids and levels of roster 2.
+    completion_1, completion_2: pokedex completion of the two trainers, they scale the damage like in a battle.
+
+    Time complexity:
+    best case: O(n * m) n, m = roster sizes
+    worst case: O(n * m)
+
+    Returns:
+    A MatchupGrid of shape (n, m).
+    """
+    pokemon_1 = {name: column[:, None] for name, column in form_stats(species_1, levels_1).items()}
+    pokemon_2 = {name: column[None, :] for name, column in form_stats(species_2, levels_2).items()}
+    ratio_1 = completion_1 / completion_2
+    ratio_2 = completion_2 / completion_1
+    shape = np.broadcast_shapes(pokemon_1["health"].shape, pokemon_2["health"].shape)
+
+    # health each pokemon's attack removes, if it gets to attack
+    hit_on_2 = _defend(np.ceil(attack_damage(pokemon_1, pokemon_2) * ratio_1), pokemon_2["defence"])
+    hit_on_1 = _defend(np.ceil(attack_damage(pokemon_2, pokemon_1) * ratio_2), pokemon_1["defence"])
+    hit_on_2 = np.broadcast_to(hit_on_2, shape)
+    hit_on_1 = np.broadcast_to(hit_on_1, shape)
+    health_1 = np.broadcast_to(pokemon_1["health"], shape)
+    health_2 = np.broadcast_to(pokemon_2["health"], shape)
+
+    faster_1 = pokemon_1["speed"] > pokemon_2["speed"]
+    faster_2 = pokemon_1["speed"] < pokemon_2["speed"]
+    striker = np.where(faster_1, 1, np.where(faster_2, 2, 0))
+
+    # the slower pokemon only answers if the first attack left it alive
+    answers_1 = health_1 - hit_on_1 > 0
+    answers_2 = health_2 - hit_on_2 > 0
+    first_strike = np.where(faster_2, hit_on_1, hit_on_2)
+    counter = np.where(faster_1, np.where(answers_2, hit_on_1, 0.0),
+                       np.where(faster_2, np.where(answers_1, hit_on_2, 0.0), hit_on_1))
+    new_health_1 = health_1 - np.where(faster_1 & ~answers_2, 0.0, hit_on_1)
+    new_health_2 = health_2 - np.where(faster_2 & ~answers_1, 0.0, hit_on_2)
+    return MatchupGrid(striker, first_strike, counter, new_health_1, new_health_2)
+
+
+def roster_forms() -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the species ids and levels of every form of every species, each species from
+    its starting form to its last, example Charmander at levels 1, 2 and 3.
+
+    Time complexity:
+    best case: O(f) f = number of forms
+    worst case: O(f)
+    """
+    species = np.arange(len(SPECIES_TABLE))
+    forms = np.asarray(SPECIES_TABLE.stages, dtype=np.intp) - np.asarray(SPECIES_TABLE.stage, dtype=np.intp)
+    species_ids = np.repeat(species, forms)
+    first = np.repeat(np.cumsum(forms) - forms, forms)
+    levels = np.arange(len(species_ids)) - first + 1
+    return species_ids, levels
@@ -1,79 +1,74 @@
 from pokemon import *
+import copy
 import random
 from typing import List
 from battle_mode import BattleMode
 from data_structures.referential_array import *
 from data_structures.set_adt import *
+from data_structures.bset import BSet
+from data_structures.hash_set import HashSet
 from data_structures.stack_adt import *
 from data_structures.queue_adt import *
 from data_structures.array_sorted_list import *
+from species_table import SPECIES_TABLE
 
 
-class ArraySet(Set[T]):
-    #Time complexity O(n * Comp==) best case is O(Comp==)
-    MIN_CAPACITY = 1
+class ArraySet(HashSet[T]):
+    """
+    Set of any hashable items, an open-addressing hash set (see data_structures/hash_set.py).
+    Add, remove and membership are O(1) amortised, the set grows past its initial capacity.
+    """
     def __init__(self, capacity: int = 15) -> None:
-        Set.__init__(self)
-        self.array = ArrayR(max(self.MIN_CAPACITY, capacity))
-    #O(1)
-    def clear(self) -> None:
-        self.size = 0
+        HashSet.__init__(self, capacity)
 
     #O(1)
-    def __len__(self) -> int:
-        return self.size
-    #O(1)
-    def is_empty(self) -> bool:
-        return len(self) == 0
-    #O(1)
     def is_full(self) -> bool:
-        return len(self) == len(self.array)
-
-    #time complexity is O(N*Comp==) where N is the size of set. best case is O(1).
-    def __contains__(self, item: T) -> bool:
-        for i in range(self.size):
-            if item == self.array[i]:
-                return True
+        """ Always False, the set grows as items are added. """
         return False
 
-    #time complexity is O(N * Comp==) best case O(1).
-    def remove(self, item: T) -> None:
-        for i in range(self.size):
-            if item == self.array[i]:
-                self.array[i] = self.array[self.size - 1]
-                self.size -= 1
-                break
-        else:
-            raise KeyError(item)
 
-    def __str__(self):
-        return ", ".join(str(item) for item in self.array if item is not None)
 
-    #time complexity is O(N * Comp==) and best case is O(1).
-    def add(self, item: T) -> None:
-        if item not in self:
-            if self.is_full():
-                raise Exception("Set is full")
-        self.array[self.size] = item
-        self.size += 1
+class PokeTypeSet(BSet):
+    """
+    Set of PokeType members, stored as one integer: type t is in the set if and only if
+    bit t.value is set. Add, remove, membership, union, intersection and difference are O(1),
+    BSet's union, intersection, difference and in-place operators return PokeTypeSets.
+    """
 
-    def union(self, other: Set[T]) -> Set[T]:
-        """ Makes a union of the set with another set. """
-        pass
+    def __contains__(self, item: PokeType) -> bool:
+        """ True if the set contains the type. """
+        return isinstance(item, PokeType) and BSet.__contains__(self, item.value + 1) == 1
 
-    def intersection(self, other: Set[T]) -> Set[T]:
-        """ Makes an intersection of the set with another set. """
-        pass
+    def add(self, item: PokeType) -> None:
+        """ Adds a type to the set.
+        :raises TypeError: if the item is not a PokeType.
+        """
+        if not isinstance(item, PokeType):
+            raise TypeError('Set elements should be PokeType members')
+        BSet.add(self, item.value + 1)
+
+    def remove(self, item: PokeType) -> None:
+        """ Removes a type from the set.
+        :raises TypeError: if the item is not a PokeType.
+        :raises KeyError: if the item is not in the set.
+        """
+        if not isinstance(item, PokeType):
+            raise TypeError('Set elements should be PokeType members')
+        BSet.remove(self, item.value + 1)
 
-    def difference(self, other: Set[T]) -> Set[T]:
-        """ Creates a difference of the set with another set. """
-        pass
+    def __iter__(self):
+        """ Iterates over the types in the set, in PokeType order. """
+        for value in BSet.__iter__(self):
+            yield PokeType(value - 1)
+
+    def __str__(self):
+        return ", ".join(str(item) for item in self)
 
 
 
 class PokeTeam:
     TEAM_LIMIT = 6
-    POKE_LIST = get_all_pokemon_types()
+    POKE_LIST = SPECIES_BY_ID
     CRITERION_LIST = ["health", "defence", "battle_power", "speed", "level"]
 
     def __init__(self):
@@ -81,38 +76,34 @@ class PokeTeam:
         self.team_count = 0
         self.descending = False
 
-#How to find pokemon in pokeType.
-    #Timecomplexity is O(Comp==) best case and O(n * Comp==) for worst case. Where n is the pokemon classes.
+    #Timecomplexity is O(1), the name index is built once when pokemon.py is imported.
     def find_pokemon_class(self, target_name):
         '''
-        This function returns searches the Pokelist for the pokemon class.
+        This function looks up the pokemon class of a name in the species name index.
+        Evolved names resolve to their base class, example "Graveler" returns Geodude.
 
         Arguments:
         target_name the name of the pokemon to search for.
 
         Time complexity:
-        best case: O(comp==)
-        worst case: O(n * Comp==)
-        n is pokemon
+        best case: O(1)
+        worst case: O(1)
 
         Returns:
         Pokemon Class 
         None
         '''
-        for pokemon_class in self.POKE_LIST:
-            if pokemon_class.__name__ == target_name:
-                return pokemon_class
-        return None
+        return find_species(target_name)
 
-    #Timecomplexity is O(n * Comp==) best case and O(n^2 * Comp==) for worst case. Where n is the pokemon classes.
+    #Timecomplexity is O(n) where n is the size of the team.
     def choose_manually(self):
         '''
         This function allows the user to populate the team with pokemons through user input.
 
         Time complexity:
-        best case:O(n * comp==) if team size is 1.
-        worst case:O(n^2 comp==)\
-        n is the number of pokemon classes.
+        best case:O(1) if team size is 1.
+        worst case:O(n)
+        n is the size of the team.
 
 
         Returns:
@@ -125,15 +116,18 @@ class PokeTeam:
             except ValueError:
                 print("Please enter a string")
                 continue
-            pokemon_class = self.find_pokemon_class(target_name)    #O(n)
+            pokemon_class = self.find_pokemon_class(target_name)    #O(1)
             self.team[i] = pokemon_class()
             self.team_count += 1
 
 
-    def choose_randomly(self) -> None:
+    def choose_randomly(self, rng: random.Random = None) -> None:
         '''
         This function populates the team randomly according to the team limit.
 
+        Arguments:
+        rng: the random number generator to draw from. Defaults to the global random module.
+
         Time complexity:
         best case:  O(n)   as we always go through 6 times due to team limit.
         worst case: O(n^2) we go through pokelist inside the for loop too.
@@ -143,53 +137,96 @@ class PokeTeam:
         The winning pokemon team.
         None
         '''
-        all_pokemon = get_all_pokemon_types()
+        if rng is None:
+            rng = random
+        all_pokemon = get_all_pokemon_types()    #O(1), built once at import
         self.team_count = 0
         for i in range(self.TEAM_LIMIT):
-            rand_int = random.randint(0, len(all_pokemon)-1)
+            rand_int = rng.randint(0, len(all_pokemon)-1)
             self.team[i] = all_pokemon[rand_int]()  #all_pokemon has size n of pokemons. O(n)
             self.team_count += 1
 
+    def choose_from_spec(self, names) -> None:
+        '''
+        This function populates the team from a compact spec: a sequence of pokemon class names, example ("Pikachu", "Zapdos").
+        The team is sized to the spec, so specs shorter than the team limit give smaller teams.
+
+        Arguments:
+        names: sequence of pokemon class names, at most TEAM_LIMIT long.
+
+        Time complexity:
+        best case:  O(n)
+        worst case: O(n)
+        n = pokemon in spec.
+
+        Raises:
+        ValueError if the spec is empty, too long or names an unknown pokemon.
+        '''
+        if not 0 < len(names) <= self.TEAM_LIMIT:
+            raise ValueError(f"Team spec should hold between 1 and {self.TEAM_LIMIT} pokemon")
+        self.team = ArrayR(len(names))
+        self.team_count = 0
+        for i in range(len(names)):
+            pokemon_class = self.find_pokemon_class(names[i])
+            if pokemon_class is None:
+                raise ValueError(f"Unknown pokemon {names[i]}")
+            self.team[i] = pokemon_class()
+            self.team_count += 1
+
     def regenerate_team(self, battle_mode: BattleMode, criterion: str = None) -> None:
         '''
         This function will regenerate pokemons in the team back to full hp according to the battle mode selected.
-        Each team will have a different data structure most suitable for each battle mode.
+        Full hp is the species' base health, read from SPECIES_TABLE, so no pokemon is created.
+        The team is reset in place: no new data structure is built.
+        SET mode heals the pokemon still in the stack.
+        ROTATE mode heals every pokemon in the queue array and puts them back in the queue in array order.
+        OPTIMISE mode heals the pokemon still in the list and sorts them by health, then by the criterion,
+        ascending, as assemble_team and assign_team do.
 
         Arguments:
         BattleMode: the selecected battle mode.
-        criterion: the selected criteria.
+        criterion: the selected criteria, health if None. Only used in OPTIMISE mode.
 
         Time complexity:
-        best case:  O(n^2 * comp==)
-        worst case: #O(n^2 log(n) * comp==) Optimised mode is chosen
+        best case:  O(n)
+        worst case: O(n log n) when Optimised mode is chosen
+        n = pokemon in team
 
         Returns:
         None. sets health of existing team to full.
         '''
-        if(battle_mode == BattleMode.OPTIMISE): #O(n^2 log(n) * comp==)
-            for j in range(self.TEAM_LIMIT):
-                pokemon = self.team[j]
-                if pokemon: # Check if there is a Pokemon object at this index
-                    full_health_class = self.find_pokemon_class(pokemon.value.__class__.__name__) #O(n)
-                if full_health_class:
-                # Update the health to the full health as defined in the class
-                    pokemon.value.health = full_health_class().health
-
-            self.temp_team = ArrayR(self.TEAM_LIMIT)
-            for j in range(len(self)):                  #O(n)
-                self.temp_team[j] = self.team[j].value
-            self.team = self.temp_team
-            self.assemble_team(battle_mode)     #O(n * comp==)
-            self.assign_team(criterion)
+        if battle_mode == BattleMode.OPTIMISE:
+            if criterion is None:
+                criterion = "health"
+            while len(self.team) > self.TEAM_LIMIT:         # the team never holds more than TEAM_LIMIT pokemon
+                self.team.delete_at_index(len(self.team) - 1)
+            for j in range(len(self.team)):                 #O(n)
+                item = self.team[j]
+                item.value.health = SPECIES_TABLE.base_health(item.value)   #O(1)
+                item.key = item.value.get__attribute__by__criteria('health')
+            self.team.descending = False
+            # sorted by health as assemble_team does, then twice by the criterion as assign_team does,
+            # so pokemon with equal keys end up where they would in a freshly assembled team
+            self.team.resort()                              #O(n log n)
+            for j in range(len(self.team)):
+                item = self.team[j]
+                item.key = item.value.get__attribute__by__criteria(criterion)
+            self.team.resort()
+            self.team.resort()
+        elif battle_mode == BattleMode.ROTATE:
+            members = 0
+            for j in range(len(self.team.array)):           #O(n)
+                pokemon = self.team.array[j]
+                if pokemon is not None:
+                    pokemon.health = SPECIES_TABLE.base_health(pokemon)
+                    members += 1
+            self.team.front = 0
+            self.team.length = members
+            self.team.rear = members % len(self.team.array)
         else:
-            for j in range(self.TEAM_LIMIT):        #O(n)
+            for j in range(len(self.team)):                 #O(n)
                 pokemon = self.team[j]
-                if pokemon: # Check if there is a Pokemon object at this index
-                    full_health_class = self.find_pokemon_class(pokemon.__class__.__name__) #O(n * comp==)
-                if full_health_class:
-                # Update the health to the full health as defined in the class
-                    pokemon.health = full_health_class().health
-            self.assemble_team(battle_mode)     #O(n)
+                pokemon.health = SPECIES_TABLE.base_health(pokemon)
 
 
     #This function assigns the order of the team based on the criterion list.
@@ -200,26 +237,23 @@ class PokeTeam:
         Arguments:
         criterion: the selected criteria is inputed as a string.
 
+        The team is sorted by the criterion, then put back in the team's order, each time with
+        from_items(as_added=True), so pokemon with equal values end up exactly where adding them
+        one at a time would put them.
+
         Time complexity:
-        best case:O(1)
-        worst case:O(n)
+        best case: O(n log n)
+        worst case: O(n log n)
         n is pokemon in team
 
         Returns:
         None. Sorts the team according to critria chosen.
         '''
-        #Created a new temporary list for the team.
-        temp_list = ArraySortedList(self.TEAM_LIMIT)
-        for j in range(self.team_count):        #O(n)
-            pokemon = self.team[j]
-            key = pokemon.value.get__attribute__by__criteria(criterion) #method made in pokemon_base.py O(comp==)
-            temp_list.add(ListItem(key=key, value=pokemon.value))
-        # Clear the current team to repopulate it
-        self.team.reset()
-
-        # Add each ListItem back to the team, now sorted by the new criterion
-        for j in range(self.team_count):
-            self.team.add(temp_list[j])
+        values = [self.team[j].value for j in range(len(self.team))]        #O(n)
+        temp_list = ArraySortedList.from_items(values, key=lambda pokemon: pokemon.get__attribute__by__criteria(criterion), as_added=True)
+        # put the items back in the team's order
+        self.team = ArraySortedList.from_items([temp_list[j] for j in range(len(temp_list))],
+                                               descending=self.team.descending, as_added=True)
 
     #This function assembles the team based on the battle_mode selected.
     #Each battle_mode has different data structures.
@@ -233,7 +267,7 @@ class PokeTeam:
 
         Time complexity:
         best case: O(comp== * n)
-        worst case: O(comp== * n^2 log n)  when optimised mode is run
+        worst case: O(comp== * n log n)  when optimised mode is run
         n is team limit.
 
         Returns:
@@ -245,7 +279,7 @@ class PokeTeam:
             for pokemon in range(len(self.team)):       #len = O(1)     for loop O(n) n = team limit.
                 temp_team.push(self.team[pokemon])      #push() = O(1)
 
-            self.team = temp_team.copy()                #O(n) added to the stack adt.
+            self.team = temp_team                       #O(1) the new stack becomes the team
         elif battle_mode == BattleMode.ROTATE:          #O(comp==)
             circular_queue = CircularQueue(self.TEAM_LIMIT)
             # Add each Pokémon in self.team to the circular queue
@@ -254,12 +288,9 @@ class PokeTeam:
             self.team = circular_queue
         #Optimised Mode
         elif battle_mode == BattleMode.OPTIMISE:        #O(comp==)
-            sorted_list = ArraySortedList(self.TEAM_LIMIT)
-
-            for pokemon in self.team:                   #O(n)
-                key = pokemon.get__attribute__by__criteria('health')    #O(comp==)
-                sorted_list.add(ListItem(key=key, value=pokemon))       #add() = O(nlog(n))
-            self.team = sorted_list
+            # sorted by health, pokemon with equal health placed as adding them one at a time would
+            self.team = ArraySortedList.from_items(self.team, key=lambda pokemon: pokemon.get__attribute__by__criteria('health'),
+                                                   as_added=True)      #O(n log n)
 
 
     #SET Mode Reverses the first half of the team
@@ -271,65 +302,52 @@ class PokeTeam:
         SET mode reverses the first half of the team.
         Rotate mode reverses the second half of the team.
         Optimise mode it reverses the order of the team, either ascending to descending or descending to ascending order each time special is called.
-        
+        SET and ROTATE swap the pokemon in place, n/2 swaps at most and no new arrays.
+        OPTIMISE only flips the orientation of the sorted list, so pokemon with equal keys swap places too.
 
         Time complexity:
-        best case: O(comp==) if mode chosen is manual with 1 pokemon in team
-        worst case: O(nlog(n) * comp==)
+        best case: O(1) if optimise mode is chosen
+        worst case: O(n)
         n = team size
 
         Returns:
         The winning pokemon team.
         None
         '''
-        if battle_mode == BattleMode.SET:           #O(n*comp=)
-            temp_stack1 = ArrayStack(len(self.team))
-            temp_stack2 = ArrayStack(len(self.team))
-
-            half_length = len(self.team)// 2
-
-            for _ in range(half_length, len(self.team)):
-                temp_stack1.push(self.team.pop())
-
-            while not self.team.is_empty():
-                temp_stack2.push(self.team.pop())
-
-            self.team = temp_stack2.copy()
-
-            while not temp_stack1.is_empty():
-                self.team.push(temp_stack1.pop())
-
-        elif battle_mode == BattleMode.ROTATE:      #O(n*comp==)
-            q_length = len(self.team)
-            half_point = q_length // 2
-
-            first_half_size = half_point
-            second_half_size = q_length - half_point
-
-            first_half = ArrayR(first_half_size)
-            second_half = ArrayR(second_half_size)
-
-            for i in range(first_half_size):
-                first_half[i] = self.team.serve()
-
-            for i in range(second_half_size):
-                second_half[i] = self.team.serve()
+        if battle_mode == BattleMode.SET:           #O(n)
+            # the first half is the bottom of the stack
+            self.team.reverse_range(0, len(self.team) // 2)
 
-            for i in range(first_half_size):
-                self.team.append(first_half[i])
+        elif battle_mode == BattleMode.ROTATE:      #O(n)
+            # the second half is the back of the queue
+            self.team.reverse_range(len(self.team) // 2, len(self.team))
 
-            for i in range(second_half_size-1,-1,-1):
-                self.team.append(second_half[i])
-
-        elif battle_mode == BattleMode.OPTIMISE:    #O(n*log(n) * comp==)
+        elif battle_mode == BattleMode.OPTIMISE:    #O(1)
             self.descending = not self.descending
-            temp_list = ArraySortedList(self.TEAM_LIMIT, self.descending)
+            self.team.reverse()
 
-            for i in range(len(self.team)):
-                temp_list.add(self.team[i])
 
-            self.team = temp_list
+    def snapshot(self) -> 'PokeTeam':
+        '''
+        This function returns a copy of the team that keeps its members and their order
+        when the team changes afterwards, example before a battle to compare with the team after it.
+        The pokemon themselves are shared with the team, so a snapshot does not keep their health.
 
+        Time complexity:
+        best case: O(1) in SET mode, the stack is copied on write
+        worst case: O(n) the queue or sorted list is copied
+        n = team size
+
+        Returns:
+        A new PokeTeam.
+        '''
+        res = copy.copy(self)
+        if isinstance(self.team, ArrayR):
+            res.team = ArrayR(len(self.team))
+            res.team.copy_from(self.team)
+        else:
+            res.team = self.team.copy()
+        return res
 
     def __getitem__(self, index: int):
         """ Returns the object in position index.
@@ -362,8 +380,8 @@ class PokeTeam:
             for i in range(len(self.team.array)):
                 ret_str += "(" + str(self.team.array[i]) + "), \n"
         elif isinstance(self.team, ArraySortedList):
-            for i in range(len(self.team.array)):
-                ret_str += "(" + str(self.team.array[i]) + "), \n "
+            for i in range(len(self.team)):
+                ret_str += "(" + str(self.team[i]) + "), \n "
         elif isinstance(self.team, CircularQueue):
             for i in range(len(self.team.array)):
                 ret_str += "(" + str(self.team.array[i]) + "), \n"
@@ -384,16 +402,20 @@ class Trainer:
     def __init__(self, name) -> None:
         self.name = name
         self.team = PokeTeam()
-        self.pokedox = ArraySet()
+        self.pokedox = PokeTypeSet()
+        self.pokedex_completion = 0.0   # kept up to date by register_pokemon
+        self.pokedex_version = 0        # bumped by register_pokemon whenever the completion changes
 
 
-    def pick_team(self, method: str) -> None:
+    def pick_team(self, method: str, spec = None, rng: random.Random = None) -> None:
         '''
         This function selects the team to be selected either randomly or manually through a sting arguement.
         The method also registers the pokemon selected either randomly or manually.
 
         Arguments:
-        method: the method to be used to select the team. A string of the method either Manual or Random.
+        method: the method to be used to select the team. A string of the method either Manual, Random or Spec.
+        spec: the pokemon class names to pick when method is Spec.
+        rng: the random number generator used when method is Random. Defaults to the global random module.
 
         Time complexity:
         best case:
@@ -405,7 +427,9 @@ class Trainer:
         if method == "Manual":
             self.team.choose_manually()
         elif method == 'Random':
-            self.team.choose_randomly()
+            self.team.choose_randomly(rng)
+        elif method == 'Spec':
+            self.team.choose_from_spec(spec)
         else:
             raise ValueError("Unknown method")
         for j in range(len(self.team)):
@@ -438,24 +462,28 @@ class Trainer:
         '''
         return self.name
 
-    def register_pokemon(self, pokemon: Pokemon) -> None:
+    def register_pokemon(self, pokemon: Pokemon) -> bool:
         '''
         This function register pokemon within the assembled team through a for loop. It uses the add method within stack to prevent duplicates.
+        The pokedex completion is only recomputed when a new type is added.
 
         Arguments:
         pokemon: the pokemon to be registered within the team (object).
 
         Time complexity:
         best case: O(1)
-        worst case: O(n)
-        n = pokemon in pokemonclass.
+        worst case: O(1)
 
         Returns:
-        None
+        True if the pokemon's type was new to the pokedex, False otherwise.
         '''
         pokemon_type = pokemon.get_poketype()
-        if pokemon_type not in self.pokedox:
-            self.pokedox.add(pokemon_type)
+        if pokemon_type in self.pokedox:
+            return False
+        self.pokedox.add(pokemon_type)
+        self.pokedex_completion = round((len(self.pokedox)/len(PokeType)), 2)
+        self.pokedex_version += 1
+        return True
 
 
     def get_pokedex_completion(self) -> float:
@@ -469,10 +497,7 @@ class Trainer:
         Returns:
         rounded float value for Pokedex completion.
         '''
-        poke_types_stored = len(self.pokedox)
-        maximum_size_of_pokedex = len(PokeType)
-
-        return round((poke_types_stored/maximum_size_of_pokedex), 2 )
+        return self.pokedex_completion
 
     def __str__(self) -> str:
         '''
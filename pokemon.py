@@ -1,1016 +1,1182 @@
 from pokemon_base import *
-import inspect
 
 class Bulbasaur(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Bulbasaur", "Ivysaur", "Venusaur")
+
     def __init__(self):
         super().__init__()
         self.health = 45
         self.level = 1
         self.poketype = PokeType.GRASS
         self.battle_power = 14
-        self.evolution_line = ["Bulbasaur", "Ivysaur", "Venusaur"]
         self.name = "Bulbasaur"
         self.experience = 0
         self.defence = 20
         self.speed = 4.5
 
 class Charmander(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Charmander", "Charmeleon", "Charizard")
+
     def __init__(self):
         super().__init__()
         self.health = 39
         self.level = 1
         self.poketype = PokeType.FIRE
         self.battle_power = 22
-        self.evolution_line = ["Charmander", "Charmeleon", "Charizard"]
         self.name = "Charmander"
         self.experience = 0
         self.defence = 10
         self.speed = 65
 
 class Squirtle(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Squirtle", "Wartortle", "Blastoise")
+
     def __init__(self):
         super().__init__()
         self.health = 44
         self.level = 1
         self.poketype = PokeType.WATER
         self.battle_power = 10
-        self.evolution_line = ["Squirtle", "Wartortle", "Blastoise"]
         self.name = "Squirtle"
         self.experience = 0
         self.defence = 12
         self.speed = 43
 
 class Caterpie(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Caterpie", "Metapod", "Butterfree")
+
     def __init__(self):
         super().__init__()
         self.health = 20
         self.level = 1
         self.poketype = PokeType.BUG
         self.battle_power = 7
-        self.evolution_line = ["Caterpie", "Metapod", "Butterfree"]
         self.name = "Caterpie"
         self.experience = 0
         self.defence = 8
         self.speed = 30
 
 class Weedle(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Weedle", "Kakuna", "Beedrill")
+
     def __init__(self):
         super().__init__()
         self.health = 25
         self.level = 1
         self.poketype = PokeType.BUG
         self.battle_power = 9
-        self.evolution_line = ["Weedle", "Kakuna", "Beedrill"]
         self.name = "Weedle"
         self.experience = 0
         self.defence = 10
         self.speed = 50
 
 class Pidgey(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Pidgey", "Pidgeotto", "Pidgeot")
+
     def __init__(self):
         super().__init__()
         self.health = 40
         self.level = 1
         self.poketype = PokeType.FLYING
         self.battle_power = 21
-        self.evolution_line = ["Pidgey", "Pidgeotto", "Pidgeot"]
         self.name = "Pidgey"
         self.experience = 0
         self.defence = 8
         self.speed = 56
 
 class Rattata(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Rattata", "Raticate")
+
     def __init__(self):
         super().__init__()
         self.health = 30
         self.level = 1
         self.poketype = PokeType.NORMAL
         self.battle_power = 15
-        self.evolution_line = ["Rattata", "Raticate"]
         self.name = "Rattata"
         self.experience = 0
         self.defence = 5
         self.speed = 72
 
 class Spearow(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Spearow", "Fearow")
+
     def __init__(self):
         super().__init__()
         self.health = 40
         self.level = 1
         self.poketype = PokeType.FLYING
         self.battle_power = 19
-        self.evolution_line = ["Spearow", "Fearow"]
         self.name = "Spearow"
         self.experience = 0
         self.defence = 9
         self.speed = 70
 
 class Ekans(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Ekans", "Arbok")
+
     def __init__(self):
         super().__init__()
         self.health = 35
         self.level = 1
         self.poketype = PokeType.POISON
         self.battle_power = 15
-        self.evolution_line = ["Ekans", "Arbok"]
         self.name = "Ekans"
         self.experience = 0
         self.defence = 8
         self.speed = 55
 
 class Pikachu(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Pikachu", "Raichu")
+
     def __init__(self):
         super().__init__()
         self.health = 35
         self.level = 1
         self.poketype = PokeType.ELECTRIC
         self.battle_power = 30
-        self.evolution_line = ["Pikachu", "Raichu"]
         self.name = "Pikachu"
         self.experience = 0
         self.defence = 15
         self.speed = 90
 
 class Sandshrew(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Sandshrew", "Sandslash")
+
     def __init__(self):
         super().__init__()
         self.health = 50
         self.level = 1
         self.poketype = PokeType.GROUND
         self.battle_power = 30
-        self.evolution_line = ["Sandshrew", "Sandslash"]
         self.name = "Sandshrew"
         self.experience = 0
         self.defence = 20
         self.speed = 40
 
 class NidoranM(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Nidoran(M)", "Nidorino", "Nidoking")
+
     def __init__(self):
         super().__init__()
         self.health = 46
         self.level = 1
         self.poketype = PokeType.POISON
         self.battle_power = 23
-        self.evolution_line = ["Nidoran(M)", "Nidorino", "Nidoking"]
         self.name = "Nidoran(M)"
         self.experience = 0
         self.defence = 7
         self.speed = 41
 
 class NidoranF(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Nidoran(F)", "Nidorina", "Nidoqueen")
+
     def __init__(self):
         super().__init__()
         self.health = 55
         self.level = 1
         self.poketype = PokeType.POISON
         self.battle_power = 20
-        self.evolution_line = ["Nidoran(F)", "Nidorina", "Nidoqueen"]
         self.name = "Nidoran(F)"
         self.experience = 0
         self.defence = 12
         self.speed = 56
 
 class Clefairy(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Clefairy", "Clefable")
+
     def __init__(self):
         super().__init__()
         self.health = 70
         self.level = 1
         self.poketype = PokeType.NORMAL
         self.battle_power = 17
-        self.evolution_line = ["Clefairy", "Clefable"]
         self.name = "Clefairy"
         self.experience = 0
         self.defence = 15
         self.speed = 35
 
 class Vulpix(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Vulpix", "Ninetales")
+
     def __init__(self):
         super().__init__()
         self.health = 38
         self.level = 1
         self.poketype = PokeType.FIRE
         self.battle_power = 21
-        self.evolution_line = ["Vulpix", "Ninetales"]
         self.name = "Vulpix"
         self.experience = 0
         self.defence = 8
         self.speed = 65
 
 class Jigglypuff(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Jigglypuff", "Wigglytuff")
+
     def __init__(self):
         super().__init__()
         self.health = 67
         self.level = 1
         self.poketype = PokeType.NORMAL
         self.battle_power = 13
-        self.evolution_line = ["Jigglypuff", "Wigglytuff"]
         self.name = "Jigglypuff"
         self.experience = 0
         self.defence = 8
         self.speed = 20
 
 class Zubat(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Zubat", "Golbat")
+
     def __init__(self):
         super().__init__()
         self.health = 40
         self.level = 1
         self.poketype = PokeType.POISON
         self.battle_power = 20
-        self.evolution_line = ["Zubat", "Golbat"]
         self.name = "Zubat"
         self.experience = 0
         self.defence = 7
         self.speed = 80
 
 class Oddish(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Oddish", "Gloom", "Vileplume")
+
     def __init__(self):
         super().__init__()
         self.health = 45
         self.level = 1
         self.poketype = PokeType.GRASS
         self.battle_power = 18
-        self.evolution_line = ["Oddish", "Gloom", "Vileplume"]
         self.name = "Oddish"
         self.experience = 0
         self.defence = 7
         self.speed = 30
 
 class Paras(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Paras", "Parasect")
+
     def __init__(self):
         super().__init__()
         self.health = 35
         self.level = 1
         self.poketype = PokeType.BUG
         self.battle_power = 23
-        self.evolution_line = ["Paras", "Parasect"]
         self.name = "Paras"
         self.experience = 0
         self.defence = 10
         self.speed = 25
 
 class Venonat(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Venonat", "Venomoth")
+
     def __init__(self):
         super().__init__()
         self.health = 60
         self.level = 1
         self.poketype = PokeType.BUG
         self.battle_power = 30
-        self.evolution_line = ["Venonat", "Venomoth"]
         self.name = "Venonat"
         self.experience = 0
         self.defence = 15
         self.speed = 45
 
 class Diglett(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Diglett", "Dugtrio")
+
     def __init__(self):
         super().__init__()
         self.health = 10
         self.level = 1
         self.poketype = PokeType.GROUND
         self.battle_power = 29
-        self.evolution_line = ["Diglett", "Dugtrio"]
         self.name = "Diglett"
         self.experience = 0
         self.defence = 15
         self.speed = 95
 
 class Meowth(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Meowth", "Persian")
+
     def __init__(self):
         super().__init__()
         self.health = 40
         self.level = 1
         self.poketype = PokeType.NORMAL
         self.battle_power = 20
-        self.evolution_line = ["Meowth", "Persian"]
         self.name = "Meowth"
         self.experience = 0
         self.defence = 8
         self.speed = 90
 
 class Psyduck(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Psyduck", "Golduck")
+
     def __init__(self):
         super().__init__()
         self.health = 50
         self.level = 1
         self.poketype = PokeType.WATER
         self.battle_power = 20
-        self.evolution_line = ["Psyduck", "Golduck"]
         self.name = "Psyduck"
         self.experience = 0
         self.defence = 15
         self.speed = 55
 
 class Mankey(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Mankey", "Primeape")
+
     def __init__(self):
         super().__init__()
         self.health = 40
         self.level = 1
         self.poketype = PokeType.FIGHTING
         self.battle_power = 35
-        self.evolution_line = ["Mankey", "Primeape"]
         self.name = "Mankey"
         self.experience = 0
         self.defence = 20
         self.speed = 70
 
 class Growlithe(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Growlithe", "Arcanine")
+
     def __init__(self):
         super().__init__()
         self.health = 55
         self.level = 1
         self.poketype = PokeType.FIRE
         self.battle_power = 24
-        self.evolution_line = ["Growlithe", "Arcanine"]
         self.name = "Growlithe"
         self.experience = 0
         self.defence = 12
         self.speed = 60
 
 class Poliwag(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Poliwag", "Poliwhirl", "Poliwrath")
+
     def __init__(self):
         super().__init__()
         self.health = 40
         self.level = 1
         self.poketype = PokeType.WATER
         self.battle_power = 20
-        self.evolution_line = ["Poliwag", "Poliwhirl", "Poliwrath"]
         self.name = "Poliwag"
         self.experience = 0
         self.defence = 8
         self.speed = 90
 
 class Abra(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Abra", "Kadabra", "Alakazam")
+
     def __init__(self):
         super().__init__()
         self.health = 25
         self.level = 1
         self.poketype = PokeType.PSYCHIC
         self.battle_power = 10
-        self.evolution_line = ["Abra", "Kadabra", "Alakazam"]
         self.name = "Abra"
         self.experience = 0
         self.defence = 5
         self.speed = 90
 
 class Machop(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Machop", "Machoke", "Machamp")
+
     def __init__(self):
         super().__init__()
         self.health = 55
         self.level = 1
         self.poketype = PokeType.FIGHTING
         self.battle_power = 30
-        self.evolution_line = ["Machop", "Machoke", "Machamp"]
         self.name = "Machop"
         self.experience = 0
         self.defence = 26
         self.speed = 35
 
 class Bellsprout(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Bellsprout", "Weepinbell", "Victreebel")
+
     def __init__(self):
         super().__init__()
         self.health = 50
         self.level = 1
         self.poketype = PokeType.GRASS
         self.battle_power = 26
-        self.evolution_line = ["Bellsprout", "Weepinbell", "Victreebel"]
         self.name = "Bellsprout"
         self.experience = 0
         self.defence = 13
         self.speed = 40
 
 class Tentacool(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Tentacool", "Tentacruel")
+
     def __init__(self):
         super().__init__()
         self.health = 40
         self.level = 1
         self.poketype = PokeType.WATER
         self.battle_power = 25
-        self.evolution_line = ["Tentacool", "Tentacruel"]
         self.name = "Tentacool"
         self.experience = 0
         self.defence = 15
         self.speed = 70
 
 class Geodude(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Geodude", "Graveler", "Golem")
+
     def __init__(self):
         super().__init__()
         self.health = 40
         self.level = 1
         self.poketype = PokeType.ROCK
         self.battle_power = 7
-        self.evolution_line = ["Geodude", "Graveler", "Golem"]
         self.name = "Geodude"
         self.experience = 0
         self.defence = 35
         self.speed = 20
 
 class Ponyta(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Ponyta", "Rapidash")
+
     def __init__(self):
         super().__init__()
         self.health = 50
         self.level = 1
         self.poketype = PokeType.FIRE
         self.battle_power = 25
-        self.evolution_line = ["Ponyta", "Rapidash"]
         self.name = "Ponyta"
         self.experience = 0
         self.defence = 12
         self.speed = 90
 
 class Slowpoke(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Slowpoke", "Slowbro")
+
     def __init__(self):
         super().__init__()
         self.health = 66
         self.level = 1
         self.poketype = PokeType.WATER
         self.battle_power = 8
-        self.evolution_line = ["Slowpoke", "Slowbro"]
         self.name = "Slowpoke"
         self.experience = 0
         self.defence = 20
         self.speed = 15
 
 class Magnemite(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Magnemite", "Magneton")
+
     def __init__(self):
         super().__init__()
         self.health = 25
         self.level = 1
         self.poketype = PokeType.ELECTRIC
         self.battle_power = 20
-        self.evolution_line = ["Magnemite", "Magneton"]
         self.name = "Magnemite"
         self.experience = 0
         self.defence = 8
         self.speed = 45
 
 class Farfetchd(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Farfetchd",)
+
     def __init__(self):
         super().__init__()
         self.health = 52
         self.level = 1
         self.poketype = PokeType.NORMAL
         self.battle_power = 17
-        self.evolution_line = ["Farfetchd"]
         self.name = "Farfetchd"
         self.experience = 0
         self.defence = 12
         self.speed = 60
 
 class Doduo(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Doduo", "Dodrio")
+
     def __init__(self):
         super().__init__()
         self.health = 35
         self.level = 1
         self.poketype = PokeType.FLYING
         self.battle_power = 30
-        self.evolution_line = ["Doduo", "Dodrio"]
         self.name = "Doduo"
         self.experience = 0
         self.defence = 15
         self.speed = 75
 
 class Seel(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Seel", "Dewgong")
+
     def __init__(self):
         super().__init__()
         self.health = 65
         self.level = 1
         self.poketype = PokeType.ICE
         self.battle_power = 45
-        self.evolution_line = ["Seel", "Dewgong"]
         self.name = "Seel"
         self.experience = 0
         self.defence = 25
         self.speed = 65
 
 class Grimer(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Grimer", "Muk")
+
     def __init__(self):
         super().__init__()
         self.health = 80
         self.level = 1
         self.poketype = PokeType.POISON
         self.battle_power = 30
-        self.evolution_line = ["Grimer", "Muk"]
         self.name = "Grimer"
         self.experience = 0
         self.defence = 25
         self.speed = 25
 
 class Shellder(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Shellder", "Cloyster")
+
     def __init__(self):
         super().__init__()
         self.health = 30
         self.level = 1
         self.poketype = PokeType.WATER
         self.battle_power = 20
-        self.evolution_line = ["Shellder", "Cloyster"]
         self.name = "Shellder"
         self.experience = 0
         self.defence = 12
         self.speed = 40
 
 class Gastly(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Gastly", "Haunter", "Gengar")
+
     def __init__(self):
         super().__init__()
         self.health = 30
         self.level = 1
         self.poketype = PokeType.GHOST
         self.battle_power = 25
-        self.evolution_line = ["Gastly", "Haunter", "Gengar"]
         self.name = "Gastly"
         self.experience = 0
         self.defence = 10
         self.speed = 80
 
 class Onix(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Onix", "Steelix")
+
     def __init__(self):
         super().__init__()
         self.health = 35
         self.level = 1
         self.poketype = PokeType.ROCK
         self.battle_power = 45
-        self.evolution_line = ["Onix", "Steelix"]
         self.name = "Onix"
         self.experience = 0
         self.defence = 20
         self.speed = 30
 
 class Drowzee(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Drowzee", "Hypno")
+
     def __init__(self):
         super().__init__()
         self.health = 60
         self.level = 1
         self.poketype = PokeType.PSYCHIC
         self.battle_power = 25
-        self.evolution_line = ["Drowzee", "Hypno"]
         self.name = "Drowzee"
         self.experience = 0
         self.defence = 12
         self.speed = 42
 
 class Krabby(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Krabby", "Kingler")
+
     def __init__(self):
         super().__init__()
         self.health = 30
         self.level = 1
         self.poketype = PokeType.WATER
         self.battle_power = 22
-        self.evolution_line = ["Krabby", "Kingler"]
         self.name = "Krabby"
         self.experience = 0
         self.defence = 8
         self.speed = 50
 
 class Voltorb(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Voltorb", "Electrode")
+
     def __init__(self):
         super().__init__()
         self.health = 40
         self.level = 1
         self.poketype = PokeType.ELECTRIC
         self.battle_power = 30
-        self.evolution_line = ["Voltorb", "Electrode"]
         self.name = "Voltorb"
         self.experience = 0
         self.defence = 15
         self.speed = 100
 
 class Exeggcute(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Exeggcute", "Exeggutor")
+
     def __init__(self):
         super().__init__()
         self.health = 60
         self.level = 1
         self.poketype = PokeType.GRASS
         self.battle_power = 17
-        self.evolution_line = ["Exeggcute", "Exeggutor"]
         self.name = "Exeggcute"
         self.experience = 0
         self.defence = 7
         self.speed = 20
 
 class Cubone(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Cubone", "Marowak")
+
     def __init__(self):
         super().__init__()
         self.health = 50
         self.level = 1
         self.poketype = PokeType.GROUND
         self.battle_power = 18
-        self.evolution_line = ["Cubone", "Marowak"]
         self.name = "Cubone"
         self.experience = 0
         self.defence = 8
         self.speed = 35
 
 class Hitmonlee(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Hitmonlee",)
+
     def __init__(self):
         super().__init__()
         self.health = 50
         self.level = 1
         self.poketype = PokeType.FIGHTING
         self.battle_power = 25
-        self.evolution_line = ["Hitmonlee"]
         self.name = "Hitmonlee"
         self.experience = 0
         self.defence = 15
         self.speed = 87
 
 class Hitmonchan(Pokemon):
+    __slots__ = ()
+    evolution_line = ( "Hitmonchan",)
+
     def __init__(self):
         super().__init__()
         self.health = 50
         self.level = 1
         self.poketype = PokeType.FIGHTING
         self.battle_power = 30
-        self.evolution_line = [ "Hitmonchan"]
         self.name = "Hitmonchan"
         self.experience = 0
         self.defence = 20
         self.speed = 76
 
 class Lickitung(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Lickitung",)
+
     def __init__(self):
         super().__init__()
         self.health = 90
         self.level = 1
         self.poketype = PokeType.NORMAL
         self.battle_power = 55
-        self.evolution_line = ["Lickitung"]
         self.name = "Lickitung"
         self.experience = 0
         self.defence = 35
         self.speed = 30
 
 class Koffing(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Koffing", "Weezing")
+
     def __init__(self):
         super().__init__()
         self.health = 40
         self.level = 1
         self.poketype = PokeType.POISON
         self.battle_power = 35
-        self.evolution_line = ["Koffing", "Weezing"]
         self.name = "Koffing"
         self.experience = 0
         self.defence = 25
         self.speed = 35
 
 class Rhyhorn(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Rhyhorn", "Rhydon")
+
     def __init__(self):
         super().__init__()
         self.health = 80
         self.level = 1
         self.poketype = PokeType.GROUND
         self.battle_power = 45
-        self.evolution_line = ["Rhyhorn", "Rhydon"]
         self.name = "Rhyhorn"
         self.experience = 0
         self.defence = 50
         self.speed = 25
 
 class Chansey(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Chansey", "Blissey")
+
     def __init__(self):
         super().__init__()
         self.health = 150
         self.level = 1
         self.poketype = PokeType.NORMAL
         self.battle_power = 5
-        self.evolution_line = ["Chansey", "Blissey"]
         self.name = "Chansey"
         self.experience = 0
         self.defence = 5
         self.speed = 50
 
 class Tangela(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Tangela",)
+
     def __init__(self):
         super().__init__()
         self.health = 65
         self.level = 1
         self.poketype = PokeType.GRASS
         self.battle_power = 28
-        self.evolution_line = ["Tangela"]
         self.name = "Tangela"
         self.experience = 0
         self.defence = 24
         self.speed = 30
 
 class Kangaskhan(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Kangaskhan",)
+
     def __init__(self):
         super().__init__()
         self.health = 88
         self.level = 1
         self.poketype = PokeType.NORMAL
         self.battle_power = 32
-        self.evolution_line = ["Kangaskhan"]
         self.name = "Kangaskhan"
         self.experience = 0
         self.defence = 60
         self.speed = 70
 
 class Horsea(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Horsea", "Seadra")
+
     def __init__(self):
         super().__init__()
         self.health = 30
         self.level = 1
         self.poketype = PokeType.WATER
         self.battle_power = 10
-        self.evolution_line = ["Horsea", "Seadra"]
         self.name = "Horsea"
         self.experience = 0
         self.defence = 10
         self.speed = 60
 
 class Goldeen(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Goldeen", "Seaking")
+
     def __init__(self):
         super().__init__()
         self.health = 45
         self.level = 1
         self.poketype = PokeType.WATER
         self.battle_power = 11
-        self.evolution_line = ["Goldeen", "Seaking"]
         self.name = "Goldeen"
         self.experience = 0
         self.defence = 15
         self.speed = 65
 
 class Staryu(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Staryu", "Starmie")
+
     def __init__(self):
         super().__init__()
         self.health = 30
         self.level = 1
         self.poketype = PokeType.WATER
         self.battle_power = 10
-        self.evolution_line = ["Staryu", "Starmie"]
         self.name = "Staryu"
         self.experience = 0
         self.defence = 10
         self.speed = 85
 
 class MrMime(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Mr. Mime",)
+
     def __init__(self):
         super().__init__()
         self.health = 40
         self.level = 1
         self.poketype = PokeType.PSYCHIC
         self.battle_power = 10
-        self.evolution_line = ["Mr. Mime"]
         self.name = "Mr. Mime"
         self.experience = 0
         self.defence = 10
         self.speed = 30
 
 class Scyther(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Scyther",)
+
     def __init__(self):
         super().__init__()
         self.health = 70
         self.level = 1
         self.poketype = PokeType.BUG
         self.battle_power = 20
-        self.evolution_line = ["Scyther"]
         self.name = "Scyther"
         self.experience = 0
         self.defence = 15
         self.speed = 105
 
 class Jynx(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Jynx",)
+
     def __init__(self):
         super().__init__()
         self.health = 65
         self.level = 1
         self.poketype = PokeType.ICE
         self.battle_power = 20
-        self.evolution_line = ["Jynx"]
         self.name = "Jynx"
         self.experience = 0
         self.defence = 35
         self.speed = 95
 
 class Electabuzz(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Electabuzz",)
+
     def __init__(self):
         super().__init__()
         self.health = 65
         self.level = 1
         self.poketype = PokeType.ELECTRIC
         self.battle_power = 15
-        self.evolution_line = ["Electabuzz"]
         self.name = "Electabuzz"
         self.experience = 0
         self.defence = 12
         self.speed = 100
 
 class Magmar(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Magmar",)
+
     def __init__(self):
         super().__init__()
         self.health = 65
         self.level = 1
         self.poketype = PokeType.FIRE
         self.battle_power = 20
-        self.evolution_line = ["Magmar"]
         self.name = "Magmar"
         self.experience = 0
         self.defence = 10
         self.speed = 80
 
 class Pinsir(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Pinsir",)
+
     def __init__(self):
         super().__init__()
         self.health = 65
         self.level = 1
         self.poketype = PokeType.BUG
         self.battle_power = 20
-        self.evolution_line = ["Pinsir"]
         self.name = "Pinsir"
         self.experience = 0
         self.defence = 35
         self.speed = 85
 
 class Tauros(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Tauros",)
+
     def __init__(self):
         super().__init__()
         self.health = 75
         self.level = 1
         self.poketype = PokeType.NORMAL
         self.battle_power = 15
-        self.evolution_line = ["Tauros"]
         self.name = "Tauros"
         self.experience = 0
         self.defence = 10
         self.speed = 110
 
 class Magikarp(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Magikarp", "Gyarados")
+
     def __init__(self):
         super().__init__()
         self.health = 20
         self.level = 1
         self.poketype = PokeType.WATER
         self.battle_power = 5
-        self.evolution_line = ["Magikarp", "Gyarados"]
         self.name = "Magikarp"
         self.experience = 0
         self.defence = 10
         self.speed = 80
 
 class Lapras(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Lapras",)
+
     def __init__(self):
         super().__init__()
         self.health = 90
         self.level = 1
         self.poketype = PokeType.WATER
         self.battle_power = 12
-        self.evolution_line = ["Lapras"]
         self.name = "Lapras"
         self.experience = 0
         self.defence = 10
         self.speed = 60
 
 class Ditto(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Ditto",)
+
     def __init__(self):
         super().__init__()
         self.health = 48
         self.level = 1
         self.poketype = PokeType.NORMAL
         self.battle_power = 10
-        self.evolution_line = ["Ditto"]
         self.name = "Ditto"
         self.experience = 0
         self.defence = 48
         self.speed = 50
 
 class Eevee(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Eevee",)
+
     def __init__(self):
         super().__init__()
         self.health = 55
         self.level = 1
         self.poketype = PokeType.NORMAL
         self.battle_power = 10
-        self.evolution_line = ["Eevee"]
         self.name = "Eevee"
         self.experience = 0
         self.defence = 35
         self.speed = 55
 
 class Porygon(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Porygon",)
+
     def __init__(self):
         super().__init__()
         self.health = 65
         self.level = 1
         self.poketype = PokeType.NORMAL
         self.battle_power = 12
-        self.evolution_line = ["Porygon"]
         self.name = "Porygon"
         self.experience = 0
         self.defence = 7
         self.speed = 60
 
 class Omanyte(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Omanyte", "Omastar")
+
     def __init__(self):
         super().__init__()
         self.health = 35
         self.level = 1
         self.poketype = PokeType.WATER
         self.battle_power = 12
-        self.evolution_line = ["Omanyte", "Omastar"]
         self.name = "Omanyte"
         self.experience = 0
         self.defence = 20
         self.speed = 40
 
 class Kabuto(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Kabuto", "Kabutops")
+
     def __init__(self):
         super().__init__()
         self.health = 30
         self.level = 1
         self.poketype = PokeType.ROCK
         self.battle_power = 10
-        self.evolution_line = ["Kabuto", "Kabutops"]
         self.name = "Kabuto"
         self.experience = 0
         self.defence = 10
         self.speed = 55
 
 class Aerodactyl(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Aerodactyl",)
+
     def __init__(self):
         super().__init__()
         self.health = 80
         self.level = 1
         self.poketype = PokeType.ROCK
         self.battle_power = 25
-        self.evolution_line = ["Aerodactyl"]
         self.name = "Aerodactyl"
         self.experience = 0
         self.defence = 5
         self.speed = 130
 
 class Snorlax(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Munchlax", "Snorlax")
+
     def __init__(self):
         super().__init__()
         self.health = 85
         self.level = 1
         self.poketype = PokeType.NORMAL
         self.battle_power = 20
-        self.evolution_line = ["Munchlax", "Snorlax"]
         self.name = "Snorlax"
         self.experience = 0
         self.defence = 10
         self.speed = 30
 
 class Articuno(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Articuno",)
+
     def __init__(self):
         super().__init__()
         self.health = 90
         self.level = 1
         self.poketype = PokeType.ICE
         self.battle_power = 30
-        self.evolution_line = ["Articuno"]
         self.name = "Articuno"
         self.experience = 0
         self.defence = 20
         self.speed = 85
 
 class Zapdos(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Zapdos",)
+
     def __init__(self):
         super().__init__()
         self.health = 90
         self.level = 1
         self.poketype = PokeType.ELECTRIC
         self.battle_power = 30
-        self.evolution_line = ["Zapdos"]
         self.name = "Zapdos"
         self.experience = 0
         self.defence = 20
         self.speed = 100
 
 class Moltres(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Moltres",)
+
     def __init__(self):
         super().__init__()
         self.health = 90
         self.level = 1
         self.poketype = PokeType.FIRE
         self.battle_power = 25
-        self.evolution_line = ["Moltres"]
         self.name = "Moltres"
         self.experience = 0
         self.defence = 10
         self.speed = 90
 
 class Dratini(Pokemon):
+    __slots__ = ()
+    evolution_line = ("Dratini", "Dragonair", "Dragonite")
+
     def __init__(self):
         super().__init__()
         self.health = 41
         self.level = 1
         self.poketype = PokeType.DRAGON
         self.battle_power = 12
-        self.evolution_line = ["Dratini", "Dragonair", "Dragonite"]
         self.name = "Dratini"
         self.experience = 0
         self.defence = 10
         self.speed = 86
 
-#The Time complexity is O(n) where n is the number of classes in the module.
+# Every species above is registered, so the registry is frozen and its lookups are built once here.
+# SPECIES_BY_ID maps a species id to its class, SPECIES_BY_NAME maps the class name and every
+# name in the evolution line to the species class, so evolved names like "Graveler" resolve to Geodude.
+SPECIES_BY_ID, SPECIES_BY_NAME, _SPECIES_BY_CLASS_NAME = SpeciesRegistry.freeze()
+
+
+#The Time complexity is O(1).
 def get_all_pokemon_types() -> ArrayR[Pokemon]:
-    all_pokemon = ArrayR(77)
-    i = 0
-    for name, cls in inspect.getmembers(inspect.getmodule(inspect.currentframe()), inspect.isclass):
-        if cls != Pokemon and issubclass(cls, Pokemon):
-            all_pokemon[i] = cls
-            i += 1
-    return all_pokemon
+    """
+    Returns every species class, sorted by class name.
+    The array is built once and shared, so callers should not modify it.
+    """
+    return _SPECIES_BY_CLASS_NAME
+
+
+#The Time complexity is O(1).
+def find_species(name: str) -> type | None:
+    """
+    Returns the species class of a pokemon name, or None if no species has that name.
+    Class names, display names and evolved names are all accepted, example "Geodude" and "Graveler".
+    """
+    return SPECIES_BY_NAME.get(name)
 
 
 if __name__ == '__main__':
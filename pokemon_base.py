@@ -1,7 +1,10 @@
 """
 This module contains PokeType, TypeEffectiveness and an abstract version of the Pokemon Class
 """
+import csv
+import os
 from abc import ABC
+from array import array
 from enum import Enum
 from data_structures.referential_array import ArrayR
 from math import ceil
@@ -29,22 +32,44 @@ class PokeType(Enum):
 class TypeEffectiveness:
     """
     Represents the type effectiveness of one Pokemon type against another.
+
+    The multipliers are read once from type_effectiveness.csv into TABLE, a flat row-major
+    array indexed by attack_type.value * TYPE_COUNT + defend_type.value.
+    Row i of the csv holds the attacks of the i-th type of the header, which should list the
+    PokeType members in order.
     """
-    EFFECT_TABLE = ((0.5,0.5,2.0,0.5,0.5,1.0,1.0,1.0,1.0,2.0,2.0,1.0,1.0,1.0,0.5),#Fire     index 0
-                (2.0,0.5,0.5,1.0,0.5,1.0,1.0,1.0,1.0,2.0,1.0,1.0,1.0,1.0,2.0),#Water    index 1
-                (0.5,2.0,0.5,2.0,0.5,1.0,1.0,2.0,1.0,0.5,2.0,1.0,2.0,1.0,1.0),#Grass    index 2
-                (2.0,1.0,0.5,1.0,1.0,1.0,0.5,2.0,0.5,1.0,1.0,1.0,1.0,2.0,1.0),#Bug      index 3
-                (1.0,1.0,1.0,1.0,2.0,0.5,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0,1.0),#dragon   index 4
-                (1.0,2.0,0.5,1.0,0.5,0.5,1.0,2.0,1.0,0.0,1.0,1.0,1.0,1.0,1.0),#electric index 5
-                (1.0,1.0,1.0,0.5,1.0,1.0,1.0,0.5,0.0,1.0,2.0,2.0,0.5,2.0,0.5),#fighting index 6
-                (1.0,1.0,0.5,2.0,1.0,2.0,2.0,1.0,1.0,0.5,1.0,1.0,1.0,1.0,2.0),#flying   index 7
-                (1.0,1.0,1.0,1.0,1.0,1.0,0.0,1.0,2.0,1.0,1.0,0.5,1.0,0.5,1.0),#ghost    index 8
-                (0.5,2.0,0.5,1.0,1.0,2.0,1.0,0.0,1.0,2.0,1.0,1.0,0.5,1.0,2.0),#ground   index 9
-                (2.0,1.0,1.0,1.0,1.0,1.0,2.0,2.0,1.0,1.0,0.5,1.0,1.0,1.0,2.0),#ice      index 10
-                (1.0,1.0,1.0,1.0,1.0,1.0,2.0,1.0,0.0,1.0,1.0,1.0,1.0,1.0,1.0),#normal   index 11
-                (1.0,1.0,2.0,2.0,1.0,1.0,0.5,1.0,0.5,2.0,1.0,1.0,0.5,2.0,1.0),#poison   index 12
-                (1.0,1.0,1.0,1.0,1.0,1.0,2.0,1.0,1.0,1.0,1.0,2.0,2.0,0.5,1.0),#psychic  index 13
-                (0.5,2.0,1.0,1.0,1.0,1.0,0.5,0.5,1.0,2.0,2.0,1.0,1.0,1.0,2.0))#rock     index 14
+    CSV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "type_effectiveness.csv")
+    TYPE_COUNT = len(PokeType)
+    TABLE = None
+
+    @classmethod
+    def load(cls, path: str = None) -> None:
+        """
+        Compiles the effectiveness csv into TABLE.
+
+        Arguments:
+        path: the csv to read, CSV_PATH if None.
+
+        Time complexity:
+        best case: O(t^2) t = number of types
+        worst case: O(t^2)
+
+        Raises:
+        ValueError if the header doesn't list the PokeType members in order, or the table isn't t x t.
+        """
+        if path is None:
+            path = cls.CSV_PATH
+        with open(path, newline="") as csv_file:
+            rows = list(csv.reader(csv_file))
+        header = [name.strip().upper() for name in rows[0]]
+        if header != [poketype.name for poketype in PokeType]:
+            raise ValueError(f"{path} header should list the types in PokeType order")
+        if len(rows) - 1 != cls.TYPE_COUNT or any(len(row) != cls.TYPE_COUNT for row in rows[1:]):
+            raise ValueError(f"{path} should hold a {cls.TYPE_COUNT}x{cls.TYPE_COUNT} table")
+        table = array('d')
+        for row in rows[1:]:
+            table.extend(float(value) for value in row)
+        cls.TABLE = table
 
     @classmethod
     def get_effectiveness(cls, attack_type: PokeType, defend_type: PokeType) -> float:
@@ -58,20 +83,92 @@ class TypeEffectiveness:
         Returns:
             float: The effectiveness of the attack, as a float value between 0 and 4.
         """
-        #Planning for how to get the effectiveness of a Pokemon
-        
-        return cls.EFFECT_TABLE[attack_type.value][defend_type.value]
+        return cls.TABLE[attack_type.value * cls.TYPE_COUNT + defend_type.value]
 
     def __len__(self) -> int:
         """
         Returns the number of types of Pokemon
         """
-        return len(self.EFFECT_TABLE)
+        return self.TYPE_COUNT
+
+
+TypeEffectiveness.load()
+
+
+class SpeciesRegistry:
+    """
+    Registry of every Pokemon species class.
+
+    Species join the registry when their class is defined (see Pokemon.__init_subclass__), and
+    a species' id is its registration order, so ids stay stable as long as new species are
+    defined after the existing ones. The registry is frozen once every species is defined,
+    after that the lookups are built and no more species can join. Classes defined later, or
+    with abstract methods, are not species and are left out.
+    """
+    _species = []
+    frozen = False
+
+    @classmethod
+    def register(cls, species: type) -> int:
+        """
+        Adds a species class to the registry and returns its species id.
+
+        Raises:
+        RuntimeError if the registry is already frozen.
+        """
+        if cls.frozen:
+            raise RuntimeError(f"Species registry is frozen, {species.__name__} can't be registered")
+        cls._species.append(species)
+        return len(cls._species) - 1
+
+    @classmethod
+    def freeze(cls) -> tuple[ArrayR, dict, ArrayR]:
+        """
+        Freezes the registry and builds its lookups.
+
+        Time complexity:
+        best case: O(n log n) n = number of species
+        worst case: O(n log n)
+
+        Returns:
+        (species by id, species by name, species sorted by class name).
+        Every name in a species' evolution line maps to the species, as well as its class name.
+        """
+        cls.frozen = True
+        by_id = ArrayR.from_iterable(cls._species)
+        by_name = {}
+        for species in cls._species:
+            by_name[species.__name__] = species
+            for name in species.evolution_line:
+                by_name[name] = species
+        by_class_name = ArrayR.from_iterable(sorted(cls._species, key=lambda species: species.__name__))
+        return by_id, by_name, by_class_name
+
 
 class Pokemon(ABC): # pylint: disable=too-few-public-methods, too-many-instance-attributes
     """
     Represents a base Pokemon class with properties and methods common to all Pokemon.
     """
+    # Instances only hold their own state. Species classes declare an empty __slots__ too,
+    # so no instance carries a __dict__, and the evolution line is one tuple per species.
+    __slots__ = ("health", "level", "poketype", "battle_power", "name", "experience", "defence", "speed")
+    SPECIES_ID = None   # registration order of the species, also its row in species_table.SPECIES_TABLE
+    evolution_line = ()
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Registers every species class as it is defined and gives it its species id.
+        Abstract classes and classes defined once the registry is frozen, example in tests,
+        are not registered: they keep the species id of their parent, None under Pokemon.
+        """
+        super().__init_subclass__(**kwargs)
+        if SpeciesRegistry.frozen:
+            return
+        # ABCMeta only sets __abstractmethods__ after this runs, so look for abstract methods directly
+        if any(getattr(getattr(cls, name, None), "__isabstractmethod__", False) for name in dir(cls)):
+            return
+        cls.SPECIES_ID = SpeciesRegistry.register(cls)
+
     def __init__(self):
         """
         Initializes a new instance of the Pokemon class.
@@ -80,7 +177,6 @@ class Pokemon(ABC): # pylint: disable=too-few-public-methods, too-many-instance-
         self.level = None
         self.poketype = None
         self.battle_power = None
-        self.evolution_line = None
         self.name = None
         self.experience = None
         self.defence = None
@@ -151,13 +247,22 @@ class Pokemon(ABC): # pylint: disable=too-few-public-methods, too-many-instance-
 
     def get_evolution(self):
         """
-        Returns the evolution line of the Pokemon.
+        Returns the evolution line of the Pokemon, shared by every Pokemon of its species.
 
         Returns:
-            list: The evolution of the Pokemon.
+            tuple: The evolution of the Pokemon.
         """
         return self.evolution_line
 
+    def get_species_id(self) -> int:
+        """
+        Returns the species id of the Pokemon, its row in the species table.
+
+        Returns:
+            int: The species id of the Pokemon.
+        """
+        return self.SPECIES_ID
+
     def get_battle_power(self) -> int:
         """
         Returns the battle power of the Pokemon.
@@ -194,8 +299,7 @@ class Pokemon(ABC): # pylint: disable=too-few-public-methods, too-many-instance-
         else:
             damage = ceil(attack / 4)
         
-        yoMama = TypeEffectiveness()
-        effectiveness = yoMama.get_effectiveness(attack_type, defend_type)
+        effectiveness = TypeEffectiveness.get_effectiveness(attack_type, defend_type)
         damage_dealt = effectiveness * damage
         return damage_dealt
 
@@ -0,0 +1,89 @@
+"""
+This module runs many independent battles between two team specs and aggregates the outcomes.
+
+A team spec is a compact, picklable description of a team: either a tuple of pokemon class
+names, example ("Pikachu", "Zapdos"), or None for a random team. Specs are what get sent to
+worker processes, the Trainer and PokeTeam objects are only built inside the workers.
+"""
+from __future__ import annotations
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Tuple
+from battle import Battle, derive_seed
+from battle_mode import BattleMode
+from poke_team import Trainer
+
+TeamSpec = Tuple[str, ...] | None
+
+
+def _simulate_range(team_a_spec: TeamSpec, team_b_spec: TeamSpec, battle_mode: BattleMode, start: int, stop: int, seed: int) -> Tuple[int, int, int]:
+    '''
+    Runs the battles with indices start to stop - 1. Battle i draws from its own generator
+    seeded with derive_seed(seed, i), so a battle's outcome does not depend on which worker
+    ran it or on how the range was sharded.
+
+    Returns:
+    (wins, draws, losses) from the point of view of team A.
+    '''
+    wins = draws = losses = 0
+    for battle_index in range(start, stop):
+        trainer_a = Trainer("Team A")
+        trainer_b = Trainer("Team B")
+        battle = Battle(trainer_a, trainer_b, battle_mode, seed=derive_seed(seed, battle_index))
+        battle.create_team(trainer_a, team_a_spec)
+        battle.create_team(trainer_b, team_b_spec)
+        winner = battle.run().winner
+        if winner is None:
+            draws += 1
+        elif winner is trainer_a:
+            wins += 1
+        else:
+            losses += 1
+    return wins, draws, losses
+
+
+def simulate_many(team_a_spec: TeamSpec, team_b_spec: TeamSpec, mode: BattleMode, n: int, workers: int = None, seed: int = 20) -> Tuple[int, int, int]:
+    '''
+    Runs n independent battles between team A and team B across a process pool.
+
+    Arguments:
+    team_a_spec: tuple of pokemon class names for team A, or None for a random team.
+    team_b_spec: tuple of pokemon class names for team B, or None for a random team.
+    mode: the battle mode to fight in.
+    n: number of battles.
+    workers: number of worker processes, defaults to the number of CPUs. 1 runs in this process.
+    seed: base seed, battle i is seeded with derive_seed(seed, i).
+
+    Time complexity:
+    best case:  O(n * b / workers)
+    worst case: O(n * b / workers)
+    b = cost of a single battle
+
+    Returns:
+    (wins, draws, losses) from the point of view of team A.
+    '''
+    if n < 0:
+        raise ValueError("Number of battles should not be negative")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, n))
+    if workers == 1:
+        return _simulate_range(team_a_spec, team_b_spec, mode, 0, n, seed)
+
+    # a few chunks per worker keeps the pool busy when battle lengths vary
+    chunks = workers * 4
+    bounds = [n * i // chunks for i in range(chunks + 1)]
+    wins = draws = losses = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_simulate_range, team_a_spec, team_b_spec, mode, bounds[i], bounds[i + 1], seed)
+                   for i in range(chunks) if bounds[i] < bounds[i + 1]]
+        for future in futures:
+            chunk_wins, chunk_draws, chunk_losses = future.result()
+            wins += chunk_wins
+            draws += chunk_draws
+            losses += chunk_losses
+    return wins, draws, losses
+
+
+if __name__ == '__main__':
+    print(simulate_many(("Pikachu", "Zapdos", "Charmander"), None, BattleMode.ROTATE, 1000))
@@ -0,0 +1,78 @@
+"""
+This module contains SpeciesTable, a columnar store of the base stats of every Pokemon species.
+
+Each species' row is its SPECIES_ID, the order it joined the species registry. The stats live in parallel
+typed arrays (one per stat) rather than in per-species objects, so code that needs stats for many
+species, example the damage matrix or a whole-roster comparison, reads contiguous arrays instead of
+instantiating pokemon.
+"""
+from array import array
+from pokemon import SPECIES_BY_ID
+from pokemon_base import Pokemon
+from data_structures.referential_array import ArrayR
+
+
+class SpeciesTable:
+    """
+    Parallel arrays of species base stats, indexed by species id.
+
+    Attributes:
+        species (ArrayR): the species class of every row.
+        health (array): base health at the species' starting stage, whole numbers like the species classes.
+        battle_power, defence, speed (array): base stats at the species' starting stage.
+        poketype (array): PokeType value of every species.
+        stage (array): index of the species' starting name in its evolution line.
+        stages (array): length of the species' evolution line.
+    """
+    def __init__(self, species: ArrayR) -> None:
+        """
+        Builds the columns by instantiating every species once. species[i] should be the species with id i.
+
+        Time complexity:
+        best case: O(n) n = number of species
+        worst case: O(n)
+        """
+        self.species = species
+        self.health = array('i')
+        self.battle_power = array('d')
+        self.defence = array('d')
+        self.speed = array('d')
+        self.poketype = array('b')
+        self.stage = array('b')
+        self.stages = array('b')
+        for species_id in range(len(species)):
+            pokemon = species[species_id]()
+            self.health.append(pokemon.get_health())
+            self.battle_power.append(pokemon.get_battle_power())
+            self.defence.append(pokemon.get_defence())
+            self.speed.append(pokemon.get_speed())
+            self.poketype.append(pokemon.get_poketype().value)
+            self.stage.append(pokemon.get_evolution().index(pokemon.get_name()))
+            self.stages.append(len(pokemon.get_evolution()))
+
+    def __len__(self) -> int:
+        """ Returns the number of species. """
+        return len(self.species)
+
+    def row(self, pokemon: Pokemon) -> int:
+        """
+        Returns the row of a pokemon's species.
+
+        Time complexity:
+        best case: O(1)
+        worst case: O(1)
+        """
+        return pokemon.SPECIES_ID
+
+    def base_health(self, pokemon: Pokemon) -> int:
+        """
+        Returns the base health of a pokemon's species.
+
+        Time complexity:
+        best case: O(1)
+        worst case: O(1)
+        """
+        return self.health[pokemon.SPECIES_ID]
+
+
+SPECIES_TABLE = SpeciesTable(SPECIES_BY_ID)
@@ -1,8 +1,13 @@
 import unittest
 from ed_utils.decorators import number, visibility
 from unittest.mock import patch
-from pokemon_base import TypeEffectiveness, PokeType
+from pokemon_base import TypeEffectiveness, PokeType, Pokemon, SpeciesRegistry
 import io
+import os
+import tempfile
+from pokemon import get_all_pokemon_types, SPECIES_BY_ID, Charmander, Squirtle
+from damage_matrix import DamageMatrix
+from species_table import SPECIES_TABLE
 
 class TestTypeEffectiveness(unittest.TestCase):
     @number("1.1")
@@ -18,5 +23,93 @@ class TestTypeEffectiveness(unittest.TestCase):
     def test_len(self):
         self.assertEqual(len(TypeEffectiveness()), 15)
 
+    @number("1.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_load_csv(self):
+        self.assertEqual(len(TypeEffectiveness.TABLE), 15 * 15)
+        self.assertEqual(TypeEffectiveness.get_effectiveness(PokeType.ELECTRIC, PokeType.GROUND), 0.0)
+        self.assertEqual(TypeEffectiveness.get_effectiveness(PokeType.GHOST, PokeType.GHOST), 2.0)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bad.csv")
+            with open(path, "w") as csv_file:
+                csv_file.write("Water,Fire\n1.0,1.0\n")
+            with self.assertRaises(ValueError):
+                TypeEffectiveness.load(path)
+
+class TestDamageMatrix(unittest.TestCase):
+    @number("1.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_matches_attack(self):
+        all_pokemon = get_all_pokemon_types()
+        for i in range(len(all_pokemon)):
+            attacker = all_pokemon[i]()
+            defender = Squirtle()
+            self.assertEqual(DamageMatrix.damage(attacker, defender), attacker.attack(defender))
+            self.assertEqual(DamageMatrix.damage(defender, attacker), defender.attack(attacker))
+
+    @number("1.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_evolved_forms(self):
+        attacker = Charmander()
+        defender = Squirtle()
+        attacker.level_up()
+        attacker.level_up()
+        defender.level_up()
+        self.assertEqual(attacker.get_name(), "Charizard")
+        self.assertEqual(DamageMatrix.damage(attacker, defender), attacker.attack(defender))
+        self.assertEqual(DamageMatrix.damage(defender, attacker), defender.attack(attacker))
+        attacker.battle_power = 500
+        self.assertEqual(DamageMatrix.form_of(attacker), -1, "A pokemon with changed stats is not a form of the table")
+        self.assertEqual(DamageMatrix.damage(attacker, defender), attacker.attack(defender))
+
+
+class TestSpeciesTable(unittest.TestCase):
+    @number("1.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_columns_match_species(self):
+        all_pokemon = get_all_pokemon_types()
+        self.assertEqual(len(SPECIES_TABLE), len(all_pokemon))
+        for i in range(len(all_pokemon)):
+            pokemon = all_pokemon[i]()
+            row = SPECIES_TABLE.row(pokemon)
+            self.assertIs(SPECIES_TABLE.species[row], all_pokemon[i])
+            self.assertEqual(SPECIES_TABLE.health[row], pokemon.get_health())
+            self.assertEqual(SPECIES_TABLE.battle_power[row], pokemon.get_battle_power())
+            self.assertEqual(SPECIES_TABLE.defence[row], pokemon.get_defence())
+            self.assertEqual(SPECIES_TABLE.speed[row], pokemon.get_speed())
+            self.assertEqual(SPECIES_TABLE.poketype[row], pokemon.get_poketype().value)
+
+
+class TestPokemonLayout(unittest.TestCase):
+    @number("1.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_slots(self):
+        all_pokemon = get_all_pokemon_types()
+        for i in range(len(all_pokemon)):
+            pokemon = all_pokemon[i]()
+            self.assertFalse(hasattr(pokemon, "__dict__"), f"{pokemon.get_name()} should not carry a __dict__")
+            self.assertIs(pokemon.get_evolution(), all_pokemon[i]().get_evolution(), "The evolution line should be shared per species")
+
+    @number("1.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_registry(self):
+        all_pokemon = get_all_pokemon_types()
+        self.assertIs(get_all_pokemon_types(), all_pokemon, "The species list should be built once")
+        self.assertEqual(len(all_pokemon), 77)
+        self.assertEqual(all_pokemon[0].__name__, "Abra")
+        self.assertIs(SPECIES_BY_ID[Charmander.SPECIES_ID], Charmander)
+        self.assertLess(Charmander.SPECIES_ID, Squirtle.SPECIES_ID, "Species ids follow definition order")
+        class Agumon(Pokemon):
+            __slots__ = ()
+
+        class ShinyCharmander(Charmander):
+            __slots__ = ()
+
+        self.assertIsNone(Agumon.SPECIES_ID, "Classes defined after the registry is frozen are not species")
+        self.assertEqual(ShinyCharmander.SPECIES_ID, Charmander.SPECIES_ID)
+        self.assertEqual(len(get_all_pokemon_types()), 77)
+        self.assertRaises(RuntimeError, SpeciesRegistry.register, Agumon)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
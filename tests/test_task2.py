@@ -45,6 +45,35 @@ class TestPokeTeam(unittest.TestCase):
         poketeam.choose_randomly()
         self.assertIsNotNone(poketeam[0], " Poketeam's __getitem__ not working correctly")
 
+    @number("2.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_find_pokemon_class(self):
+        poketeam = PokeTeam()
+        self.assertIs(poketeam.find_pokemon_class("Geodude"), Geodude)
+        self.assertIs(poketeam.find_pokemon_class("Graveler"), Geodude, "Evolved names should resolve to the base class")
+        self.assertIs(poketeam.find_pokemon_class("Mr. Mime"), MrMime)
+        self.assertIsNone(poketeam.find_pokemon_class("Agumon"))
+        for species_id in range(len(SPECIES_BY_ID)):
+            self.assertEqual(SPECIES_BY_ID[species_id].SPECIES_ID, species_id)
+
+    @number("2.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_regenerate_optimise(self):
+        poketeam = PokeTeam()
+        poketeam.choose_from_spec(("Geodude", "Pikachu", "Squirtle"))
+        poketeam.team[0].level_up()
+        poketeam.assemble_team(battle_mode=BattleMode.OPTIMISE)
+        poketeam.assign_team("defence")
+        team = poketeam.team
+        for j in range(len(team)):
+            team[j].value.defend(30)
+        poketeam.regenerate_team(battle_mode=BattleMode.OPTIMISE, criterion="health")
+        self.assertIs(poketeam.team, team, "Regenerate should reset the team in place")
+        self.assertEqual([str(team[j].value) for j in range(len(team))],
+                         ["Pikachu (Level 1) with 35 health and 0 experience",
+                          "Graveler (Level 2) with 40 health and 0 experience",
+                          "Squirtle (Level 1) with 44 health and 0 experience"])
+
 class TestTrainer(unittest.TestCase):
     @number("2.4")
     @visibility(visibility.VISIBILITY_SHOW)
@@ -87,6 +116,102 @@ class TestTrainer(unittest.TestCase):
 
         self.assertEqual(str(trainer), expected_str, "Trainer Str method is not set up correctly")
 
+    @number("2.10")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_register_pokemon(self):
+        trainer = Trainer('Ash')
+        self.assertEqual(trainer.get_pokedex_completion(), 0.0)
+        self.assertTrue(trainer.register_pokemon(Pikachu()))
+        self.assertFalse(trainer.register_pokemon(Zapdos()), "Zapdos' type is already registered")
+        self.assertTrue(trainer.register_pokemon(Squirtle()))
+        self.assertEqual(trainer.get_pokedex_completion(), 0.13)
+
+    @number("2.11")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_poketype_set(self):
+        ash, gary = Trainer('Ash'), Trainer('Gary')
+        for pokemon in (Pikachu(), Squirtle(), Charmander()):
+            ash.register_pokemon(pokemon)
+        for pokemon in (Squirtle(), Bulbasaur()):
+            gary.register_pokemon(pokemon)
+        self.assertIn(PokeType.ELECTRIC, ash.pokedox)
+        self.assertNotIn(PokeType.GRASS, ash.pokedox)
+        self.assertEqual(len(ash.pokedox.union(gary.pokedox)), 4)
+        self.assertEqual(list(ash.pokedox.intersection(gary.pokedox)), [PokeType.WATER])
+        self.assertEqual(list(ash.pokedox.difference(gary.pokedox)), [PokeType.FIRE, PokeType.ELECTRIC])
+        with self.assertRaises(TypeError):
+            ash.pokedox.add(3)
+
+    @number("2.12")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_snapshot(self):
+        poketeam = PokeTeam()
+        poketeam.choose_from_spec(["Pikachu", "Squirtle", "Charmander"])
+        poketeam.assemble_team(BattleMode.SET)
+        snapshot = poketeam.snapshot()
+        self.assertIs(snapshot.team.array, poketeam.team.array, "A stack snapshot should not copy until the team changes")
+        poketeam.team.pop()
+        poketeam.team.push(Bulbasaur())
+        self.assertEqual([type(snapshot.team[i]).__name__ for i in range(len(snapshot.team))], ["Pikachu", "Squirtle", "Charmander"])
+
+        snapshot = poketeam.snapshot()
+        snapshot.team.pop()
+        snapshot.team.push(Meowth())
+        snapshot.special(BattleMode.SET)
+        self.assertEqual([type(poketeam.team[i]).__name__ for i in range(len(poketeam.team))], ["Pikachu", "Squirtle", "Bulbasaur"],
+                         "Writing to a snapshot should leave the team unchanged")
+        array = poketeam.team.array
+        poketeam.team.pop()
+        poketeam.team.push(Pidgey())
+        self.assertIs(poketeam.team.array, array, "The team should not copy an array the snapshot no longer uses")
+
+        poketeam = PokeTeam()
+        poketeam.choose_from_spec(["Pikachu", "Squirtle", "Bulbasaur"])
+        poketeam.assemble_team(BattleMode.OPTIMISE)
+        snapshot = poketeam.snapshot()
+        poketeam.regenerate_team(BattleMode.OPTIMISE, criterion="speed")
+        self.assertEqual([snapshot.team[i].key for i in range(len(snapshot.team))],
+                         sorted(pokemon.get_health() for pokemon in (Pikachu(), Squirtle(), Bulbasaur())))
+
+    @number("2.13")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_optimise_special_reverses_order(self):
+        poketeam = PokeTeam()
+        poketeam.choose_from_spec(["Pikachu", "Squirtle", "Charmander", "Bulbasaur", "Meowth", "Pidgey"])
+        poketeam.assemble_team(BattleMode.OPTIMISE)
+        poketeam.assign_team("level")   # every pokemon is level 1, so every key ties
+        names = lambda: [type(poketeam.team[i].value).__name__ for i in range(len(poketeam.team))]
+        self.assertEqual(names(), ["Bulbasaur", "Charmander", "Pikachu", "Meowth", "Squirtle", "Pidgey"])
+        team = poketeam.team
+        poketeam.special(BattleMode.OPTIMISE)
+        self.assertIs(poketeam.team, team, "special should flip the team in place")
+        self.assertTrue(poketeam.team.descending)
+        self.assertEqual(names(), ["Pidgey", "Squirtle", "Meowth", "Pikachu", "Charmander", "Bulbasaur"],
+                         "special should reverse the whole team, ties included")
+        poketeam.special(BattleMode.OPTIMISE)
+        self.assertEqual(names(), ["Bulbasaur", "Charmander", "Pikachu", "Meowth", "Squirtle", "Pidgey"])
+
+    @number("2.14")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_optimise_regenerate_keeps_tie_order(self):
+        poketeam = PokeTeam()
+        poketeam.choose_from_spec(["Magmar", "Seel", "Pikachu", "Squirtle", "Charmander", "Bulbasaur"])
+        poketeam.assemble_team(BattleMode.OPTIMISE)
+        poketeam.assign_team("health")   # Magmar and Seel both have 65 health
+        poketeam.team[0].value.health = 5
+        poketeam.team[3].value.health = 1
+        poketeam.regenerate_team(BattleMode.OPTIMISE, "health")
+        team = [(type(poketeam.team[i].value).__name__, poketeam.team[i].value.get_health()) for i in range(len(poketeam.team))]
+        self.assertEqual(team, [("Pikachu", 35), ("Charmander", 39), ("Squirtle", 44), ("Bulbasaur", 45),
+                                ("Magmar", 65), ("Seel", 65)],
+                         "regenerate should place ties as assembling the team again does")
+        poketeam.assign_team("level")   # every pokemon is level 1, so every key ties
+        poketeam.team[1].value.health = 2
+        poketeam.regenerate_team(BattleMode.OPTIMISE, "level")
+        team = [(type(poketeam.team[i].value).__name__, poketeam.team[i].value.get_health()) for i in range(len(poketeam.team))]
+        self.assertEqual(team, [("Seel", 65), ("Charmander", 39), ("Pikachu", 35), ("Bulbasaur", 45),
+                                ("Magmar", 65), ("Squirtle", 44)])
+
 
 if __name__ == '__main__':
     unittest.main()
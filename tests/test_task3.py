@@ -2,10 +2,13 @@ import unittest
 from ed_utils.decorators import number, visibility
 from unittest.mock import patch
 import random
+from math import ceil
 from poke_team import *
 from pokemon import *
 from battle import *
+from simulation import simulate_many
 from typing import Tuple
+from io import StringIO
 
 
 class TestBattle(unittest.TestCase):
@@ -137,5 +140,207 @@ class TestBattle(unittest.TestCase):
         self.assertEqual(len(self.trainer2.get_team()), 0, f"{self.trainer2.get_name()} should have no Pokemon left in their team")
 
 
+    @number("3.11")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_headless_battle_is_silent(self):
+        with patch('sys.stdout', new_callable=StringIO) as stdout:
+            self.__test_rotate_battle()
+        self.assertEqual(stdout.getvalue(), "", "A battle without an observer should not print anything")
+
+    @number("3.12")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_battle_result(self):
+        battle = self.__create_teams(BattleMode.ROTATE)
+        result = battle.run()
+        self.assertEqual(result.winner.get_name(), self.trainer2.get_name())
+        self.assertGreater(result.rounds, 0)
+        self.assertEqual(result.survivors, (0, 4))
+        self.assertGreater(result.damage_dealt[0], 0)
+        self.assertGreater(result.damage_dealt[1], 0)
+        self.assertIs(battle.result, result)
+
+    @number("3.18")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_optimise_battle_result(self):
+        for team_1, team_2, winner, survivors in ((("Zapdos", "Articuno"), ("Caterpie",), 'Gary', (2, 0)),
+                                                  (("Caterpie",), ("Zapdos", "Articuno"), 'Ash', (0, 2))):
+            trainer1, trainer2 = Trainer('Gary'), Trainer('Ash')
+            battle = Battle(trainer1, trainer2, BattleMode.OPTIMISE)
+            trainer1.pick_team("Spec", team_1)
+            trainer2.pick_team("Spec", team_2)
+            trainer1.get_team().assemble_team(BattleMode.OPTIMISE)
+            trainer2.get_team().assemble_team(BattleMode.OPTIMISE)
+            result = battle.run()
+            self.assertIsNotNone(result.winner, "An optimise battle with a survivor is not a draw")
+            self.assertEqual(result.winner.get_name(), winner)
+            self.assertEqual(result.survivors, survivors, "The winning pokemon should be put back in its team once")
+
+    @number("3.13")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_simulate_many(self):
+        serial = simulate_many(None, ("Pikachu", "Zapdos"), BattleMode.ROTATE, 20, workers=1)
+        pooled = simulate_many(None, ("Pikachu", "Zapdos"), BattleMode.ROTATE, 20, workers=2)
+        self.assertEqual(sum(serial), 20, "Every battle should be counted once")
+        self.assertEqual(serial, pooled, "Results should not depend on the number of workers")
+
+        wins, draws, losses = simulate_many(None, None, BattleMode.OPTIMISE, 40, workers=1)
+        self.assertEqual(wins + draws + losses, 40, "Every battle should be counted once")
+        self.assertGreater(wins, 0, "Team A should be able to win an optimise battle")
+        self.assertGreater(losses, 0)
+
+        battle = Battle(Trainer("Team A"), Trainer("Team B"), BattleMode.OPTIMISE, criterion="speed")
+        battle.create_team(battle.trainer_1, ("Pikachu", "Geodude", "Charmander"))
+        team = battle.trainer_1.get_team().team
+        self.assertEqual([team[i].key for i in range(len(team))], sorted(team[i].value.get_speed() for i in range(len(team))),
+                         "Optimise teams should be ordered by the battle's criterion")
+
+    @number("3.14")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_battle_rng_is_independent(self):
+        state = random.getstate()
+        battle = Battle(self.trainer1, self.trainer2, BattleMode.ROTATE, seed=7)
+        battle._create_teams()
+        self.assertEqual(random.getstate(), state, "Battles should not touch the global random state")
+
+        other_1, other_2 = Trainer('Gary'), Trainer('Ash')
+        random.seed(123)
+        other = Battle(other_1, other_2, BattleMode.ROTATE, seed=7)
+        other._create_teams()
+        self.assertEqual(str(self.trainer1.get_team()), str(other_1.get_team()), "The same seed should pick the same teams")
+        self.assertEqual(str(self.trainer2.get_team()), str(other_2.get_team()), "The same seed should pick the same teams")
+
+    @number("3.15")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_fast_forward_matches_round_by_round(self):
+        for battle_mode in BattleMode:
+            outcomes = []
+            for fast_forward in (True, False):
+                trainer1, trainer2 = Trainer('Gary'), Trainer('Ash')
+                battle = Battle(trainer1, trainer2, battle_mode)
+                trainer1.pick_team("Spec", ("Gastly",))
+                trainer2.pick_team("Spec", ("Hitmonchan",))
+                trainer1.get_team().assemble_team(battle_mode)
+                trainer2.get_team().assemble_team(battle_mode)
+                if fast_forward:
+                    result = battle.run()
+                else:
+                    with patch.object(Battle, '_fast_forward_duel', return_value=0):
+                        result = battle.run()
+                outcomes.append((result.rounds, result.survivors, result.damage_dealt, str(trainer2.get_team()[0])))
+            self.assertGreater(outcomes[0][0], 1, "This duel should last several rounds")
+            self.assertEqual(outcomes[0], outcomes[1], f"Fast forwarding changed the outcome in {battle_mode}")
+
+    @number("3.16")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_matchup_grid_matches_perform_battle(self):
+        from matchups import evaluate_matchups, roster_forms
+        species_ids, levels = roster_forms()
+        self.assertEqual(len(species_ids), 148)
+        grid = evaluate_matchups(species_ids, levels, species_ids, levels)
+        self.trainer1.register_pokemon(Charmander())
+        self.trainer2.register_pokemon(Charmander())
+        battle = Battle(self.trainer1, self.trainer2, BattleMode.SET)
+
+        def create(form):
+            pokemon = SPECIES_BY_ID[int(species_ids[form])]()
+            for _ in range(int(levels[form]) - 1):
+                pokemon.level_up()
+            return pokemon
+
+        for i in range(len(species_ids)):
+            for j in range(len(species_ids)):
+                pokemon1, pokemon2 = create(i), create(j)
+                battle.perform_battle(pokemon1, pokemon2)
+                self.assertEqual((grid.health_1[i, j], grid.health_2[i, j]), (pokemon1.get_health(), pokemon2.get_health()))
+                expected_winner = 1 if pokemon1.is_alive() and not pokemon2.is_alive() else \
+                    2 if pokemon2.is_alive() and not pokemon1.is_alive() else 0
+                self.assertEqual(grid.winner[i, j], expected_winner)
+
+    @number("3.17")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_multipliers_follow_direct_registration(self):
+        self.trainer1.register_pokemon(Charmander())
+        self.trainer2.register_pokemon(Charmander())
+        battle = Battle(self.trainer1, self.trainer2, BattleMode.SET)
+        battle.perform_battle(Charmander(), Bulbasaur())
+        # registering outside the battle changes the completions the damage is scaled by
+        for pokemon in (Bulbasaur(), Squirtle(), Pikachu(), Pidgey()):
+            self.trainer1.register_pokemon(pokemon)
+
+        def exchange(battle):
+            pokemon1, pokemon2 = Charmander(), Bulbasaur()
+            battle.perform_battle(pokemon1, pokemon2)
+            return pokemon1.get_health(), pokemon2.get_health()
+
+        expected = exchange(Battle(self.trainer1, self.trainer2, BattleMode.SET))
+        self.assertEqual(exchange(battle), expected, "Damage should use the current pokedex completions")
+
+        # a battle reused with another trainer uses that trainer's completion
+        battle.trainer_2 = Trainer("Misty")
+        battle.trainer_2.register_pokemon(Squirtle())
+        battle.trainer_2.register_pokemon(Pikachu())
+        self.assertEqual(exchange(battle), exchange(Battle(self.trainer1, battle.trainer_2, BattleMode.SET)))
+
+
+    @number("3.19")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_damage_follows_modified_stats(self):
+        self.trainer1.register_pokemon(Charmander())
+        self.trainer2.register_pokemon(Bulbasaur())
+        battle = Battle(self.trainer1, self.trainer2, BattleMode.SET)
+        strong, target = Charmander(), Bulbasaur()
+        strong.battle_power = 500
+        expected = Bulbasaur()
+        battle.perform_battle(strong, target)
+        expected.defend(ceil(strong.attack(expected) * battle.multiplier_1))
+        self.assertEqual(target.get_health(), expected.get_health(), "Damage should use the attacker's own battle power")
+
+        attacker, weak = Charmander(), Bulbasaur()
+        weak.defence = 0
+        battle.perform_battle(attacker, weak)
+        self.assertEqual(battle.last_damage_dealt[0], ceil(attacker.attack(weak) * battle.multiplier_1),
+                         "Damage should use the defender's own defence")
+
+
+    @number("3.20")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_battle_with_late_subclasses(self):
+        # defined after the species registry is frozen, so neither is a registered species
+        class ShinyCharmander(Charmander):
+            __slots__ = ()
+
+            def __init__(self):
+                super().__init__()
+                self.battle_power = 500
+
+        class Agumon(Pokemon):
+            __slots__ = ()
+            evolution_line = ("Agumon", "Greymon")
+
+            def __init__(self):
+                super().__init__()
+                self.health = 60
+                self.level = 1
+                self.poketype = PokeType.FIRE
+                self.battle_power = 30
+                self.name = "Agumon"
+                self.experience = 0
+                self.defence = 15
+                self.speed = 40
+
+        self.assertIsNone(Agumon.SPECIES_ID)
+        trainer1, trainer2 = Trainer('Gary'), Trainer('Ash')
+        battle = Battle(trainer1, trainer2, BattleMode.ROTATE)
+        trainer1.pick_team("Spec", ("Pikachu", "Pikachu"))
+        trainer2.pick_team("Spec", ("Bulbasaur", "Squirtle", "Bulbasaur"))
+        trainer1.get_team().team[0] = ShinyCharmander()
+        trainer1.get_team().team[1] = Agumon()
+        trainer1.get_team().assemble_team(BattleMode.ROTATE)
+        trainer2.get_team().assemble_team(BattleMode.ROTATE)
+        result = battle.run()
+        self.assertEqual(result.winner.get_name(), 'Gary', "A 500 battle power Charmander should sweep the team")
+        self.assertEqual(result.survivors[1], 0)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file